@@ -1,65 +1,158 @@
-# This file was created automatically by SWIG.
-# Don't modify this file, modify the SWIG interface instead.
-# This file is compatible with both classic and new-style classes.
+# This file was automatically generated by SWIG (http://www.swig.org).
+# Version 3.0.12
+#
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
+
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '_Csequence')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('_Csequence')
+    _Csequence = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
+    def swig_import_helper():
+        from os.path import dirname
+        import imp
+        fp = None
+        try:
+            fp, pathname, description = imp.find_module('_Csequence', [dirname(__file__)])
+        except ImportError:
+            import _Csequence
+            return _Csequence
+        try:
+            _mod = imp.load_module('_Csequence', fp, pathname, description)
+        finally:
+            if fp is not None:
+                fp.close()
+        return _mod
+    _Csequence = swig_import_helper()
+    del swig_import_helper
+else:
+    import _Csequence
+del _swig_python_version_info
+
+try:
+    _swig_property = property
+except NameError:
+    pass  # Python < 2.2 doesn't have 'property'.
 
-import _Csequence
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
 
-def _swig_setattr(self,class_type,name,value):
+def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
+    if (name == "thisown"):
+        return self.this.own(value)
     if (name == "this"):
-        if isinstance(value, class_type):
-            self.__dict__[name] = value.this
-            if hasattr(value,"thisown"): self.__dict__["thisown"] = value.thisown
-            del value.thisown
+        if type(value).__name__ == 'SwigPyObject':
+            self.__dict__[name] = value
             return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    self.__dict__[name] = value
+    method = class_type.__swig_setmethods__.get(name, None)
+    if method:
+        return method(self, value)
+    if (not static):
+        if _newclass:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
+    else:
+        raise AttributeError("You cannot add attributes to %s" % self)
 
-def _swig_getattr(self,class_type,name):
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError,name
 
-import types
+def _swig_setattr(self, class_type, name, value):
+    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+
+
+def _swig_getattr(self, class_type, name):
+    if (name == "thisown"):
+        return self.this.own()
+    method = class_type.__swig_getmethods__.get(name, None)
+    if method:
+        return method(self)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
 try:
-    _object = types.ObjectType
+    _object = object
     _newclass = 1
-except AttributeError:
-    class _object : pass
+except __builtin__.Exception:
+    class _object:
+        pass
     _newclass = 0
-del types
-
 
 class Csequence(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, Csequence, name, value)
     __swig_getmethods__ = {}
     __getattr__ = lambda self, name: _swig_getattr(self, Csequence, name)
-    def __repr__(self):
-        return "<C Csequence instance at %s>" % (self.this,)
-    def __del__(self, destroy=_Csequence.delete_Csequence):
+    __repr__ = _swig_repr
+
+    def __init__(self, arg2=0):
+        this = _Csequence.new_Csequence(arg2)
         try:
-            if self.thisown: destroy(self)
-        except: pass
-    def __init__(self, *args):
-        _swig_setattr(self, Csequence, 'this', _Csequence.new_Csequence(*args))
-        _swig_setattr(self, Csequence, 'thisown', 1)
-    def genere(*args): return _Csequence.Csequence_genere(*args)
-    def vtaille(*args): return _Csequence.Csequence_vtaille(*args)
-    def termine(*args): return _Csequence.Csequence_termine(*args)
-    def melange(*args): return _Csequence.Csequence_melange(*args)
-    def copie(*args): return _Csequence.Csequence_copie(*args)
-    def __len__(*args): return _Csequence.Csequence___len__(*args)
-    def __getitem__(*args): return _Csequence.Csequence___getitem__(*args)
-    def __setitem__(*args): return _Csequence.Csequence___setitem__(*args)
-    def __str__(*args): return _Csequence.Csequence___str__(*args)
-    def read_nf(*args): return _Csequence.Csequence_read_nf(*args)
-
-class CsequencePtr(Csequence):
-    def __init__(self, this):
-        _swig_setattr(self, Csequence, 'this', this)
-        if not hasattr(self,"thisown"): _swig_setattr(self, Csequence, 'thisown', 0)
-        _swig_setattr(self, Csequence,self.__class__,Csequence)
-_Csequence.Csequence_swigregister(CsequencePtr)
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+    __swig_destroy__ = _Csequence.delete_Csequence
+    __del__ = lambda self: None
+
+    def genere(self, arg2):
+        return _Csequence.Csequence_genere(self, arg2)
+
+    def vtaille(self):
+        return _Csequence.Csequence_vtaille(self)
+
+    def termine(self, i):
+        return _Csequence.Csequence_termine(self, i)
+
+    def melange(self, i, graine=-1):
+        return _Csequence.Csequence_melange(self, i, graine)
+
+    def copie(self, G):
+        return _Csequence.Csequence_copie(self, G)
+
+    def __len__(self):
+        return _Csequence.Csequence___len__(self)
+
+    def __getitem__(self, i):
+        return _Csequence.Csequence___getitem__(self, i)
+
+    def __setitem__(self, i, c):
+        return _Csequence.Csequence___setitem__(self, i, c)
+
+    def __str__(self):
+        return _Csequence.Csequence___str__(self)
+
+    def read_nf(self, s):
+        return _Csequence.Csequence_read_nf(self, s)
+
+    def evolve(self, regles, max, D, segments, graine=-1):
+        return _Csequence.Csequence_evolve(self, regles, max, D, segments, graine)
+Csequence_swigregister = _Csequence.Csequence_swigregister
+Csequence_swigregister(Csequence)
+
+
+def compte_mots(s, m, lg, alph, f, tab, debut=1, fin=1):
+
+    # la fonction est cherchee dans _Csequence a l'appel
+
+
+    return _Csequence.compte_mots(s, m, lg, alph, f, tab, debut, fin)
+# This file is compatible with both classic and new-style classes.
 
 
@@ -1,63 +1,142 @@
-# This file was created automatically by SWIG.
-# Don't modify this file, modify the SWIG interface instead.
-# This file is compatible with both classic and new-style classes.
+# This file was automatically generated by SWIG (http://www.swig.org).
+# Version 3.0.12
+#
+# Do not make changes to this file unless you know what you are doing--modify
+# the SWIG interface file instead.
 
-import _Fsequence
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '_Fsequence')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('_Fsequence')
+    _Fsequence = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
+    def swig_import_helper():
+        from os.path import dirname
+        import imp
+        fp = None
+        try:
+            fp, pathname, description = imp.find_module('_Fsequence', [dirname(__file__)])
+        except ImportError:
+            import _Fsequence
+            return _Fsequence
+        try:
+            _mod = imp.load_module('_Fsequence', fp, pathname, description)
+        finally:
+            if fp is not None:
+                fp.close()
+        return _mod
+    _Fsequence = swig_import_helper()
+    del swig_import_helper
+else:
+    import _Fsequence
+del _swig_python_version_info
 
-def _swig_setattr(self,class_type,name,value):
+try:
+    _swig_property = property
+except NameError:
+    pass  # Python < 2.2 doesn't have 'property'.
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
+    if (name == "thisown"):
+        return self.this.own(value)
     if (name == "this"):
-        if isinstance(value, class_type):
-            self.__dict__[name] = value.this
-            if hasattr(value,"thisown"): self.__dict__["thisown"] = value.thisown
-            del value.thisown
+        if type(value).__name__ == 'SwigPyObject':
+            self.__dict__[name] = value
             return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    self.__dict__[name] = value
+    method = class_type.__swig_setmethods__.get(name, None)
+    if method:
+        return method(self, value)
+    if (not static):
+        if _newclass:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
+    else:
+        raise AttributeError("You cannot add attributes to %s" % self)
+
+
+def _swig_setattr(self, class_type, name, value):
+    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+
+
+def _swig_getattr(self, class_type, name):
+    if (name == "thisown"):
+        return self.this.own()
+    method = class_type.__swig_getmethods__.get(name, None)
+    if method:
+        return method(self)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+
 
-def _swig_getattr(self,class_type,name):
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError,name
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
-import types
 try:
-    _object = types.ObjectType
+    _object = object
     _newclass = 1
-except AttributeError:
-    class _object : pass
+except __builtin__.Exception:
+    class _object:
+        pass
     _newclass = 0
-del types
-
 
 class Fsequence(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, Fsequence, name, value)
     __swig_getmethods__ = {}
     __getattr__ = lambda self, name: _swig_getattr(self, Fsequence, name)
-    def __repr__(self):
-        return "<C Fsequence instance at %s>" % (self.this,)
-    def __init__(self, *args):
-        _swig_setattr(self, Fsequence, 'this', _Fsequence.new_Fsequence(*args))
-        _swig_setattr(self, Fsequence, 'thisown', 1)
-    def __del__(self, destroy=_Fsequence.delete_Fsequence):
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        this = _Fsequence.new_Fsequence()
         try:
-            if self.thisown: destroy(self)
-        except: pass
-    def melange(*args): return _Fsequence.Fsequence_melange(*args)
-    def termine(*args): return _Fsequence.Fsequence_termine(*args)
-    def vtaille(*args): return _Fsequence.Fsequence_vtaille(*args)
-    def __getitem__(*args): return _Fsequence.Fsequence___getitem__(*args)
-    def __setitem__(*args): return _Fsequence.Fsequence___setitem__(*args)
-    def __str__(*args): return _Fsequence.Fsequence___str__(*args)
-    def __len__(*args): return _Fsequence.Fsequence___len__(*args)
-    def recup_rel(*args): return _Fsequence.Fsequence_recup_rel(*args)
-
-class FsequencePtr(Fsequence):
-    def __init__(self, this):
-        _swig_setattr(self, Fsequence, 'this', this)
-        if not hasattr(self,"thisown"): _swig_setattr(self, Fsequence, 'thisown', 0)
-        _swig_setattr(self, Fsequence,self.__class__,Fsequence)
-_Fsequence.Fsequence_swigregister(FsequencePtr)
+            self.this.append(this)
+        except __builtin__.Exception:
+            self.this = this
+    __swig_destroy__ = _Fsequence.delete_Fsequence
+    __del__ = lambda self: None
+
+    def termine(self, arg2):
+        return _Fsequence.Fsequence_termine(self, arg2)
+
+    def vtaille(self):
+        return _Fsequence.Fsequence_vtaille(self)
+
+    def melange(self, i, graine=-1):
+        return _Fsequence.Fsequence_melange(self, i, graine)
+
+    def __getitem__(self, i):
+        return _Fsequence.Fsequence___getitem__(self, i)
+
+    def __setitem__(self, i, c):
+        return _Fsequence.Fsequence___setitem__(self, i, c)
+
+    def __str__(self):
+        return _Fsequence.Fsequence___str__(self)
+
+    def __len__(self):
+        return _Fsequence.Fsequence___len__(self)
+
+    def recup_rel(self, *args):
+        return _Fsequence.Fsequence_recup_rel(self, *args)
+Fsequence_swigregister = _Fsequence.Fsequence_swigregister
+Fsequence_swigregister(Fsequence)
+
+# This file is compatible with both classic and new-style classes.
 
 
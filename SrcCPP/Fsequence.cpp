@@ -97,6 +97,24 @@ void Fsequence::melange(int nb)
   } 
 }
 
+void Fsequence::melange(int nb, unsigned long graine)
+{
+  MTRand alea((MTRand::uint32)graine);
+  int l=taille();
+
+  int i;
+  int pos1, pos2;
+  Cdescripteur d;
+  
+  for (i=0;i<nb;i++){
+    pos1=alea.randInt(l-1);
+    pos2=alea.randInt(l-1);
+    d=_deb[pos1];
+    _deb[pos1]=_deb[pos2];
+    _deb[pos2]=d;
+  } 
+}
+
 ///////////////////////
 //// sorties
 ///////////////////////
@@ -76,6 +76,9 @@ public:
   // pratique i permutations aleatoires
   void melange(int i);
 
+  // idem, avec un generateur initialise par la graine
+  void melange(int i, unsigned long);
+
   ////////////////////
   // sorties
   ////////////////////
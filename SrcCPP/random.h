@@ -24,6 +24,9 @@
 
 #include "MersenneTwister.h"
 
+// generateur global, quand aucune graine n'est donnee
+extern MTRand mtrand1;
+
 // inline void Randomize(){
 //   mtrand1();
 // }
@@ -19,8 +19,10 @@
 #include "sequence.h"
 
 #include <iostream>
+#include <algorithm>
 #include <ctype.h>
 #include <stdlib.h>
+#include <math.h>
 
 using namespace std;
 
@@ -90,6 +92,74 @@ void Csequence::operator=(const Fsequence& G)
     *(_deb+i)=*(G.deb()+i);
   }
 
+/////////////////////////////////////////////////////
+/// evolution
+
+long Csequence::evolue(const vector<Cregle>& R, double max,
+                       double D, const vector<int>& seg, MTRand& alea,
+                       long& nprop)
+{
+  nprop=0;
+  int l=taille();
+  if ((l==0) || (max<=0))
+    return 0;
+
+  // regles par lettre
+  vector<int> parlettre[256];
+  int i, k;
+  for (i=0;i<(int)R.size();i++)
+    parlettre[(unsigned char)R[i].lettre].push_back(i);
+
+  // longueurs cumulees des segments
+  int ns=seg.size()/2;
+  vector<int> cumul(ns+1,0);
+  for (i=0;i<ns;i++)
+    cumul[i+1]=cumul[i]+seg[2*i+1]-seg[2*i];
+  int lt=(ns)?cumul[ns]:l;
+  if (lt<=0)
+    return 0;
+
+  long nsub=0;
+  // chaque position est tiree apres son temps d'attente
+  double s=-log(1-alea.randExc())/max, r;
+  int pos, lg, ld, j;
+  char c;
+  while (s<D){
+    pos=alea.randInt(lt-1);
+    if (ns){
+      j=upper_bound(cumul.begin(),cumul.end(),pos)-cumul.begin()-1;
+      pos+=seg[2*j]-cumul[j];
+    }
+
+    c=_deb[pos].dsc();
+    const vector<int>& a=parlettre[(unsigned char)c];
+    r=alea.randExc()*max;
+    for (k=0;k<(int)a.size();k++){
+      const Cregle& g=R[a[k]];
+      if (r<g.taux){
+        lg=g.gauche.length();
+        ld=g.droite.length();
+        if ((pos>=lg) && (pos+ld<l) && (g.cible!=c)){
+          for (j=0;(j<lg) && (_deb[pos-lg+j].dsc()==g.gauche[j]);j++);
+          if (j==lg){
+            for (j=0;(j<ld) && (_deb[pos+1+j].dsc()==g.droite[j]);j++);
+            if (j==ld){
+              _deb[pos].g_dsc(g.cible);
+              nsub++;
+            }
+          }
+        }
+        break;
+      }
+      r-=g.taux;
+    }
+
+    nprop++;
+    s-=log(1-alea.randExc())/max;
+  }
+  return nsub;
+}
+
 ////////////////////////////////////////////
 // recuperations de fichiers
 ////////////////////////////////////////////
@@ -292,4 +362,71 @@ int Csequence::recup_fst(ifstream& flot, int deb)
 
   return (pos==fin)?-1:pos;
 }
-		
+
+/////////////////////////////////////////////////////
+/// comptage de mots
+
+long compte_mots(const char* s, long n, long m, int lg, const char* alph,
+                 double f, double* tab, int debut, int fin)
+{
+  int code[256];
+  int i, k;
+  long j, d, nb=0, c, p5=1, l, lm;
+
+  for (i=0;i<256;i++)
+    code[i]=-1;
+  for (i=0;i<4;i++)
+    code[(unsigned char)alph[i]]=i;
+  for (k=1;k<lg;k++)
+    p5*=5;
+  if (m>n)
+    m=n;
+
+  j=0;
+  while (j<n){
+    while (j<n && code[(unsigned char)s[j]]<0)
+      j++;
+    d=j;
+    if (d>=m)
+      break;
+    while (j<n && code[(unsigned char)s[j]]>=0)
+      j++;
+
+    // mot de debut
+    if ((d>0 || debut) && j-d>=lg-1){
+      c=4;
+      for (k=0;k<lg-1;k++)
+        c=c*5+code[(unsigned char)s[d+k]];
+      tab[c]+=f;
+      nb++;
+    }
+
+    // mots pleins
+    lm=(j-lg+1<m)?j-lg+1:m;
+    if (lm>d){
+      c=0;
+      for (k=0;k<lg-1;k++)
+        c=c*5+code[(unsigned char)s[d+k]];
+      for (l=d;l<lm;l++){
+        c=c*5+code[(unsigned char)s[l+lg-1]];
+        tab[c]+=f;
+        c%=p5;
+      }
+      nb+=lm-d;
+    }
+
+    // mots de fin
+    if (j<n || fin)
+      for (l=(lm>d)?lm:d;l<j && l<m;l++){
+        c=0;
+        for (long p=l;p<j;p++)
+          c=c*5+code[(unsigned char)s[p]];
+        for (k=j-l;k<lg;k++)
+          c=c*5+4;
+        tab[c]+=f;
+        nb++;
+      }
+  }
+
+  return nb;
+}
@@ -23,12 +23,42 @@
 #include <fstream> 
 #include <string>
 #include <sstream>
+#include <vector>
 
 #include "Fsequence.h"
+#include "random.h"
 
 
 using namespace std;
 
+// substitution d'un Model :
+//  lettre -> cible quand gauche est avant et droite apres, au taux taux
+
+struct Cregle
+{
+  string gauche;
+  char lettre;
+  string droite;
+  char cible;
+  double taux;
+};
+
+// comptage des mots de longueur lg de la chaine s de taille n, sur
+// l'alphabet des 4 lettres de alph, les autres caracteres coupant la
+// chaine en troncons. Chaque mot est code en base 5 (la i-eme
+// lettre de alph vaut i, '^' vaut 4, la premiere lettre est de poids
+// fort) et f est ajoute a tab[code]. Par troncon : le mot '^'+debut
+// si le troncon a au moins lg-1 lettres, les mots pleins et les mots
+// de fin completes par des '^'.
+// Seuls les mots commencant avant la position m sont comptes. Si
+// debut est faux, le troncon en position 0 continue une chaine
+// precedente (pas de mot '^'+debut) ; si fin est faux, le troncon
+// qui finit en n continue plus loin (pas de mots de fin).
+// retourne le nombre de mots comptes
+
+long compte_mots(const char*, long, long, int, const char*, double, double*,
+                 int, int);
+
 class Csequence : public Fsequence
 {
 public:
@@ -58,6 +88,19 @@ public:
   void operator=(const Fsequence&);
 
   void egale(const Fsequence&);
+
+  //////////////////////
+  // evolution
+
+  // algorithme de Berard : tirages de positions jusqu'a un temps
+  // cumule de D, avec le max des taux par lettre en parametre,
+  // sur les segments [deb,fin[ (vide pour toute la sequence)
+  // avec le generateur en parametre
+  // retourne le nombre de substitutions effectuees, et met le
+  // nombre de positions tirees dans le dernier parametre
+
+  long evolue(const vector<Cregle>&, double, double, const vector<int>&,
+              MTRand&, long&);
  
   Csequence(int = 0);
   Csequence(void*);
@@ -0,0 +1,225 @@
+// Copyright 2004 Laurent GUEGUEN
+
+// This file is part of Sarment.
+
+// Sarment is free software; you can redistribute it and/or modify
+// it under the terms of the GNU General Public License as published by
+// the Free Software Foundation; either version 2 of the License, or
+// (at your option) any later version.
+
+// Sarment is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+
+// You should have received a copy of the GNU General Public License
+// along with Sarment; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+%module Csequence
+
+%{
+#include "sequence.h"
+#include <exception>
+#include <sstream>
+%}
+
+%exception __getitem__ {
+  try {
+    $action
+  }
+  catch (std::exception &e) {
+    PyErr_SetString(PyExc_IndexError, "Bad index");
+    return NULL;
+  }
+}
+
+%typemap(out) char* __str__ {
+  $result=PyString_FromString($1);
+  free($1);
+}
+
+class Csequence
+{
+public:
+  Csequence(int = 0);
+  ~Csequence();
+
+  void genere(int);
+};
+
+%extend Csequence {
+  int vtaille(){
+    return self->vtaille();
+  }
+
+  void termine(int i){
+    self->termine(i);
+  }
+
+  // avec une graine positive, le melange est reproductible
+  void melange(int i, long graine=-1){
+    if (graine<0)
+      ((Fsequence*)self)->melange(i);
+    else
+      ((Fsequence*)self)->melange(i,(unsigned long)graine);
+  }
+
+  void copie(const Csequence& G){
+    self->egale(G);
+  }
+
+  int __len__(){
+    return self->taille();
+  }
+
+  char __getitem__(int i){
+    if ((i<-self->taille()) || (i>=self->taille()))
+      throw std::exception();
+    return self->operator[](i).dsc();
+  }
+
+  void __setitem__(int i, char c){
+    self->operator[](i).g_dsc(c);
+  }
+
+  char* __str__(){
+    std::ostringstream out;
+    self->operator<<(out);
+    string st=out.str();
+    char* tmp=(char*)malloc(sizeof(char)*(st.length()+1));
+    strcpy(tmp,st.c_str());
+    return tmp;
+  }
+
+  int read_nf(char* s){
+    self->nettoie();
+    string st(s);
+    int l=st.length();
+    if (st.rfind(".seq")==l-4){
+      if (!self->recup_seq(st))
+        return 0;
+    }
+    else
+      if ((st.rfind(".fst")==l-4)
+          || (st.rfind(".fa")==l-3)){
+        if (!self->recup_fst(st))
+          return 0;
+      }
+      else{
+        cout << "Bad format" << endl;
+        return 0;
+      }
+    return self->taille();
+  }
+
+  // algorithme de Berard (voir Csequence::evolue) : regles est une
+  // sequence de (gauche, lettre, droite, cible, taux), segments une
+  // sequence de (debut, fin) ; le generateur est initialise par la
+  // graine si elle est positive.
+  // retourne (nombre de substitutions, nombre de positions tirees)
+
+  PyObject* evolve(PyObject* regles, double max, double D,
+                   PyObject* segments, long graine=-1){
+    vector<Cregle> R;
+    vector<int> seg;
+    int i, n;
+    PyObject *o;
+    if (!PySequence_Check(regles) || !PySequence_Check(segments)){
+      PyErr_SetString(PyExc_TypeError, "Sequences of rules and segments expected");
+      return NULL;
+    }
+    n=PySequence_Size(regles);
+    for (i=0;i<n;i++){
+      o=PySequence_GetItem(regles,i);
+      Cregle g;
+      char *ga, *le, *dr, *ci;
+      if (!o || !PyArg_Parse(o,(char *)"(ssssd)",&ga,&le,&dr,&ci,&g.taux)){
+        Py_XDECREF(o);
+        return NULL;
+      }
+      g.gauche=ga;
+      g.lettre=le[0];
+      g.droite=dr;
+      g.cible=ci[0];
+      R.push_back(g);
+      Py_DECREF(o);
+    }
+    n=PySequence_Size(segments);
+    for (i=0;i<n;i++){
+      int d, f;
+      o=PySequence_GetItem(segments,i);
+      if (!o || !PyArg_Parse(o,(char *)"(ii)",&d,&f)){
+        Py_XDECREF(o);
+        return NULL;
+      }
+      if (d<0)
+        d=0;
+      if (f>self->taille())
+        f=self->taille();
+      if (d<f){
+        seg.push_back(d);
+        seg.push_back(f);
+      }
+      Py_DECREF(o);
+    }
+    if (n && seg.empty())
+      return Py_BuildValue((char *)"(ll)",0L,0L);
+    long res, nprop;
+    if (graine<0){
+      Py_BEGIN_ALLOW_THREADS
+      res=self->evolue(R,max,D,seg,mtrand1,nprop);
+      Py_END_ALLOW_THREADS
+    }
+    else{
+      MTRand alea((MTRand::uint32)graine);
+      Py_BEGIN_ALLOW_THREADS
+      res=self->evolue(R,max,D,seg,alea,nprop);
+      Py_END_ALLOW_THREADS
+    }
+    return Py_BuildValue((char *)"(ll)",res,nprop);
+  }
+}
+
+// comptage des mots (voir compte_mots) de la chaine s dans tab, un
+// objet avec un buffer en ecriture de 5**lg doubles (un array 'd')
+
+%{
+PyObject* compte_mots_tab(PyObject* s, long m, int lg, char* alph,
+                          double f, PyObject* tab, int debut=1, int fin=1)
+{
+  char *c;
+  Py_ssize_t n, lbuf;
+  void *buf;
+  long i, taille=1, res;
+  if (PyString_AsStringAndSize(s,&c,&n)==-1)
+    return NULL;
+  if (lg<1 || strlen(alph)!=4){
+    PyErr_SetString(PyExc_ValueError, "Positive length and 4 letters expected");
+    return NULL;
+  }
+  for (i=0;i<lg;i++)
+    taille*=5;
+  if (PyObject_AsWriteBuffer(tab,&buf,&lbuf)==-1)
+    return NULL;
+  if (lbuf!=(Py_ssize_t)(taille*sizeof(double))){
+    PyErr_SetString(PyExc_ValueError, "Array of 5**lg doubles expected");
+    return NULL;
+  }
+  Py_BEGIN_ALLOW_THREADS
+  res=compte_mots(c,n,m,lg,alph,f,(double *)buf,debut,fin);
+  Py_END_ALLOW_THREADS
+  return PyInt_FromLong(res);
+}
+%}
+
+// sans le pythonprepend, SWIG ajoute au module Python la ligne
+// compte_mots = _Csequence.compte_mots, qui fait echouer l'import
+// de Csequence avec une bibliotheque compilee avant compte_mots
+
+%rename(compte_mots) compte_mots_tab;
+%pythonprepend compte_mots_tab %{
+# la fonction est cherchee dans _Csequence a l'appel
+%}
+PyObject* compte_mots_tab(PyObject* s, long m, int lg, char* alph,
+                          double f, PyObject* tab, int debut=1, int fin=1);
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Benchmark module.
+
+Measures the throughput of the evolution methods, and writes the
+results in JSON format. It sweeps the length of the sequence, the
+width of the contexts of the model, the number of segments and the
+size of the trees:
+
+python bench.py [options]
+
+Each measure is a dictionary with the parameters of the run, the
+number of seconds, the number of substitutions and of proposals, and
+the rates per second. Both numbers are counted during the run by a
+Stats: proposals are the positions drawn by the algorithm (the
+substitutions drawn by 'Gillespie'), substitutions the proposals
+which change a letter.
+
+All the sequences and evolutions are seeded from option --seed, so
+that two runs of the benchmark do the same work.
+"""
+
+import sys
+import time
+import platform
+import optparse
+import json
+
+import evol
+import model
+import modeles
+import tree
+import rng
+import stats
+
+# models by width of context
+_MODELS={
+    "jc": modeles.JC(),
+    "cpg": modeles.HKY85(rCgT=10,rcGA=10,kappa=2),
+    "long": modeles.HKY85(kappa=2)+"""Cga|T 6
+tcG|A 6
+Cgcg|T 4
+cgcG|A 4
+aaTtt|C 3
+""",
+    }
+
+#######################################################################
+#######################################################################
+########  functions
+
+def random_string(l, alea):
+    "Return a random string of $1 letters ACGT, with Rng $2."
+    b=alea.getrandbits
+    return "".join(["ACGT"[b(2)] for i in xrange(l)])
+
+def balanced_newick(n, b=0.1):
+    """Return the Newick string of a balanced tree of $1 leaves, with
+    branches of length $2."""
+
+    def sub(i,j):
+        if j-i==1:
+            return "L%d:%g" % (i,b)
+        k=(i+j)/2
+        return "(%s,%s):%g" % (sub(i,k),sub(k,j),b)
+    return sub(0,n)+";"
+
+def get_model(name):
+    "Return the Model of benchmark name $1."
+    return model.Model(str=_MODELS[name])
+
+def measure(f):
+    "Return the seconds spent by function $1, and its result."
+    t=time.time()
+    r=f()
+    return time.time()-t,r
+
+def bench_evolve(l, mname, algo, d, nseg, seed):
+    """Return the measure of evolve on a sequence of length $1, with
+    model $2, algorithm $3, during time $4, with $5 segments (0 for
+    the whole sequence)."""
+
+    m=get_model(mname)
+    alea=rng.Rng(seed)
+    if algo=="Native":
+        s=evol.EvolSequence()
+    else:
+        s=evol.EvolSequence(store="array")
+    s.read_str(random_string(l,alea))
+    if nseg>0:
+        # nseg segments covering half of the sequence
+        w=max(1,l/(2*nseg))
+        seg=[[i*l/nseg,i*l/nseg+w] for i in range(nseg)]
+    else:
+        seg=[]
+    st=stats.Stats()
+    sec,r=measure(lambda: s.evolve(m,d,algo=algo,segments=seg,
+                                   rng=alea.substream(1),stats=st))
+    return _record("evolve",sec,st,length=l,model=mname,algo=algo,d=d,
+                   segments=nseg)
+
+def bench_evolve_seg(l, mname, d, nreg, seed):
+    """Return the measure of evolve_seg on a sequence of length $1,
+    with $4 regions alternating model $2 and the 'jc' model, during
+    time $3."""
+
+    m=get_model(mname)
+    m2=get_model("jc")
+    alea=rng.Rng(seed)
+    s=evol.EvolSequence(store="array")
+    s.read_str(random_string(l,alea))
+    dmod={}
+    for i in range(nreg):
+        if i%2==0:
+            dmod[(i*l/nreg,(i+1)*l/nreg)]=m
+        else:
+            dmod[(i*l/nreg,(i+1)*l/nreg)]=m2
+    st=stats.Stats()
+    sec,r=measure(lambda: s.evolve_seg(dmod,d,rng=alea.substream(1),
+                                       stats=st))
+    return _record("evolve_seg",sec,st,length=l,model=mname,d=d,
+                   regions=nreg)
+
+def bench_tree(n, l, mname, algo, b, seed, workers=1):
+    """Return the measure of Node.evolve_seq on a balanced tree of $1
+    leaves and a sequence of length $2, with model $3, algorithm $4
+    and branches of length $5."""
+
+    m=get_model(mname)
+    alea=rng.Rng(seed)
+    if algo=="Native":
+        s=evol.EvolSequence()
+    else:
+        s=evol.EvolSequence(store="array")
+    s.read_str(random_string(l,alea))
+    t=tree.Node(newick=balanced_newick(n,b))
+    st=stats.Stats()
+    sec,r=measure(lambda: t.evolve_seq(s,m,algo=algo,rng=alea.substream(1),
+                                       keep="leaves",stats=st,
+                                       workers=workers))
+    return _record("tree",sec,st,leaves=n,length=l,model=mname,algo=algo,
+                   branch=b,workers=workers)
+
+def _record(name, sec, st, **par):
+    "Return the dictionary of a measure, with the counts of Stats $3."
+    d=dict(par)
+    d["bench"]=name
+    d["seconds"]=sec
+    nsub=st.substitutions()
+    nprop=st.proposals()
+    d["substitutions"]=nsub
+    d["proposals"]=nprop
+    if sec>0:
+        d["subst_per_s"]=nsub/sec
+        d["prop_per_s"]=nprop/sec
+    else:
+        d["subst_per_s"]=d["prop_per_s"]=None
+    return d
+
+def _ints(s):
+    return [int(float(x)) for x in s.split(",") if x!=""]
+
+def _strs(s):
+    return [x for x in s.split(",") if x!=""]
+
+def main(argv=None):
+    p=optparse.OptionParser(usage="python bench.py [options]")
+    p.add_option("--lengths",default="1000,10000,100000",
+                 help="sequence lengths of evolve [%default]")
+    p.add_option("--models",default="jc,cpg,long",
+                 help="models among "+",".join(sorted(_MODELS))+" [%default]")
+    p.add_option("--algos",default="Berard,Gillespie,Native",
+                 help="algorithms of evolve and trees [%default]")
+    p.add_option("--segments",default="0,100,10000",
+                 help="numbers of segments of evolve, 0 for none [%default]")
+    p.add_option("--regions",default="10,1000",
+                 help="numbers of regions of evolve_seg [%default]")
+    p.add_option("--leaves",default="10,100,1000",
+                 help="numbers of leaves of the trees [%default]")
+    p.add_option("--tree-length",type="int",default=1000,
+                 help="sequence length on the trees [%default]")
+    p.add_option("--branch",type="float",default=0.05,
+                 help="branch length on the trees [%default]")
+    p.add_option("--workers",type="int",default=1,
+                 help="processes on the trees [%default]")
+    p.add_option("-d",type="float",default=0.1,
+                 help="substitutions per site of evolve [%default]")
+    p.add_option("--seed",type="int",default=1,help="seed [%default]")
+    p.add_option("--repeat",type="int",default=1,
+                 help="runs of each measure, the fastest is kept [%default]")
+    p.add_option("--full",action="store_true",default=False,
+                 help="sweep lengths up to 10 Mb and trees up to 10000 leaves")
+    p.add_option("--only",default="evolve,evolve_seg,tree",
+                 help="benchmarks to run [%default]")
+    p.add_option("-o","--out",default=None,help="JSON output file [stdout]")
+    opt,args=p.parse_args(argv)
+
+    if opt.full:
+        opt.lengths="1000,10000,100000,1000000,10000000"
+        opt.leaves="10,100,1000,10000"
+    for x in _strs(opt.models):
+        if not _MODELS.has_key(x):
+            p.error("unknown model "+x)
+    only=_strs(opt.only)
+
+    runs=[]
+    if "evolve" in only:
+        for l in _ints(opt.lengths):
+            for mname in _strs(opt.models):
+                for algo in _strs(opt.algos):
+                    for nseg in _ints(opt.segments):
+                        if nseg<=l:
+                            runs.append((bench_evolve,(l,mname,algo,opt.d,nseg,
+                                                       opt.seed)))
+    if "evolve_seg" in only:
+        for l in _ints(opt.lengths):
+            for mname in _strs(opt.models):
+                for nreg in _ints(opt.regions):
+                    if nreg<=l:
+                        runs.append((bench_evolve_seg,(l,mname,opt.d,nreg,
+                                                       opt.seed)))
+    if "tree" in only:
+        for n in _ints(opt.leaves):
+            for mname in _strs(opt.models):
+                for algo in _strs(opt.algos):
+                    runs.append((bench_tree,(n,opt.tree_length,mname,algo,
+                                             opt.branch,opt.seed,
+                                             opt.workers)))
+
+    res=[]
+    for f,a in runs:
+        best=None
+        for i in range(max(1,opt.repeat)):
+            r=f(*a)
+            if best==None or r["seconds"]<best["seconds"]:
+                best=r
+        res.append(best)
+        sys.stderr.write("%s %s %.3fs\n" % (best["bench"],
+                         " ".join([str(x) for x in a]),best["seconds"]))
+
+    out={"python":sys.version.split()[0],
+         "platform":platform.platform(),
+         "date":time.strftime("%Y-%m-%d %H:%M:%S"),
+         "options":opt.__dict__,
+         "results":res}
+    if opt.out==None:
+        json.dump(out,sys.stdout,indent=1,sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        f=open(opt.out,"w")
+        json.dump(out,f,indent=1,sort_keys=True)
+        f.write("\n")
+        f.close()
+
+if __name__=="__main__":
+    main()
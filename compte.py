@@ -150,6 +150,47 @@ fact -- Count each word fact (default: 1).
             self.__add_ds_seq_sur_alph(s,deb,fin,lg,dalpha,f)
 
 
+    def add_file(self, nf, lg, **kw):
+        """Add the counts of words at most lg-length from the sequences
+of FASTA file nf, as add_seq does on each sequence. The file is read
+by chunks, so that the memory does not grow with the sequences.
+
+Keyword argument:
+chunk -- Number of letters read at once (default: 1048576);
+fact -- Count each word fact (default: 1).
+"""
+
+        if lg<=0:
+            return
+        for s,m,deb,fin in fasta_chunks(nf,lg,kw.get('chunk',1<<20)):
+            self.add_chunk(s,lg,m,deb,fin,**kw)
+
+    def add_chunk(self, s, lg, m, deb, fin, **kw):
+        """Add the counts of the words at most lg-length from sequence
+s which begin before position m, s being a part of a longer sequence
+and going on lg-1 letters after m (if possible). deb is True if s
+begins the sequence, fin if s ends it. The chunks of a sequence
+together give the counts of add_seq on the whole sequence.
+
+Keyword argument:
+fact -- Count each word fact (default: 1).
+"""
+
+        if lg<=0:
+            return
+        f=kw.get('fact',1)
+        if deb:
+            self.__add_suff(s,0,lg-2,f)
+        m=min(m,len(s))
+        i=0
+        while i<m and i+lg<=len(s):
+            self.__add_word(s,i,i+lg-1,f)
+            i+=1
+        if fin:
+            while i<m:
+                self.__add_pref(s,i,len(s)-1,lg,f)
+                i+=1
+
     def add_pseudo(self, x, val=1):
         """Add the counts of the word x with optionnal value val=1.
 Only the count of the given word are added, and not its prefixes.
@@ -492,6 +533,109 @@ Needs st[] and len(st)."""
         return c
 
 
+##################################################################
+##################################################################
+##################################################################
+#####  lecture de fichiers
+
+def fasta_chunks(nf, lg, chunk=1<<20, pos=(0,None)):
+    """Yield the sequences of FASTA file nf by chunks, as tuples (s,
+m, deb, fin): the words of length lg which begin in s[:m] are in s,
+which goes on lg-1 letters after m unless fin is True; deb is True
+for the first chunk of a sequence, fin for its last one. Empty
+sequences are skipped, and letters before the first header make a
+sequence. As in fasta_records, only a '>' at the beginning of a line
+begins a header.
+
+Optional argument pos=(deb,fin) limits the reading to bytes deb to
+fin of the file (fin excluded, None for the end), deb being the
+beginning of a header.
+"""
+
+    if chunk<1:
+        raise ValueError, "Bad chunk size "+str(chunk)
+    f=open(nf,'rb')
+    f.seek(pos[0])
+    reste=pos[1]
+    if reste!=None:
+        reste-=pos[0]
+    cur=""       # letters of the sequence not yet given
+    deb=True     # cur begins the sequence
+    dans=True    # in a sequence (also before any header)
+    entete=False # in a header line
+    prec="\n"    # letter before b
+    try:
+        b=_read(f,chunk,reste)
+        while b:
+            if reste!=None:
+                reste-=len(b)
+            i=0
+            while i<len(b):
+                if entete:
+                    j=b.find("\n",i)
+                    if j==-1:
+                        break
+                    entete=False
+                    dans=True
+                    i=j+1
+                    continue
+                # a header begins at the beginning of a line
+                j=b.find(">",i)
+                while j!=-1 and ((j==0 and prec not in "\r\n") or
+                                 (j>0 and b[j-1] not in "\r\n")):
+                    j=b.find(">",j+1)
+                if j==-1:
+                    j=len(b)
+                if dans:
+                    cur+=b[i:j].translate(None," \t\r\n")
+                    while len(cur)>=chunk+lg-1:
+                        yield cur[:chunk+lg-1],chunk,deb,False
+                        deb=False
+                        cur=cur[chunk:]
+                if j<len(b):
+                    # new sequence
+                    if dans and cur!="":
+                        yield cur,len(cur),deb,True
+                    cur=""
+                    deb=True
+                    dans=False
+                    entete=True
+                    j+=1
+                i=j
+            prec=b[-1]
+            b=_read(f,chunk,reste)
+        if dans and cur!="":
+            yield cur,len(cur),deb,True
+    finally:
+        f.close()
+
+def fasta_records(nf):
+    "Return the list of the positions of the headers of FASTA file nf."
+    f=open(nf,'rb')
+    l=[]
+    p=0
+    prec="\n"
+    b=f.read(1<<20)
+    while b:
+        i=b.find(">")
+        while i!=-1:
+            if (i==0 and prec in "\r\n") or (i>0 and b[i-1] in "\r\n"):
+                l.append(p+i)
+            i=b.find(">",i+1)
+        p+=len(b)
+        prec=b[-1]
+        b=f.read(1<<20)
+    f.close()
+    return l
+
+def _read(f, n, reste):
+    "Return at most n bytes of file f, and at most reste if not None."
+    if reste!=None:
+        n=min(n,reste)
+        if n<=0:
+            return ""
+    return f.read(n)
+
 ##################################################################
 ##################################################################
 ##################################################################
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Sequence differences module.
+
+Defines the substitutions of a branch as a Delta: the sorted
+positions which changed, with their old and new letters. A sequence
+evolved along a tree can then be stored on each node as a Delta
+against its father, and rebuilt only when it is needed.
+"""
+
+import array
+import itertools
+
+#######################################################################
+#######################################################################
+########  Class Delta
+
+class Delta:
+    """A Delta holds the changed positions of a sequence, with their
+    letters before and after the change.
+    """
+
+    def __init__(self, pos=(), old="", new=""):
+        """Create a Delta from the sorted list of positions $1, and
+        the strings of old letters $2 and new letters $3 at these
+        positions.
+        """
+
+        if not len(pos)==len(old)==len(new):
+            raise ValueError, "Positions and letters of different lengths."
+        self.__pos=array.array('l',pos)
+        self.__old=array.array('c',old)
+        self.__new=array.array('c',new)
+
+    def __len__(self):
+        "Return the number of changed positions."
+        return len(self.__pos)
+
+    def __str__(self):
+        return " ".join([str(i)+":"+a+">"+b for i,a,b in
+                         itertools.izip(self.__pos,self.__old,self.__new)])
+
+    def positions(self):
+        "Return the array of the changed positions."
+        return self.__pos
+
+    def old(self):
+        "Return the string of the old letters."
+        return self.__old.tostring()
+
+    def new(self):
+        "Return the string of the new letters."
+        return self.__new.tostring()
+
+    def apply(self, seq):
+        "Write the new letters in sequence $1."
+        for i,c in itertools.izip(self.__pos,self.__new):
+            seq[i]=c
+
+    def undo(self, seq):
+        "Write back the old letters in sequence $1."
+        for i,c in itertools.izip(self.__pos,self.__old):
+            seq[i]=c
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def diff(a, b):
+    "Return the Delta from string $1 to string $2, of the same length."
+    if len(a)!=len(b):
+        raise ValueError, "Sequences of different lengths."
+    pos=[i for i in xrange(len(a)) if a[i]!=b[i]]
+    return Delta(pos,[a[i] for i in pos],[b[i] for i in pos])
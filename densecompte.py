@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Dense word counts module.
+
+Defines DenseCompte, the counts of the words of a given length on an
+alphabet of 4 letters, such as DNA. A word is coded by an integer in
+base 5 ('^' being the fifth letter) and the counts are kept in an
+array of 5**lg numbers, filled by a loop of the C++ module; then
+counting the 8-letter words of a genome takes seconds.
+
+The counts are those of compte.Compte.add_seq, with the same '^' for
+the beginnings and ends of sequences, and a DenseCompte answers as a
+Compte to [], next, prop and +=. It takes 8*5**lg bytes.
+"""
+
+import array
+import re
+
+import compte
+
+#######################################################################
+#######################################################################
+########  Class DenseCompte
+
+class DenseCompte:
+    """A DenseCompte holds the counts of the words of length lg.
+
+    As in Compte, the count of a word is the number of counted words
+    which begin with it, and character '.' is the wildcard for the
+    letters, '^' excepted.
+
+    The letters which are not in the alphabet cut the sequences: each
+    part is counted as a sequence on its own, with its '^'.
+    """
+
+    def __init__(self, lg, **kw):
+        """Create an empty DenseCompte of words of length $1.
+
+        Keyword argument for the alphabet: [alph=string] of 4 letters
+        (default: 'ACGT').
+        """
+
+        alph=kw.get("alph","ACGT")
+        if lg<1:
+            raise ValueError, "Bad length "+str(lg)
+        if len(alph)!=4 or len(dict.fromkeys(alph))!=4 or alph.find("^")!=-1:
+            raise ValueError, "Bad alphabet "+str(alph)
+        self.__lg=lg
+        self.__alph=alph
+        self.__code=dict(zip(alph+"^",range(5)))
+        self.__tab=array.array('d',[0.0])*(5**lg)
+        # counts of the words '^'+part, for the parts shorter than lg-1
+        self.__short={}
+        l=re.escape(alph)
+        self.__part=re.compile("(?<![%s])[%s]{1,%d}(?![%s])" %
+                               (l,l,max(1,lg-2),l))
+
+    def add_seq(self, s, lg, **kw):
+        """Add the counts of the words of length $2 from sequence $1,
+as Compte.add_seq does. $2 must be the length of the DenseCompte.
+
+Keyword argument:
+deb -- Count only after position deb (>=0) included;
+fin -- Count only before position fin (<len()) included;
+fact -- Count each word fact (default: 1).
+"""
+
+        if lg!=self.__lg:
+            raise ValueError, "Length %d instead of %d" % (lg,self.__lg)
+        if not isinstance(s,str):
+            if hasattr(s,"seq"):
+                s=s.seq()
+            else:
+                s=str(s)
+        fin=kw.get('fin',len(s)-1)
+        deb=kw.get('deb',0)
+        if deb<0 or deb>fin or fin>=len(s):
+            return
+        if deb!=0 or fin!=len(s)-1:
+            s=s[deb:fin+1]
+
+        self.add_chunk(s,lg,len(s),True,True,**kw)
+
+    def add_file(self, nf, lg, **kw):
+        """Add the counts of the words of length $2 from the sequences
+of FASTA file $1, as Compte.add_file does. $2 must be the length of
+the DenseCompte.
+
+Keyword argument:
+chunk -- Number of letters read at once (default: 1048576);
+fact -- Count each word fact (default: 1).
+"""
+
+        if lg!=self.__lg:
+            raise ValueError, "Length %d instead of %d" % (lg,self.__lg)
+        prec=""
+        for s,m,deb,fin in compte.fasta_chunks(nf,lg,kw.get('chunk',1<<20)):
+            # a part at the beginning of a chunk goes on from the
+            # previous one, unless a cutting letter is just before
+            deb=deb or self.__alph.find(prec)==-1
+            self.add_chunk(s,lg,m,deb,fin,**kw)
+            prec=s[m-1]
+
+    def add_chunk(self, s, lg, m, deb, fin, **kw):
+        """Add the counts of the words of length $2 from sequence $1
+which begin before position $3, as Compte.add_chunk does. $4 is True
+if the part of $1 at position 0 begins a sequence, $5 if the part at
+its end ends one.
+
+Keyword argument:
+fact -- Count each word fact (default: 1).
+"""
+
+        if lg!=self.__lg:
+            raise ValueError, "Length %d instead of %d" % (lg,self.__lg)
+        # the loop of the C++ module is needed only when counting
+        from Modules.Csequence import compte_mots
+        f=kw.get('fact',1)
+        compte_mots(s,m,lg,self.__alph,f,self.__tab,deb,fin)
+        if lg<=2:
+            return
+        if s.translate(None,self.__alph)=="":
+            if deb and fin and len(s)<lg-1:
+                self.__add_short("^"+s,f)
+        else:
+            for x in self.__part.finditer(s):
+                a,e=x.span()
+                if a<m and (a>0 or deb) and (e<len(s) or fin):
+                    self.__add_short("^"+x.group(),f)
+
+    def __add_short(self, w, f):
+        self.__short[w]=self.__short.get(w,0)+f
+
+    def __iadd__(self, c):
+        """Add counts of DenseCompte $1, of the same length and
+        alphabet (x.__iadd__(c) <==> x+=c)."""
+
+        if c.__lg!=self.__lg or c.__alph!=self.__alph:
+            raise ValueError, "Different lengths or alphabets."
+        t=self.__tab
+        u=c.__tab
+        for i in xrange(len(t)):
+            if u[i]!=0:
+                t[i]+=u[i]
+        for w,v in c.__short.items():
+            self.__add_short(w,v)
+        return self
+
+##########################################
+#### donnees/calculs
+
+    def __getitem__(self, s):
+        """Return count of word s. '.' is the wildcard, "^" excepted.
+(x.__getitem__(s) <==> x[s]).
+"""
+        if len(s)>self.__lg:
+            return 0
+        k=s.find(".")
+        if k!=-1:
+            a=0
+            for x in self.__alph:
+                a+=self[s[:k]+x+s[k+1:]]
+            return a
+
+        code=self.__code
+        c=0
+        for x in s:
+            if not code.has_key(x):
+                return 0
+            c=c*5+code[x]
+        p=5**(self.__lg-len(s))
+        a=sum(self.__tab[c*p:(c+1)*p])
+        for w,v in self.__short.items():
+            if w[:len(s)]==s:
+                a+=v
+        return a
+
+    def lg(self):
+        "Return the length of the words."
+        return self.__lg
+
+    def alph(self):
+        "Return the list of the letters, '^' excepted."
+        return list(self.__alph)
+
+    def next(self, s):
+        "Return the list of [letter, value] which s in the prefix."
+        l=[]
+        if len(s)<self.__lg:
+            for x in self.__alph+"^":
+                v=self[s+x]
+                if v!=0:
+                    l.append([x,v])
+        return l
+
+    def prop(self, **kw):
+        """Return the corresponding Proportion, as Compte.prop:
+
+Keyword argument:
+lpost -- length of the posterior words (ie on the right) (default: max);
+lprior -- length of the prior words (ie on the left) (default: 0).
+"""
+
+        return self.compte().prop(**kw)
+
+    def compte(self):
+        "Return the Compte of the same counts."
+        c=compte.Compte()
+        for w,v in self.items():
+            c._Compte__add(w,v)
+        return c
+
+    def items(self):
+        """Return the list of the [word, count] of the counted words,
+        which counts are not null."""
+
+        a=self.__alph+"^"
+        lg=self.__lg
+        l=[]
+        t=self.__tab
+        for i in xrange(len(t)):
+            if t[i]!=0:
+                w=""
+                c=i
+                for j in range(lg):
+                    w=a[c%5]+w
+                    c/=5
+                l.append([w,t[i]])
+        for w,v in self.__short.items():
+            if v!=0:
+                l.append([w,v])
+        return l
+
+    def __str__(self):
+        """(x.__str__()<==> str(x))"""
+        return "".join(["%s\t%.15g\n" % (w,v) for w,v in self.items()])
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Substitution log module.
+
+Defines an EventLog, which records the substitutions done while a
+sequence evolves: for each of them the position, the old and new
+letters, the time since the beginning of the branch and the number of
+the substitution in Model.rules(). The records are kept in typed
+arrays, and can be written and read in a compact binary format.
+"""
+
+import array
+import struct
+import sys
+
+_MAGIC="EVLG"
+_HEAD="<4sI" # magic, number of records
+_TYPES=[['pos','i'],['old','c'],['new','c'],['time','d'],['rule','i']]
+
+#######################################################################
+#######################################################################
+########  Class EventLog
+
+class EventLog:
+    """An EventLog is a list of substitutions (position, old letter,
+    new letter, time, rule number).
+
+    Substitutions which time or rule are unknown (as with the
+    'Native' algorithm) have time -1 and rule -1.
+    """
+
+    def __init__(self):
+        "Create an empty EventLog."
+        self.__pos=array.array('i')
+        self.__old=array.array('c')
+        self.__new=array.array('c')
+        self.__time=array.array('d')
+        self.__rule=array.array('i')
+
+    def __len__(self):
+        "Return the number of substitutions."
+        return len(self.__pos)
+
+    def __getitem__(self, i):
+        """Return substitution $1 as (position, old letter, new letter,
+        time, rule number)."""
+        return (self.__pos[i],self.__old[i],self.__new[i],self.__time[i],
+                self.__rule[i])
+
+    def __str__(self):
+        return "".join(["%d\t%s\t%s\t%g\t%d\n" % self[i]
+                        for i in range(len(self))])
+
+    def add(self, pos, old, new, t=-1.0, rule=-1):
+        """Record the substitution of letter $2 by $3 at position $1,
+        at time $4, by rule $5."""
+        self.__pos.append(pos)
+        self.__old.append(old)
+        self.__new.append(new)
+        self.__time.append(t)
+        self.__rule.append(rule)
+
+    def extend(self, log, shift=0, delay=0.0):
+        """Append the substitutions of EventLog $1, with positions
+        increased by $2 and known times by $3."""
+        p=log._EventLog__pos
+        if shift!=0:
+            p=array.array('i',[i+shift for i in p])
+        self.__pos.extend(p)
+        self.__old.extend(log._EventLog__old)
+        self.__new.extend(log._EventLog__new)
+        t=log._EventLog__time
+        if delay!=0:
+            t=array.array('d',[x>=0 and x+delay or x for x in t])
+        self.__time.extend(t)
+        self.__rule.extend(log._EventLog__rule)
+
+    def positions(self):
+        "Return the array of the positions."
+        return self.__pos
+
+    def times(self):
+        "Return the array of the times."
+        return self.__time
+
+    def rules(self):
+        "Return the array of the rule numbers."
+        return self.__rule
+
+    def old(self):
+        "Return the string of the old letters."
+        return self.__old.tostring()
+
+    def new(self):
+        "Return the string of the new letters."
+        return self.__new.tostring()
+
+    def tofile(self, f):
+        """Write the EventLog in binary format in open file $1 (or
+        file name)."""
+        if isinstance(f,str):
+            f=open(f,"wb")
+            try:
+                self.tofile(f)
+            finally:
+                f.close()
+            return
+        f.write(struct.pack(_HEAD,_MAGIC,len(self)))
+        for x,c in _TYPES:
+            a=getattr(self,"_EventLog__"+x)
+            if sys.byteorder=="big" and c!='c':
+                a=array.array(c,a)
+                a.byteswap()
+            f.write(a.tostring())
+
+    def fromfile(self, f):
+        """Append the EventLog written by tofile() in open file $1 (or
+        file name)."""
+        if isinstance(f,str):
+            f=open(f,"rb")
+            try:
+                self.fromfile(f)
+            finally:
+                f.close()
+            return
+        h=f.read(struct.calcsize(_HEAD))
+        if len(h)!=struct.calcsize(_HEAD):
+            raise ValueError, "Truncated EventLog."
+        magic,n=struct.unpack(_HEAD,h)
+        if magic!=_MAGIC:
+            raise ValueError, "Not an EventLog."
+        for x,c in _TYPES:
+            a=array.array(c)
+            s=f.read(n*a.itemsize)
+            if len(s)!=n*a.itemsize:
+                raise ValueError, "Truncated EventLog."
+            a.fromstring(s)
+            if sys.byteorder=="big" and c!='c':
+                a.byteswap()
+            getattr(self,"_EventLog__"+x).extend(a)
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def read(f):
+    "Return the EventLog written by tofile() in file $1."
+    log=EventLog()
+    log.fromfile(f)
+    return log
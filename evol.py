@@ -11,8 +11,41 @@ __author__ = "Leonor Palmeira <palmeira@biomserv.univ-lyon1.fr>"
 __date__ = "17 October 2007"
 __credits__ = """Guido van Rossum, for an excellent programming language."""
 
+import itertools
+import operator
+import time
+import math
+import multiprocessing
+import array
+
 from compte import *
 from sequence import *
+from ratecache import RateCache
+from fenwick import Fenwick
+from rng import Rng, poisson
+import delta
+from eventlog import EventLog
+from sampler import Sampler
+from interval import IntervalIndex
+from stats import Stats
+
+_block=None # model and arguments of evolve_blocks in this process
+
+def _timed(f):
+    """Return method $1, adding its time to the Stats of its keyword
+    argument 'stats'."""
+    def g(self, *args, **kw):
+        st=kw.get("stats")
+        if st==None:
+            return f(self,*args,**kw)
+        t=time.time()
+        try:
+            return f(self,*args,**kw)
+        finally:
+            st.add_time(time.time()-t)
+    g.__name__=f.__name__
+    g.__doc__=f.__doc__
+    return g
 
 #from misc import *
 
@@ -27,6 +60,8 @@ class EvolSequence(Sequence):
     format (with .fa or .fst extension) is allowed.
     """
 
+    __journal=None # old letters of the changed positions
+
 #####################################
 ######### replacing Sequence methods:
 
@@ -35,12 +70,13 @@ class EvolSequence(Sequence):
 #        ls=len(self)
 
     def copy(self):
-        """Return a NEW copy EvolSequence of the EvolSequence.
+        """Return a NEW copy EvolSequence of the EvolSequence, with the
+        same storage.
 	"""
 	
-        g=EvolSequence()
-	g._Seq__gen.copie(self._Seq__c_elem())
-	return g
+        g=EvolSequence(store=self.store())
+        g._Seq__gen.copie(self._Seq__c_elem())
+        return g
 
 #####################################
 #####################################
@@ -75,18 +111,11 @@ class EvolSequence(Sequence):
 	"""Return the observed differences between this EvolSequence
 	and sequence $1.
 	"""
-        ls=len(self)
-	lg=len(gen)
-	if ls==lg:
-	    j=0
-	    for i in range(ls):
-		if self[i]!=gen[i]:
-		    j+=1
-	else:
-	    raise ValueError, "Sequences of different lengths."
-	return j
+        if len(self)!=len(gen):
+            raise ValueError, "Sequences of different lengths."
+        return sum(itertools.imap(operator.ne,self.seq(),gen.seq()))
 
-    def pick_position(self, segments=range(0)):
+    def pick_position(self, segments=range(0), rng=random):
         """Return a random position in the EvolSequence.
 
         Optional argument 'segments' is a list of all allowed
@@ -94,6 +123,9 @@ class EvolSequence(Sequence):
         end position excluded. The probability of a position to be
         chosen is proportional to the number of segments this position
         belongs to. This argument defaults to the whole sequence.
+
+        Optional argument 'rng' is the random generator (a Rng, or
+        the random module which is the default).
         """
 
         if segments==[]:
@@ -102,7 +134,7 @@ class EvolSequence(Sequence):
             l=0
             for s in segments:
                 l+=s[1]-s[0]
-        i=random.randint(0,l-1)
+        i=rng.randint(0,l-1)
         if segments==[]:
             return i
         d=0
@@ -111,6 +143,38 @@ class EvolSequence(Sequence):
            d+=1
         return i+segments[d][0]
 
+
+    def start_journal(self):
+        """Start recording the positions which change, until
+        end_journal().
+
+        Meanwhile the EvolSequence is a _JournalSequence, so that
+        __setitem__ is not slowed down out of the journals.
+        """
+        self.__journal={}
+        self.__class__=_JournalSequence
+
+    def end_journal(self):
+        """Stop recording the changes, and return the Delta from the
+        EvolSequence at start_journal() to this one."""
+        j=self.__journal
+        self.__journal=None
+        if isinstance(self,_JournalSequence):
+            self.__class__=EvolSequence
+        if j==None:
+            return delta.Delta()
+        pos=[i for i in sorted(j) if self[i]!=j[i]]
+        return delta.Delta(pos,[j[i] for i in pos],[self[i] for i in pos])
+
+    def __note(self, st):
+        """Record in the journal the changes from string $1, after
+        the letters have been written outside of __setitem__."""
+        j=self.__journal
+        if j==None:
+            return
+        for i in delta.diff(st,self.seq()).positions():
+            if not j.has_key(i):
+                j[i]=st[i]
            
 #####################################
 ######## methods for some statistics:
@@ -121,10 +185,9 @@ class EvolSequence(Sequence):
         
 	"""
 	
-	c=Compte()
-	c.add_seq(self,1)
-	c.__idiv__(float(len(self)))
-	return c
+        c=self.__count(1)
+        c.__idiv__(float(len(self)))
+        return c
    
     def difreq(self): #gerer les ^ ?
 	"""Return the observed frequencies of dinucleotides in the
@@ -132,10 +195,33 @@ class EvolSequence(Sequence):
         
 	"""
 	
-	c=Compte()
-	c.add_seq(self,2)
-	c.__idiv__(float(len(self)-1))
-	return c
+        c=self.__count(2)
+        c.__idiv__(float(len(self)-1))
+        return c
+
+    def __count(self,lg):
+        """Return the Compte of the words of length $1 (1 or 2) of the
+        EvolSequence, as Compte.add_seq does, counting on the whole
+        string of letters at once.
+        """
+
+        s=self.seq()
+        c=Compte()
+        if s=="":
+            return c
+        if lg==1:
+            c._Compte__add("^",1)
+            for x in dict.fromkeys(s):
+                c._Compte__add(x,s.count(x))
+        else:
+            c._Compte__add("^"+s[0],1)
+            n={}
+            for x in itertools.imap(operator.add,s,s[1:]):
+                n[x]=n.get(x,0)+1
+            for x in n:
+                c._Compte__add(x,n[x])
+            c._Compte__add(s[-1]+"^",1)
+        return c
 
     def __str_freq(self): #methode pas propre
 	"""Return the observed nucleotide frequencies in a simple
@@ -203,6 +289,7 @@ class EvolSequence(Sequence):
 #####################################
 ################## evolution methods:
 
+    @_timed
     def evolve(self,m,d, **kw): #verifier que nb subst est bien atteint
 	"""Evolve the EvolSequence, according to model $1, for $2
 substitutions.
@@ -212,7 +299,29 @@ sequence is approximated: [approx=string] 'Rounded' is the default.
 
 Keyword argument to determine the algorithm used to simulate
 neighbor-dependent substitutions: [algo=string] 'Berard' is the
-default.
+default. With 'Gillespie', only the substitutions that really occur
+are drawn, from the rates of all the sites which are kept up to date.
+With 'Native', the 'Berard' algorithm is run inside the C++ module
+(only for the default C storage), without holding the Python
+interpreter lock. With 'Thinning', each position is proposed
+proportionally to the sum of the rates of the substitutions of its
+letter, instead of the maximum over all letters, and the clock runs
+with the sum of these bounds; it simulates the same process with
+fewer rejections. With 'Matrix', for a model without contexts, the
+letter of each position at the end is drawn from the transition
+matrix, skipping the positions which do not change; this is the
+default for such models, unless a 'cache' or a 'block' is given.
+With 'tau', the evolution is APPROXIMATE: time goes by leaps, and in
+each leap the number of substitutions of each rule is drawn from a
+Poisson law over the positions holding its letter, and kept where the
+rule applies at the beginning of the leap. A leap which draws a
+position twice is redone with half the time, so that no substitution
+is lost; the approximation is that the rates do not change during a
+leap.
+
+Keyword argument for the error tolerance of 'tau': [tol=float]
+(default: 0.01). A leap is short enough for each position to change
+with probability at most tol.
 
 Keyword argument 'segments' is a list of all allowed
 segments. Otherwise a segment is a SORTED list [beg,end], with
@@ -223,6 +332,38 @@ belongs to.
 WARNING: When an empty list is given, all positions are considered
 allowed.
 
+Keyword argument to draw the positions: [sampler=Sampler], built once
+from segments, a mask or per-site weights; it replaces 'segments'.
+
+Keyword argument for the random generator: [rng=Rng] (default: the
+random module). It also seeds the generator of the 'Native'
+algorithm.
+
+Keyword argument for a RateCache of the EvolSequence for model $1:
+[cache=RateCache]. The substitutions allowed at the proposed positions
+are then read from the cache, which is updated. Only 'Berard' keeps
+the cache up to date: with another algorithm, ValueError is raised.
+
+Keyword argument to record the substitutions: [log=EventLog]. Times
+are counted in substitutions per site from the beginning of the
+evolution. With 'Native' and 'Matrix', the entries carry neither the
+time nor the rule: only the changed positions and letters are
+known.
+
+Keyword argument to draw the proposals of 'Berard' by blocks:
+[block=int] (default: 0, one by one). The positions, the uniform
+rates and the waiting times of $1 proposals are drawn at once in
+arrays, and used in turn; the process is the same, but the random
+numbers are not drawn in the same order. Other algorithms raise
+ValueError.
+
+Keyword argument to count the proposals, substitutions and
+rejections, and the time spent: [stats=Stats]. With 'Native', the
+rejections are not counted by cause, nor the substitutions by rule.
+With 'tau', the proposals are the substitutions drawn in the leaps
+done, and the rejections (where the rule does not apply) are not
+counted by cause.
+
 """
 
         if kw.has_key("approx"):
@@ -235,39 +376,140 @@ allowed.
         else:
             segments=[]
 
+        rng=kw.get("rng",random)
+        log=kw.get("log")
+        stats=kw.get("stats")
+        cache=kw.get("cache")
+        if cache!=None and (cache.sequence() is not self or
+                            cache.model() is not m):
+            raise ValueError, "The RateCache is not for this EvolSequence and model."
+
+        block=kw.get("block",0)
         if kw.has_key("algo"):
             algo=kw["algo"]
+        elif cache==None and block==0 and not m.has_contexts():
+            algo="Matrix"
         else:
             algo="Berard"
+        if block>0 and algo!="Berard":
+            raise ValueError, "block proposals need the 'Berard' algorithm"
+        if cache!=None and algo!="Berard":
+            raise ValueError, "Only the 'Berard' algorithm keeps a RateCache up to date."
 
-        if segments==[]:
+        smp=kw.get("sampler")
+        if smp==None and segments!=[]:
+            smp=Sampler(segments=segments)
+
+        if algo=="Gillespie":
+            self.__evolve_gillespie(m,d,smp,rng,log,stats)
+            return self
+        if algo=="Thinning":
+            self.__evolve_thinning(m,d,smp,rng,log,stats)
+            return self
+        if algo=="Matrix":
+            self.__evolve_matrix(m,d,smp,rng,log,stats)
+            return self
+        if algo=="tau":
+            self.__evolve_tau(m,d,smp,rng,kw.get("tol",0.01),log,stats)
+            return self
+
+        if smp==None:
             l=len(self)
         else:
-            l=0
-            for s in segments:
-                l+=s[1]-s[0]
+            l=smp.total()
         D=d*l
-	anc=self.copy() # copy ancestral sequence
+
+        if algo=="Native":
+            if self.store()!="C":
+                raise ValueError, "The 'Native' algorithm needs the C storage."
+            if smp!=None:
+                segments=smp.segments()
+                if segments==None:
+                    raise ValueError, "The 'Native' algorithm needs segments."
+            if self.__journal!=None or log!=None:
+                st=self.seq()
+            n,p=self._Seq__gen.evolve(m.rules(),m._Model__max,D,segments,
+                                      rng.getrandbits(31))
+            if stats!=None:
+                stats.propose(p)
+                stats.fire(-1,n)
+            if self.__journal!=None:
+                self.__note(st)
+            if log!=None:
+                x=delta.diff(st,self.seq())
+                for i,a,b in itertools.izip(x.positions(),x.old(),x.new()):
+                    log.add(i,a,b)
+            return self
+
 	n=0 #number of iterations
 	s=0 #number of substitutions
+        if block>0:
+            mx=m._Model__max
+            rnd=rng.random
+            lg=math.log
+            while s<D:
+                if smp==None:
+                    pos=array.array('l',[int(rnd()*l) for j in xrange(block)])
+                else:
+                    pos=smp.draws(block,rng)
+                us=array.array('d',[rnd()*mx for j in xrange(block)])
+                ts=array.array('d',[-lg(1.0-rnd())/mx for j in xrange(block)])
+                # each proposal comes after its waiting time
+                if log!=None or cache!=None or stats!=None:
+                    for j in xrange(block):
+                        s+=ts[j]
+                        if s>=D:
+                            break
+                        self.substitute(m,pos[j],algo=algo,log=log,t=s/l,
+                                        cache=cache,stats=stats,r=us[j])
+                        n+=1
+                    continue
+                # same as substitute, without the call
+                rules_at=m.rules_at
+                for j in xrange(block):
+                    s+=ts[j]
+                    if s>=D:
+                        break
+                    i=pos[j]
+                    r=us[j]
+                    for k in rules_at(self,i):
+                        if r<k[1]:
+                            self[i]=k[0]
+                            break
+                        r-=k[1]
+                    n+=1
+            if stats!=None:
+                stats.propose(n)
+            return self
+
+        s=rng.expovariate(m._Model__max) # time of the first proposal
 	while s<D:
-            i=self.pick_position(segments=segments)
-	    self.substitute(m,i,algo=algo) #try to substitute the site at position i
+            if smp==None:
+                i=rng.randint(0,l-1)
+            else:
+                i=smp.draw(rng)
+	    self.substitute(m,i,algo=algo,rng=rng,log=log,t=s/l,cache=cache,
+                            stats=stats) #try to substitute the site at position i
 	    n+=1
-            s+=random.expovariate(m._Model__max)
+            s+=rng.expovariate(m._Model__max)
 
+        if stats!=None:
+            stats.propose(n)
 	return self
 
+    @_timed
     def evolve_seg(self,dmod,d, **kw): #verifier que nb subst est bien atteint
 	"""Evolve the EvolSequence, according to models in dictionary
         $1, for $2 substitutions.
 
         The dictionary items are (deb,fin):mod where the modele mod is
         applied to the positions in range [deb:fin] (fin is excluded).
-        If ranges overlap, a random model is applied on each
-        substitution that occurs in the overlap. The probability of a
-        position to be substituted is proportional to the number of
-        model ranges this position belongs to.
+        If ranges overlap, the rates of their models add up in the
+        overlap. $1 can also be an IntervalIndex of this dictionary,
+        built once for several calls.
+
+        Positions are proposed in each range proportionally to the
+        maximum rate of its model, during time $2.
 
         Keyword argument to determine how the number of substitutions on the
         sequence is approximated: [approx=string] 'Rounded' is the default.
@@ -276,6 +518,17 @@ allowed.
         neighbor-dependent substitutions: [algo=string] 'Berard' is the
         default.
 
+        Keyword argument for the random generator: [rng=Rng] (default:
+        the random module).
+
+        Keyword arguments to record the substitutions: [log=EventLog]
+        and [stats=Stats], as in evolve.
+
+        Keyword argument to draw the positions: [sampler=Sampler]
+        (default: drawn from the model ranges). A position then
+        evolves during $2 times its weight in the sampler, with the
+        rates of its models added up as without a sampler; the
+        positions out of the ranges do not change.
         """
 
         if kw.has_key("approx"):
@@ -288,70 +541,543 @@ allowed.
         else:
             algo="Berard"
 
-        segments=[]
-        l=0
-        for v in dmod.keys():
-            segments.append([min(v),max(v)])
-            l+=max(v)-min(v)
-        D=d*l
-	anc=self.copy() # copy ancestral sequence
-	n=0 #number of iterations
-	s=0 #number of substitutions
-	while s<D:
-            i=self.pick_position(segments=segments) #choose a position
-            lm=[]
-            for deb,fin in dmod:
-                if i>=deb and i<fin:
-                    lm.append(dmod[deb,fin])
-            if len(lm)!=0:
-                m=random.choice(lm)
-                self.substitute(m,i,algo=algo) #try to substitute the site at position i
+        rng=kw.get("rng",random)
+        log=kw.get("log")
+        stats=kw.get("stats")
+
+        if isinstance(dmod,IntervalIndex):
+            idx=dmod
+        else:
+            idx=IntervalIndex(dmod)
+
+        smp=kw.get("sampler")
+        if smp!=None:
+            # the proposals of the sampler are thinned by the bound B
+            # of the sums of the maximum rates at a position: a
+            # proposal falls on one of the models of its position
+            # proportionally to its maximum rate, or on none of them
+            B=idx.max_rate()
+            R=smp.total()*B
+            if R<=0:
+                return self
+            n=0
+            t=rng.expovariate(R)
+            while t<d:
+                i=smp.draw(rng) #choose a position
+                m=idx.model_at(i,rng.random()*B)
+                if m!=None:
+                    self.substitute(m,i,algo=algo,rng=rng,log=log,t=t,
+                                    stats=stats)
+                elif stats!=None:
+                    stats.reject("rate")
                 n+=1
-                s+=random.expovariate(m._Model__max)
+                t+=rng.expovariate(R)
+            if stats!=None:
+                stats.propose(n)
+            return self
 
+        R=idx.total()
+        if R<=0:
+            return self
+	n=0 #number of proposals
+	t=rng.expovariate(R)
+	while t<d:
+            i,m=idx.pick(rng) #choose a position and its model
+            self.substitute(m,i,algo=algo,rng=rng,log=log,t=t,stats=stats) #try to substitute the site at position i
+            n+=1
+            t+=rng.expovariate(R)
+
+        if stats!=None:
+            stats.propose(n)
 	return self
 
-    def substitute(self,m,pos, approx='Rounded', algo='Berard'):
+    @_timed
+    def evolve_blocks(self,m,d, **kw):
+        """Evolve the EvolSequence, according to model $1, for $2
+        substitutions per site, cutting it into blocks evolved in
+        parallel.
+
+        The time is cut into slices. In each slice, the even blocks
+        evolve while the odd ones are frozen, and then the reverse
+        (the order of both phases alternates between slices). A block
+        evolves with the letters of its neighbours as read-only
+        contexts, taken on m.lg_left() and m.lg_right() positions;
+        blocks are never shorter than the contexts, so that blocks
+        evolving at the same time do not interact.
+
+        Each site evolves for the whole time, but the substitutions of
+        neighbouring blocks only see each other at the end of each
+        phase. This changes only the sites closer to a block end than
+        the contexts, and less as there are more slices; with a model
+        without context, the result is exact. With s slices, a letter
+        of a context changes during a phase, unseen by the block
+        which reads it, with probability at most $2*max/s, max being
+        the maximum rate of the model (m._Model__max).
+
+        Keyword argument for the number of processes: [workers=int]
+        (default: 1).
+
+        Keyword argument for the number of blocks: [blocks=int]
+        (default: twice the number of processes).
+
+        Keyword argument for the number of time slices: [slices=int]
+        (default: 10*$2*max rounded up, so that this probability is at
+        most 0.1).
+
+        Keyword argument for the random generator: [rng=Rng] (default:
+        a Rng seeded from the random module). Block k of slice t
+        evolves with its substream (t,k), so that the result does not
+        depend on the number of processes.
+
+        Other keyword arguments (segments, algo, log, stats...) are as
+        in evolve; the 'Native' algorithm evolves the blocks in the C
+        storage. The substitutions are logged by slice and phase. The
+        time of the Stats is the elapsed time of evolve_blocks, not
+        the sum of the times of the processes. A RateCache cannot
+        follow the blocks, so 'cache' raises ValueError.
+
+        Each process receives only the letters of its block and of
+        its contexts, and sends back those of its block.
+        """
+
+        kw=kw.copy()
+        workers=kw.pop("workers",1)
+        nb=kw.pop("blocks",2*max(workers,1))
+        slices=kw.pop("slices",None)
+        if slices==None:
+            slices=int(math.ceil(10*d*m._Model__max))
+        slices=max(1,slices)
+        alea=kw.pop("rng",None)
+        if alea==None:
+            alea=Rng()
+        segments=kw.pop("segments",[])
+        log=kw.pop("log",None)
+        stats=kw.pop("stats",None)
+        if kw.has_key("sampler"):
+            raise ValueError, "Blocks are drawn from 'segments', not from a Sampler."
+        if kw.has_key("cache"):
+            raise ValueError, "A RateCache is not kept up to date by evolve_blocks."
+
+        ls=len(self)
+        lp=m.lg_left()
+        lq=m.lg_right()
+        nb=max(1,min(nb,ls/(max(lp,lq)+1)))
+        bounds=[ls*k/nb for k in range(nb+1)]
+
+        work=array.array('c',self.seq())
+        if workers>1 and nb>1:
+            pool=multiprocessing.Pool(workers,_init_blocks,
+                                      (m,kw,alea.first_seed()))
+        else:
+            _init_blocks(m,kw,alea.first_seed())
+            pool=None
+        dt=float(d)/slices
+        try:
+            for t in range(slices):
+                if t%2==0:
+                    phases=[0,1]
+                else:
+                    phases=[1,0]
+                for ph in phases:
+                    tasks=[]
+                    start={}
+                    for k in range(ph,nb,2):
+                        b0,b1=bounds[k],bounds[k+1]
+                        a=max(0,b0-lp)
+                        b=min(ls,b1+lq)
+                        if segments==[]:
+                            seg=[[b0-a,b1-a]]
+                        else:
+                            seg=[[max(x[0],b0)-a,min(x[1],b1)-a]
+                                 for x in segments if x[0]<b1 and x[1]>b0]
+                            if seg==[]:
+                                continue
+                        start[k]=a
+                        tasks.append((k,work[a:b].tostring(),b0-a,b1-b0,
+                                      seg,dt,t,log!=None,stats!=None))
+                    if pool!=None:
+                        res=pool.map(_evolve_block,tasks)
+                    else:
+                        res=map(_evolve_block,tasks)
+                    for k,x,y,z in res:
+                        work[bounds[k]:bounds[k+1]]=array.array('c',x)
+                        if log!=None:
+                            log.extend(y,start[k],t*dt)
+                        if stats!=None:
+                            stats+=z
+        finally:
+            if pool!=None:
+                pool.close()
+                pool.join()
+
+        if self.__journal!=None:
+            st=self.seq()
+            self.read_str(work.tostring())
+            self.__note(st)
+        else:
+            self.read_str(work.tostring())
+        return self
+
+    def substitute(self,m,pos, approx='Rounded', algo='Berard', rng=random,
+                   log=None, t=0.0, cache=None, stats=None, bound=None,
+                   r=None):
 	"""Substitute, according to model $1, position $2 in the
 	EvolSequence. This can result in no modification of the
 	nucleotide at position $2.
+
+        Optional argument 'rng' is the random generator (default: the
+        random module).
+
+        Optional argument 'log' is an EventLog where the substitution
+        is recorded at time 't'.
+
+        Optional argument 'cache' is a RateCache of the EvolSequence
+        for model $1, which gives the allowed substitutions and is
+        updated.
+
+        Optional argument 'stats' is a Stats where the substitution,
+        or the cause of the rejection, is counted.
+
+        Optional argument 'bound' is the upper bound of the rate at
+        this position, which excludes the substitutions to the same
+        letter (default: the maximum rate of the model).
+
+        Optional argument 'r' is the uniform rate already drawn
+        below the bound.
 	"""
 
-	r=random.uniform(0,m._Model__max) # _Model__max exclu	
+        if r!=None:
+            pass
+        elif bound==None:
+            r=rng.uniform(0,m._Model__max) # _Model__max exclu
+        else:
+            r=rng.uniform(0,bound)
         if algo=='Berard':
-            a=m._Model__next_all.get(self[pos],{}) # all allowed substitutions on this position
+            # only the substitutions which context matches are looked
+            # at, with their rates in the same order as in the model
+            if cache==None:
+                a=m.rules_at(self,pos)
+            else:
+                a=cache.rules_at(pos)
             for k in a:
-                if r<k[3]:
-                    # print '**************yes*************' #substitution might take place
-                    # test a gauche
-                    i=0
-                    mg=k[0]
-                    lg=len(mg)
-                    md=k[1]
-                    ld=len(md)
-                    while i < lg:
-                        if self[pos-lg+i]!=mg[i]:
-                            return k[3]
-                        else:
-                            i+=1
-                    i=0
-                    while i < ld:
-                        if pos+1+i >= len(self) or self[pos+1+i]!=md[i]:
-                            return 0
-                        else:
-                            i+=1
-                            
-                    if self[pos]!=k[2]:
-                        self[pos]=k[2]
-                        return k[3]
+                if r<k[1]:
+                    if log!=None:
+                        log.add(pos,self[pos],k[0],t,k[2])
+                    if cache==None:
+                        self[pos]=k[0]
                     else:
+                        cache.set(pos,k[0])
+                    if stats!=None:
+                        stats.fire(k[2])
+                    return k[1]
+                r-=k[1]
+            if stats!=None:
+                # r is uniform on the rates left, which are laid out
+                # as the missed substitutions, then the rest
+                for k in m.misses(m.window(self,pos)):
+                    if bound!=None and k[0]=="same":
+                        continue
+                    if r<k[1]:
+                        stats.reject(k[0])
                         return 0
-                else:
-                    r-=k[3]
+                    r-=k[1]
+                stats.reject("rate")
         else:
             raise NotImplementedError, "Only the 'Berard' algorithm has been implemented."
 	return 0
 
+    def site_rules(self,m,pos):
+        """Return the list of [letter, rate] of the substitutions
+        allowed by model $1 at position $2, given the neighbours of
+        this position.
+
+        Neighbours out of the EvolSequence never match a context.
+        """
+
+        return [k[:2] for k in m.rules_at(self,pos)]
+
+    def __evolve_gillespie(self,m,d,smp,rng,log=None,stats=None):
+        """Evolve the EvolSequence, according to model $1, during time
+        $2, drawing only the substitutions that occur, with the site
+        weights of Sampler $3 (or None), random generator $4, and
+        recording them in EventLog $5 and Stats $6.
+
+        The substitutions of the sites are kept in a RateCache; after
+        a substitution, only the sites which context contains the
+        substituted position are updated.
+        """
+
+        ls=len(self)
+        if ls==0:
+            return
+        if smp==None:
+            w=None
+        else:
+            w=smp.site_weights(ls)
+        c=RateCache(self,m,w)
+
+        t=0.0
+        while 1:
+            R=c.total_rate()
+            if R<=0:
+                break
+            t+=rng.expovariate(R)
+            if t>=d:
+                break
+            i,k=c.draw(rng)
+            if stats!=None:
+                stats.propose()
+                if k==None:
+                    stats.reject("rate")
+                else:
+                    stats.fire(k[2])
+            if k==None:
+                continue
+            if log!=None:
+                log.add(i,self[i],k[0],t,k[2])
+            c.set(i,k[0])
+
+    def __evolve_thinning(self,m,d,smp,rng,log=None,stats=None):
+        """Evolve the EvolSequence, according to model $1, during time
+        $2, with the site weights of Sampler $3 (or None), random
+        generator $4, and recording the substitutions in EventLog $5
+        and Stats $6.
+
+        A position is proposed proportionally to its weight times the
+        bound of its letter given by Model.letter_max(); these bounds
+        are kept in a Fenwick tree, and the clock runs with their
+        sum. Only the bound of the substituted position changes.
+        """
+
+        ls=len(self)
+        if ls==0:
+            return
+        if smp==None:
+            w=[1]*ls
+        else:
+            w=smp.site_weights(ls)
+        b=m.letter_max()
+        st=self.seq()
+        f=Fenwick(val=[w[i]*b.get(st[i],0) for i in xrange(ls)])
+        del st
+
+        n=0
+        t=0.0
+        while 1:
+            B=f.total()
+            if B<=0:
+                break
+            t+=rng.expovariate(B)
+            if t>=d:
+                break
+            i=f.find(rng.uniform(0,B))
+            n+=1
+            if self.substitute(m,i,rng=rng,log=log,t=t,stats=stats,
+                               bound=b.get(self[i],0)):
+                f[i]=w[i]*b.get(self[i],0)
+        if stats!=None:
+            stats.propose(n)
+
+    def __evolve_matrix(self,m,d,smp,rng,log=None,stats=None):
+        """Evolve the EvolSequence, according to model $1 without
+        contexts, during time $2, with the site weights of Sampler $3
+        (or None), random generator $4, and recording the changes in
+        EventLog $5 and Stats $6.
+
+        In a segment, the positions which may change are drawn with
+        geometric skips, with the highest probability of change over
+        the letters; a position holding letter c then changes with
+        the probability of change of c, over this highest one.
+        Overlapping segments are evolved one after the other, which
+        adds up their times.
+        """
+
+        ls=len(self)
+        if smp==None:
+            seg=[[0,ls]]
+        else:
+            seg=smp.segments()
+        n=0
+        if seg==None:
+            w=smp.site_weights(ls)
+            # positions by weight, so that each matrix is computed once
+            byw={}
+            for i in xrange(ls):
+                if w[i]>0:
+                    if byw.has_key(w[i]):
+                        byw[w[i]].append(i)
+                    else:
+                        byw[w[i]]=[i]
+            lw=byw.keys()
+            lw.sort()
+            for x in lw:
+                p=m.transition(x*d)
+                for i in byw[x]:
+                    c=self[i]
+                    if p.has_key(c):
+                        n+=1
+                        if rng.random()<1-p[c][0]:
+                            self.__jump(i,c,p[c],rng,log,stats)
+        else:
+            p=m.transition(d)
+            pm=max([1-x[0] for x in p.values()]+[0])
+            if pm>0:
+                if pm<1:
+                    lq=math.log(1-pm)
+                else:
+                    lq=None
+                for a,b in seg:
+                    b=min(ls,b)
+                    i=max(0,a)-1
+                    while 1:
+                        if lq==None:
+                            i+=1
+                        else:
+                            i+=1+int(math.log(1.0-rng.random())/lq)
+                        if i>=b:
+                            break
+                        c=self[i]
+                        if p.has_key(c):
+                            n+=1
+                            if rng.random()*pm<1-p[c][0]:
+                                self.__jump(i,c,p[c],rng,log,stats)
+        if stats!=None:
+            stats.propose(n)
+
+    def __evolve_tau(self,m,d,smp,rng,tol,log=None,stats=None):
+        """Evolve the EvolSequence, according to model $1, during time
+        $2, by tau leaps of tolerance $5, with the site weights of
+        Sampler $3 (or None), random generator $4, and recording the
+        substitutions in EventLog $6 and Stats $7.
+
+        The positions are kept in an array per letter. In a leap, the
+        substitutions of a rule are drawn on positions holding its
+        letter (proportionally to their weights), and kept where its
+        contexts match at the beginning of the leap. If a position is
+        drawn twice, the leap is redone with half the time, and the
+        time grows back after each leap done; the substitutions of a
+        leap are then all on different positions.
+        """
+
+        ls=len(self)
+        if ls==0 or tol<=0:
+            return
+        if smp==None:
+            w=None
+            wmax=1
+        else:
+            w=array.array('d',smp.site_weights(ls))
+            wmax=max(w)
+        rules=m.rules()
+        bound=m.letter_max()
+        bmax=max(bound.values()+[0])*wmax
+        if bmax<=0:
+            return
+        byl={} # substitutions of each letter: [number, target, rate]
+        for k in range(len(rules)):
+            c,x,r=rules[k][1],rules[k][3],rules[k][4]
+            if x!=c and r>0:
+                byl.setdefault(c,[]).append([k,x,r])
+        sites=dict([[y,array.array('l')] for y in byl]) # positions
+        tot=dict.fromkeys(byl,0) # sum of their weights
+        where=array.array('l',[-1])*ls # index of a position in sites
+        st=self.seq()
+        for i in xrange(ls):
+            c=st[i]
+            if sites.has_key(c) and (w==None or w[i]!=0):
+                where[i]=len(sites[c])
+                sites[c].append(i)
+                if w==None:
+                    tot[c]+=1
+                else:
+                    tot[c]+=w[i]
+        del st
+        leap=array.array('l',[-1])*ls # last leap drawing a position
+
+        rnd=rng.random
+        hmax=tol/bmax
+        h=hmax
+        nl=0
+        n=0
+        t=0.0
+        while t<d:
+            tau=min(d-t,h)
+            nl+=1
+            ev=[]
+            p=0
+            again=0
+            for c in byl:
+                l=sites[c]
+                if len(l)==0 or tot[c]<=0:
+                    continue
+                for k,x,r in byl[c]:
+                    for e in xrange(poisson(r*tot[c]*tau,rng)):
+                        while 1:
+                            i=l[int(rnd()*len(l))]
+                            if w==None or w[i]>=wmax or rnd()*wmax<w[i]:
+                                break
+                        p+=1
+                        if k not in [y[2] for y in m.rules_at(self,i)]:
+                            continue
+                        if leap[i]==nl:
+                            again=1
+                            break
+                        leap[i]=nl
+                        ev.append([i,k,x])
+                    if again:
+                        break
+                if again:
+                    break
+            if again:
+                # a position is drawn twice
+                h/=2
+                continue
+
+            t+=tau
+            h=min(hmax,2*h)
+            n+=p
+            for i,k,x in ev:
+                c=self[i]
+                if log!=None:
+                    log.add(i,c,x,t,k)
+                if stats!=None:
+                    stats.fire(k)
+                # move i from the array of c to that of x
+                l=sites[c]
+                j=where[i]
+                y=l.pop()
+                if y!=i:
+                    l[j]=y
+                    where[y]=j
+                if w==None:
+                    wi=1
+                else:
+                    wi=w[i]
+                tot[c]-=wi
+                if sites.has_key(x):
+                    where[i]=len(sites[x])
+                    sites[x].append(i)
+                    tot[x]+=wi
+                else:
+                    where[i]=-1
+                self[i]=x
+        if stats!=None:
+            stats.propose(n)
+
+    def __jump(self,i,c,pc,rng,log,stats):
+        """Change letter $2 at position $1 into another one, drawn
+        from the row $3 of a transition matrix."""
+        u=rng.random()*(1-pc[0])
+        for x,q in pc[1]:
+            if u<q:
+                break
+            u-=q
+        if log!=None:
+            log.add(i,c,x)
+        if stats!=None:
+            stats.fire(-1)
+        self[i]=x
+
     def replace(self,i,j):
 	"""Replace nucleotide in position $1 by nucleotide $2.
 	"""
@@ -361,6 +1087,18 @@ allowed.
 	    raise IndexError, 'Bad index.'
 	return
     
+class _JournalSequence(EvolSequence):
+    """An EvolSequence between start_journal() and end_journal(),
+    which records the old letters of the positions it changes."""
+
+    def __setitem__(self, i, c):
+        "(x.__setitem__(i,c) <==> x[i]=c)"
+        j=self._EvolSequence__journal
+        if not j.has_key(i):
+            j[i]=self._Seq__gen[i]
+        self._Seq__gen[i]=c
+
+
 #######################################################################
 #######################################################################
 ########  miscellaneous methods
@@ -385,3 +1123,36 @@ def n_subst(d,n,approx='Rounded'): # no use anymore
         else:
             D=int(D)+1
     return D
+
+def _init_blocks(m,kw,seed):
+    """Keep in this process the model $1, the evolve arguments $2 and
+    a Rng of seed $3 (for the substreams of the blocks) of
+    evolve_blocks."""
+    global _block
+    _block=(m,kw,Rng(seed))
+
+def _evolve_block(task):
+    """Evolve a block of evolve_blocks, and return [number of the
+    block, new letters of the block, EventLog or None, Stats or
+    None]."""
+    m,kw,alea=_block
+    k,st,o,l,seg,d,t,logged,counted=task
+    if logged:
+        log=EventLog()
+    else:
+        log=None
+    if counted:
+        stats=Stats()
+    else:
+        stats=None
+    if kw.get("algo")=="Native":
+        g=EvolSequence()
+    else:
+        g=EvolSequence(store="array")
+    g.read_str(st)
+    g.evolve(m,d,segments=seg,rng=alea.substream(t,k),log=log,stats=stats,
+             **kw)
+    if stats!=None:
+        # the elapsed time is counted by evolve_blocks
+        stats.reset_time()
+    return [k,g.substr(o,o+l),log,stats]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Binary indexed tree module.
+
+Defines a Fenwick tree of non-negative weights over positions
+0..n-1. It keeps partial sums so that updating a weight, computing
+the total weight and finding the position at a given cumulated weight
+are all done in O(log n).
+
+It is used to draw sites proportionally to their substitution rates.
+"""
+
+#######################################################################
+#######################################################################
+########  Class Fenwick
+
+class Fenwick:
+    """A Fenwick holds a weight for each position of a sequence.
+
+    Weights are read with x[i] and changed with x[i]=v.
+    """
+
+    def __init__(self, l=0, val=None):
+        """Create a Fenwick of length $1, with all weights 0.
+
+        Optional argument 'val' is a list of initial weights. In that
+        case, the length is len(val).
+        """
+
+        if val!=None:
+            l=len(val)
+        self.__n=l
+        self.__w=[0.0]*l
+        self.__t=[0.0]*(l+1)
+        if val!=None:
+            t=self.__t
+            for i in range(l):
+                v=float(val[i])
+                self.__w[i]=v
+                j=i+1
+                t[j]+=v
+                k=j+(j & -j)
+                if k<=l:
+                    t[k]+=t[j]
+        self.__top=1
+        while self.__top*2<=l:
+            self.__top*=2
+
+    def __len__(self):
+        "(x.__len__() <==> len(x))"
+        return self.__n
+
+    def __getitem__(self, i):
+        "Return the weight of position $1 (x.__getitem__(i) <==> x[i])."
+        return self.__w[i]
+
+    def __setitem__(self, i, v):
+        """Set the weight of position $1 to $2 (x.__setitem__(i,v)
+<==> x[i]=v)."""
+        v=float(v)
+        d=v-self.__w[i]
+        if d==0:
+            return
+        self.__w[i]=v
+        t=self.__t
+        n=self.__n
+        j=i+1
+        while j<=n:
+            t[j]+=d
+            j+=j & -j
+
+    def cumul(self, i):
+        "Return the sum of the weights of positions [0:$1]."
+        s=0.0
+        t=self.__t
+        while i>0:
+            s+=t[i]
+            i-=i & -i
+        return s
+
+    def total(self):
+        "Return the sum of all the weights."
+        return self.cumul(self.__n)
+
+    def find(self, x):
+        """Return the position i such that cumul(i) <= $1 <
+cumul(i+1).
+
+        $1 should be in [0, total()[. Positions with a null weight are
+        never returned.
+        """
+
+        t=self.__t
+        n=self.__n
+        i=0
+        b=self.__top
+        while b>0:
+            j=i+b
+            if j<=n and t[j]<=x:
+                i=j
+                x-=t[j]
+            b/=2
+        # rounding errors may lead outside or on a null weight
+        if i>=n:
+            i=n-1
+        while i>0 and self.__w[i]==0:
+            i-=1
+        return i
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Interval index module.
+
+Defines an IntervalIndex over the ranges of a dictionary of models,
+as given to EvolSequence.evolve_seg. The ranges are cut at all their
+ends into elementary intervals, each with the list of the models
+which cover it, so that the models of a position are found by a
+binary search.
+"""
+
+import array
+import bisect
+import random
+
+#######################################################################
+#######################################################################
+########  Class IntervalIndex
+
+class IntervalIndex:
+    """An IntervalIndex gives the models which apply at each position.
+
+    It also draws the proposals of evolve_seg: an elementary interval
+    is drawn proportionally to its length times the sum of the
+    maximum rates of its models, then a position in it, then one of
+    its models proportionally to its maximum rate.
+    """
+
+    def __init__(self, dmod):
+        """Create an IntervalIndex from dictionary $1, which items are
+        (deb,fin):mod where model mod applies to the positions in
+        range [deb:fin] (fin is excluded).
+        """
+
+        self.__ranges=[]
+        ends={}
+        for v in dmod.keys():
+            deb,fin=min(v),max(v)
+            if fin>deb:
+                self.__ranges.append([deb,fin,dmod[v]])
+                ends[deb]=1
+                ends[fin]=1
+        self.__bounds=ends.keys()
+        self.__bounds.sort()
+
+        # models of each elementary interval, in the order of dmod
+        n=max(0,len(self.__bounds)-1)
+        self.__mod=[[] for i in range(n)]
+        for deb,fin,m in self.__ranges:
+            i=bisect.bisect_left(self.__bounds,deb)
+            j=bisect.bisect_left(self.__bounds,fin)
+            for k in range(i,j):
+                self.__mod[k].append(m)
+
+        self.__max=[[m._Model__max for m in l] for l in self.__mod]
+        self.__smax=[sum(l) for l in self.__max]
+        self.__cum=array.array('d')
+        t=0.0
+        for k in range(n):
+            t+=(self.__bounds[k+1]-self.__bounds[k])*self.__smax[k]
+            self.__cum.append(t)
+        self.__tot=t
+
+    def __len__(self):
+        "Return the number of elementary intervals."
+        return len(self.__mod)
+
+    def at(self, pos):
+        "Return the list of the models which apply at position $1."
+        k=bisect.bisect_right(self.__bounds,pos)-1
+        if k<0 or k>=len(self.__mod):
+            return []
+        return self.__mod[k]
+
+    def segments(self):
+        "Return the list of the ranges [deb,fin] of the models."
+        return [[deb,fin] for deb,fin,m in self.__ranges]
+
+    def length(self):
+        "Return the sum of the lengths of the ranges."
+        l=0
+        for deb,fin,m in self.__ranges:
+            l+=fin-deb
+        return l
+
+    def total(self):
+        """Return the sum over the ranges of their length times the
+        maximum rate of their model."""
+        return self.__tot
+
+    def max_rate(self):
+        """Return the maximum over the positions of the sum of the
+        maximum rates of their models."""
+        return max(self.__smax+[0])
+
+    def model_at(self, pos, u):
+        """Return the model of position $1 on which value $2 falls,
+        the maximum rates of the models of $1 being laid end to end
+        from 0, or None if $2 is beyond their sum."""
+
+        k=bisect.bisect_right(self.__bounds,pos)-1
+        if k<0 or k>=len(self.__mod):
+            return None
+        l=self.__max[k]
+        for j in range(len(l)):
+            if u<l[j]:
+                return self.__mod[k][j]
+            u-=l[j]
+        return None
+
+    def pick(self, rng=random):
+        """Return a random (position, model), with random generator
+        $1 (default: the random module)."""
+
+        if self.__tot<=0:
+            raise ValueError, "Nothing to draw."
+        u=rng.random()*self.__tot
+        k=bisect.bisect_right(self.__cum,u)
+        if k>=len(self.__mod): # rounding errors
+            k=len(self.__mod)-1
+        while self.__smax[k]<=0:
+            k-=1
+        if k>0:
+            u-=self.__cum[k-1]
+        lg=self.__bounds[k+1]-self.__bounds[k]
+        i=min(int(u/self.__smax[k]),lg-1)
+        u-=i*self.__smax[k]
+        l=self.__max[k]
+        j=0
+        while j<len(l)-1 and u>=l[j]:
+            u-=l[j]
+            j+=1
+        return self.__bounds[k]+i,self.__mod[k][j]
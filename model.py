@@ -12,9 +12,13 @@ __date__ = "17 October 2007"
 __credits__ = """Guido van Rossum, for an excellent programming language."""
 
 import re
+import math
 
 from compte import *
 
+# transition matrices kept by a Model, at most
+_MAX_TRANS=1000
+
 #######################################################################
 #######################################################################
 ########  Class Model
@@ -50,12 +54,244 @@ class Model(Proportion):
 	
 	Keyword argument to build directly the Model from a file in
 	the appropriate format: [fic=string].
+
+	Keyword argument to build it from a string in this format:
+	[str=string].
+
+	Keyword arguments to build it from rates, without any text:
+	[matrix=list] is a square matrix of the rates of the simple
+	substitutions, matrix[i][j] being the rate from the i-th to the
+	j-th letter of [alph=string] (default: "ACGT"); [rules=list]
+	is a list of [left, letter, right, target, rate], as given by
+	rules(), which contexts left and right may be empty. Rates are
+	kept without rounding, null rates are dropped, and the
+	substitutions of a letter keep the order of matrix then
+	rules.
     	"""
 	
-	Proportion.__init__(self,**kw)#fic=kw['fic'])
-	self.__a=self.alph_upper() #upper-case letters only
-	self.__next_all=self.next_all()
-	self.__max=self.max_subst()
+	if kw.has_key("matrix") or kw.has_key("rules"):
+            Proportion.__init__(self)
+            self.__from_rates(kw.get("matrix",[]),kw.get("alph","ACGT"),
+                              kw.get("rules",[]))
+        else:
+            Proportion.__init__(self,**kw)#fic=kw['fic'])
+            self.__a=self.alph_upper() #upper-case letters only
+            self.__next_all=self.next_all()
+            self.__max=self.max_subst()
+	self.compile()
+
+    def __from_rates(self, matrix, alph, rules):
+        """Fill the Model with the rates of square matrix $1 on
+        letters $2, and with the substitutions of list $3."""
+
+        if len(matrix)>len(alph):
+            raise ValueError, "Matrix larger than the alphabet."
+        l=[]
+        for i in range(len(matrix)):
+            if len(matrix[i])!=len(matrix):
+                raise ValueError, "Matrix is not square."
+            for j in range(len(matrix)):
+                if i!=j:
+                    l.append(["",alph[i],"",alph[j],matrix[i][j]])
+        l+=rules
+
+        self.__a=[]
+        self.__next_all={}
+        d={}
+        for left,c,right,t,v in l:
+            c=c.upper()
+            if len(c)!=1 or len(t)!=1 or not c.isalpha():
+                raise ValueError, "Bad substitution %s|%s." % (c,t)
+            if v<0:
+                raise ValueError, "Negative rate for %s|%s." % (c,t)
+            if c not in self.__a:
+                self.__a.append(c)
+                self.__next_all[c]=[]
+            if v==0:
+                continue
+            k=(left.upper(),c,right.upper(),t)
+            self._Proportion__add(k[0].lower()+c+k[2].lower(),t,v)
+            if d.has_key(k): # same substitution given twice
+                d[k][3]+=v
+            else:
+                d[k]=[k[0],k[2],t,v]
+                self.__next_all[c].append(d[k])
+        for t in [k[3] for k in d if k[3].isupper()]:
+            if t not in self.__a:
+                self.__a.append(t)
+                self.__next_all[t]=[]
+        self.__max=0
+        for c in self.__a:
+            self.__max=max(self.__max,sum([k[3] for k in self.__next_all[c]]))
+
+    def compile(self):
+        """Compile the substitutions into a table indexed by the
+        windows of neighbours.
+
+        A window is the string of the lg_left() letters before a
+        position, the letter at this position and the lg_right()
+        letters after it, '^' standing for the outside of the
+        sequence. The table is filled the first time a window is met.
+        """
+
+        self.__rules=[]
+        self.__lleft=0
+        self.__lright=0
+        a=self.__a[:]
+        a.sort()
+        for c in a:
+            for k in self.__next_all[c]:
+                self.__rules.append([k[0],c,k[1],k[2],k[3]])
+                if len(k[0])>self.__lleft:
+                    self.__lleft=len(k[0])
+                if len(k[1])>self.__lright:
+                    self.__lright=len(k[1])
+        self.__table={}
+        self.__misses={}
+        self.__trans={}
+
+    def rules(self):
+        """Return the list of the substitutions, as
+        [left, letter, right, target, rate].
+
+        The index of a substitution in this list is its number in the
+        results of lookup().
+        """
+
+        return self.__rules
+
+    def letter_max(self):
+        """Return the dictionary {letter: sum of the rates of its
+        substitutions}, an upper bound of the substitution rate of a
+        position holding this letter, whatever its neighbours."""
+        d=dict.fromkeys(self.__a,0)
+        for k in self.__rules:
+            if k[3]!=k[1]:
+                d[k[1]]+=k[4]
+        return d
+
+    def has_contexts(self):
+        "Return True if some substitution depends on neighbours."
+        return self.__lleft>0 or self.__lright>0
+
+    def transition(self,t):
+        """Return the transition matrix after time $1, as a dictionary
+        {letter: [probability to stay, [[letter, probability],...]]}
+        for a Model without contexts.
+
+        The matrix exponential is computed by scaling and squaring.
+        The last matrices are kept, up to _MAX_TRANS of them.
+        """
+
+        if self.__trans.has_key(t):
+            return self.__trans[t]
+        if self.has_contexts():
+            raise ValueError, "The Model has contexts."
+        a=self.__a[:]
+        a.sort()
+        n=len(a)
+        ind=dict([[a[i],i] for i in range(n)])
+        q=[[0.0]*n for i in range(n)]
+        for k in self.__rules:
+            if k[3]!=k[1] and ind.has_key(k[3]):
+                q[ind[k[1]]][ind[k[3]]]+=k[4]*t
+                q[ind[k[1]]][ind[k[1]]]-=k[4]*t
+
+        # scale so that the norm is below 1/2
+        nm=max([sum([abs(x) for x in l]) for l in q]+[0])
+        sq=0
+        if nm>0.5:
+            sq=int(math.ceil(math.log(nm/0.5,2)))
+        f=2.0**-sq
+        q=[[x*f for x in l] for l in q]
+        p=[[float(i==j) for j in range(n)] for i in range(n)]
+        term=[l[:] for l in p]
+        for k in range(1,20):
+            term=_mult(term,q)
+            term=[[x/k for x in l] for l in term]
+            p=[[p[i][j]+term[i][j] for j in range(n)] for i in range(n)]
+        for k in range(sq):
+            p=_mult(p,p)
+
+        d={}
+        for i in range(n):
+            d[a[i]]=[p[i][i],[[a[j],max(0.0,p[i][j])] for j in range(n)
+                              if j!=i]]
+        if len(self.__trans)>=_MAX_TRANS:
+            self.__trans.clear()
+        self.__trans[t]=d
+        return d
+
+    def lg_left(self):
+        "Return the length of the longest left context."
+        return self.__lleft
+
+    def lg_right(self):
+        "Return the length of the longest right context."
+        return self.__lright
+
+    def window(self,seq,pos):
+        """Return the window of the neighbours of position $2 in
+        sequence $1.
+        """
+
+        i=pos-self.__lleft
+        j=pos+self.__lright+1
+        w=seq.substr(i,j)
+        if i<0:
+            w="^"*(-i)+w
+        if j>len(seq):
+            w+="^"*(j-len(seq))
+        return w
+
+    def lookup(self,w):
+        """Return the list of [target, rate, number] of the
+        substitutions that can occur in the middle of window $1.
+        """
+
+        if self.__table.has_key(w):
+            return self.__table[w]
+        l=[]
+        p=self.__lleft
+        c=w[p]
+        for n in range(len(self.__rules)):
+            k=self.__rules[n]
+            if k[1]==c and k[3]!=c and \
+               w[p-len(k[0]):p]==k[0] and w[p+1:p+1+len(k[2])]==k[2]:
+                l.append([k[3],k[4],n])
+        self.__table[w]=l
+        return l
+
+    def misses(self,w):
+        """Return the list of [cause, rate] of the substitutions of
+        the letter in the middle of window $1 which cannot occur, the
+        cause being 'left' or 'right' for the context which does not
+        match, or 'same' for a substitution to the same letter.
+        """
+
+        if self.__misses.has_key(w):
+            return self.__misses[w]
+        l=[]
+        p=self.__lleft
+        c=w[p]
+        for k in self.__rules:
+            if k[1]!=c:
+                continue
+            if k[3]==c:
+                l.append(["same",k[4]])
+            elif w[p-len(k[0]):p]!=k[0]:
+                l.append(["left",k[4]])
+            elif w[p+1:p+1+len(k[2])]!=k[2]:
+                l.append(["right",k[4]])
+        self.__misses[w]=l
+        return l
+
+    def rules_at(self,seq,pos):
+        """Return the list of [target, rate, number] of the
+        substitutions that can occur at position $2 in sequence $1.
+        """
+
+        return self.lookup(self.window(seq,pos))
         
     def next_extended(self,s):
 	"""Return the dictionary of {prefix:[[postfix, value],
@@ -122,3 +358,13 @@ class Model(Proportion):
 	    if i.isupper():
 		a+=i
         return a
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def _mult(a,b):
+    "Return the product of square matrices $1 and $2."
+    n=len(a)
+    return [[sum([a[i][k]*b[k][j] for k in range(n)]) for j in range(n)]
+            for i in range(n)]
@@ -1,3 +1,20 @@
+"""Classical models of substitution, with optional CpG effects.
+
+Each function returns the text of a model, in the format of
+model.Model, or, with keyword argument compiled=True, the Model
+itself, built from the rates without text, so without their rounding
+to six decimals. Compiled Models are kept by parameters, and the same
+Model is returned for the same parameters.
+"""
+
+import model
+
+# compiled Models, by (name, parameters)
+_models={}
+_MAX_MODELS=1000
+# [left, letter, right, target] of the substitutions, by text
+_parsed={}
+
 def JC(**kw):
     """ Jukes and Cantor 1969.
     Normalised such that the substitution rate on a stationnary
@@ -8,34 +25,39 @@ rCgT: relative rate (with C->T) of neighbour dependant
 rcGA: relative rate (with G->A) of neighbour dependant
      CpG -> CpA mutations (default: 0)
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
 
     rCgT=kw.get("rCgT",0)
     rcGA=kw.get("rcGA",0)
     eta=kw.get("eta",1)
 
-    for s in ["rCgT","rcGA","eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("JC",rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
+
+    _positive(rCgT=rCgT,rcGA=rcGA,eta=eta)
 
     eta2=eta/3.0
     
-    s=""
-    s+="A|C %f\n"%eta2
-    s+="A|G %f\n"%eta2
-    s+="A|T %f\n"%eta2
-    s+="C|A %f\n"%eta2
-    s+="C|G %f\n"%eta2
-    s+="C|T %f\n"%eta2
-    s+="G|A %f\n"%eta2
-    s+="G|C %f\n"%eta2
-    s+="G|T %f\n"%eta2
-    s+="T|A %f\n"%eta2
-    s+="T|C %f\n"%eta2
-    s+="T|G %f\n"%eta2
-    s+="Cg|T %f\n"%(rCgT*eta2)
-    s+="cG|A %f\n"%(rCgT*eta2)
-
-    return s
+    l=[]
+    l.append(["A|C",eta2])
+    l.append(["A|G",eta2])
+    l.append(["A|T",eta2])
+    l.append(["C|A",eta2])
+    l.append(["C|G",eta2])
+    l.append(["C|T",eta2])
+    l.append(["G|A",eta2])
+    l.append(["G|C",eta2])
+    l.append(["G|T",eta2])
+    l.append(["T|A",eta2])
+    l.append(["T|C",eta2])
+    l.append(["T|G",eta2])
+    l.append(["Cg|T",rCgT*eta2])
+    l.append(["cG|A",rCgT*eta2])
+
+    return _result(key,l,kw)
 
 def K80(**kw):
     """ Kimura 1980.
@@ -48,36 +70,41 @@ rCgT: relative rate (with C->T) of neighbour dependant
 rcGA: relative rate (with G->A) of neighbour dependant
      CpG -> CpA mutations (default: 0)
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
     kappa=kw.get("kappa",1)
     rCgT=kw.get("rCgT",0)
     rcGA=kw.get("rcGA",0)
     eta=kw.get("eta",1)
 
-    for s in ["kappa","rCgT","rcGA","eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("K80",kappa,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
+
+    _positive(kappa=kappa,rCgT=rCgT,rcGA=rcGA,eta=eta)
     
     eta2=eta/(kappa+2.0)
 
-    s=""
-    s+="A|C %f\n"%eta2
-    s+="A|G %f\n"%(kappa*eta2)
-    s+="A|T %f\n"%eta2
-    s+="C|A %f\n"%eta2
-    s+="C|G %f\n"%eta2
-    s+="C|T %f\n"%(kappa*eta2)
-    s+="G|A %f\n"%(kappa*eta2)
-    s+="G|C %f\n"%eta2
-    s+="G|T %f\n"%eta2
-    s+="T|A %f\n"%eta2
-    s+="T|C %f\n"%(kappa*eta2)
-    s+="T|G %f\n"%eta2
+    l=[]
+    l.append(["A|C",eta2])
+    l.append(["A|G",kappa*eta2])
+    l.append(["A|T",eta2])
+    l.append(["C|A",eta2])
+    l.append(["C|G",eta2])
+    l.append(["C|T",kappa*eta2])
+    l.append(["G|A",kappa*eta2])
+    l.append(["G|C",eta2])
+    l.append(["G|T",eta2])
+    l.append(["T|A",eta2])
+    l.append(["T|C",kappa*eta2])
+    l.append(["T|G",eta2])
     if rCgT!=0:
-        s+="Cg|T %f\n"%(rCgT*kappa*eta2)
+        l.append(["Cg|T",rCgT*kappa*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*kappa*eta2)
+        l.append(["cG|A",rcGA*kappa*eta2])
     
-    return s
+    return _result(key,l,kw)
 
 
 def T92(**kw):
@@ -92,6 +119,8 @@ rCgT: relative rate (with C->T) of neighbour dependant
 rcGA: relative rate (with G->A) of neighbour dependant
      CpG -> CpA mutations (default: 0)
 eta: relative rate with no-dependant model(default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
     rCgT=kw.get("rCgT",0)
     rcGA=kw.get("rcGA",0)
@@ -99,33 +128,35 @@ eta: relative rate with no-dependant model(default=1)
     theta=kw.get("theta",0.5)
     eta=kw.get("eta",1)
     
-    for s in ["kappa","theta", "rCgT","rcGA", "eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("T92",kappa,theta,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
+
+    _positive(kappa=kappa,theta=theta,rCgT=rCgT,rcGA=rcGA,eta=eta)
         
-    for s in ["theta"]:
-        exec("if "+s+" >1: raise ValueError, 'Bad value for "+s+"'")
+    _proportion(theta=theta)
 
     eta2=eta/(1.0+2*theta*kappa-2*theta*theta*kappa)
 
-    s=""
-    s+="A|C %f\n"%(theta*eta2)
-    s+="A|G %f\n"%(theta*kappa*eta2)
-    s+="A|T %f\n"%((1-theta)*eta2)
-    s+="C|A %f\n"%((1-theta)*eta2)
-    s+="C|G %f\n"%(theta*eta2)
-    s+="C|T %f\n"%((1-theta)*kappa*eta2)
-    s+="G|A %f\n"%((1-theta)*kappa*eta2)
-    s+="G|C %f\n"%(theta*eta2)
-    s+="G|T %f\n"%((1-theta)*eta2)
-    s+="T|A %f\n"%((1-theta)*eta2)
-    s+="T|C %f\n"%(theta*kappa*eta2)
-    s+="T|G %f\n"%(theta*eta2)
+    l=[]
+    l.append(["A|C",theta*eta2])
+    l.append(["A|G",theta*kappa*eta2])
+    l.append(["A|T",(1-theta)*eta2])
+    l.append(["C|A",(1-theta)*eta2])
+    l.append(["C|G",theta*eta2])
+    l.append(["C|T",(1-theta)*kappa*eta2])
+    l.append(["G|A",(1-theta)*kappa*eta2])
+    l.append(["G|C",theta*eta2])
+    l.append(["G|T",(1-theta)*eta2])
+    l.append(["T|A",(1-theta)*eta2])
+    l.append(["T|C",theta*kappa*eta2])
+    l.append(["T|G",theta*eta2])
     if rCgT!=0:
-        s+="Cg|T %f\n"%(rCgT*(1-theta)*kappa*eta2)
+        l.append(["Cg|T",rCgT*(1-theta)*kappa*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*(1-theta)*kappa*eta2)
+        l.append(["cG|A",rcGA*(1-theta)*kappa*eta2])
 
-    return s
+    return _result(key,l,kw)
 
 
 def HKY85(**kw):
@@ -146,6 +177,8 @@ rCgT: relative rate (with C->T) of neighbour dependant
 rcGA: relative rate (with G->A) of neighbour dependant
     CpG -> CpA mutations (default: 0)
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
     kappa=kw.get("kappa",1)
     theta=kw.get("theta",0.5)
@@ -155,11 +188,14 @@ eta: rate (default=1)
     rcGA=kw.get("rcGA",0)
     eta=kw.get("eta",1)
     
-    for s in ["kappa","theta","theta1","theta2","rCgT","rcGA","eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("HKY85",kappa,theta,theta1,theta2,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
+
+    _positive(kappa=kappa,theta=theta,theta1=theta1,theta2=theta2,
+              rCgT=rCgT,rcGA=rcGA,eta=eta)
 
-    for s in ["theta","theta1","theta2"]:
-        exec("if "+s+" >1: raise ValueError, 'Bad value for "+s+"'")
+    _proportion(theta=theta,theta1=theta1,theta2=theta2)
 
     piA=theta1*(1-theta)
     piC=(1-theta2)*theta
@@ -168,25 +204,25 @@ eta: rate (default=1)
 
     eta2=eta/(2.0*(piA*piC+piC*piG+piA*piT+piG*piT+kappa*(piC*piT+piA*piG)))
 
-    s=""
-    s+="A|C %f\n"%(piC*eta2)
-    s+="A|G %f\n"%(kappa*piG*eta2)
-    s+="A|T %f\n"%(piT*eta2)
-    s+="C|A %f\n"%(piA*eta2)
-    s+="C|G %f\n"%(piG*eta2)
-    s+="C|T %f\n"%(kappa*piT*eta2)
-    s+="G|A %f\n"%(kappa*piA*eta2)
-    s+="G|C %f\n"%(piC*eta2)
-    s+="G|T %f\n"%(piT*eta2)
-    s+="T|A %f\n"%(piA*eta2)
-    s+="T|C %f\n"%(kappa*piC*eta2)
-    s+="T|G %f\n"%(piG*eta2)
+    l=[]
+    l.append(["A|C",piC*eta2])
+    l.append(["A|G",kappa*piG*eta2])
+    l.append(["A|T",piT*eta2])
+    l.append(["C|A",piA*eta2])
+    l.append(["C|G",piG*eta2])
+    l.append(["C|T",kappa*piT*eta2])
+    l.append(["G|A",kappa*piA*eta2])
+    l.append(["G|C",piC*eta2])
+    l.append(["G|T",piT*eta2])
+    l.append(["T|A",piA*eta2])
+    l.append(["T|C",kappa*piC*eta2])
+    l.append(["T|G",piG*eta2])
     if rCgT!=0:    
-        s+="Cg|T %f\n"%(rCgT*kappa*piT*eta2)
+        l.append(["Cg|T",rCgT*kappa*piT*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*kappa*piT*eta2)
+        l.append(["cG|A",rcGA*kappa*piT*eta2])
 
-    return s
+    return _result(key,l,kw)
 
 
 
@@ -206,6 +242,8 @@ theta2: ratio of equilibrium frequency of G on equilibrium
 rCT: relative rate (with C->T) of neighbour dependant
      CpG -> TpG mutations.
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
 
     rCgT=kw.get("rCgT",0)
@@ -217,11 +255,14 @@ eta: rate (default=1)
     theta2=kw.get("theta2",0.5)
     eta=kw.get("eta",1)
 
-    for s in ["kappa1","kappa2","theta","theta1","theta2","rCgT","rcGA","eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("TN93",kappa1,kappa2,theta,theta1,theta2,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
 
-    for s in ["theta","theta1","theta2"]:
-        exec("if "+s+" >1: raise ValueError, 'Bad value for "+s+"'")
+    _positive(kappa1=kappa1,kappa2=kappa2,theta=theta,theta1=theta1,
+              theta2=theta2,rCgT=rCgT,rcGA=rcGA,eta=eta)
+
+    _proportion(theta=theta,theta1=theta1,theta2=theta2)
 
     piA=theta1*(1-theta)
     piC=(1-theta2)*theta
@@ -230,29 +271,29 @@ eta: rate (default=1)
 
     eta2=eta/(2.0*(piA*piC+piC*piG+piA*piT+piG*piT+kappa2*piC*piT+kappa1*piA*piG))
 
-    s=""
-    s+="A|C %f\n"%(piC*eta2)
-    s+="A|G %f\n"%(kappa1*piG*eta2)
-    s+="A|T %f\n"%(piT*eta2)
-    s+="C|A %f\n"%(piA*eta2)
-    s+="C|G %f\n"%(piG*eta2)
-    s+="C|T %f\n"%(kappa2*piT*eta2)
-    s+="G|A %f\n"%(kappa1*piA*eta2)
-    s+="G|C %f\n"%(piC*eta2)
-    s+="G|T %f\n"%(piT*eta2)
-    s+="T|A %f\n"%(piA*eta2)
-    s+="T|C %f\n"%(kappa2*piC*eta2)
-    s+="T|G %f\n"%(piG*eta2)
+    l=[]
+    l.append(["A|C",piC*eta2])
+    l.append(["A|G",kappa1*piG*eta2])
+    l.append(["A|T",piT*eta2])
+    l.append(["C|A",piA*eta2])
+    l.append(["C|G",piG*eta2])
+    l.append(["C|T",kappa2*piT*eta2])
+    l.append(["G|A",kappa1*piA*eta2])
+    l.append(["G|C",piC*eta2])
+    l.append(["G|T",piT*eta2])
+    l.append(["T|A",piA*eta2])
+    l.append(["T|C",kappa2*piC*eta2])
+    l.append(["T|G",piG*eta2])
     if rCgT!=0:
-        s+="Cg|T %f\n"%(rCgT*kappa2*piT*eta2)
+        l.append(["Cg|T",rCgT*kappa2*piT*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*kappa2*piT*eta2)
+        l.append(["cG|A",rcGA*kappa2*piT*eta2])
 
-    return s
+    return _result(key,l,kw)
 
 
 
-def F84(*kw):
+def F84(**kw):
     
     """ Felsenstein 1984.
     Normalised such that the substitution rate on a stationnary
@@ -268,6 +309,8 @@ theta2: ratio of equilibrium frequency of G on equilibrium
 rCT: relative rate (with C->T) of neighbour dependant
      CpG -> TpG mutations.
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
     kappa=kw.get("kappa",1)
     theta=kw.get("theta",0.5)
@@ -277,11 +320,14 @@ eta: rate (default=1)
     rcGA=kw.get("rcGA",0)
     eta=kw.get("eta",1)
 
-    for s in ["kappa","theta","theta1","theta2","rCgT","rcGA","eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("F84",kappa,theta,theta1,theta2,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
+
+    _positive(kappa=kappa,theta=theta,theta1=theta1,theta2=theta2,
+              rCgT=rCgT,rcGA=rcGA,eta=eta)
 
-    for s in ["theta","theta1","theta2"]:
-        exec("if "+s+" >1: raise ValueError, 'Bad value for "+s+"'")
+    _proportion(theta=theta,theta1=theta1,theta2=theta2)
 
     piA=theta1*(1-theta)
     piC=(1-theta2)*theta
@@ -292,25 +338,25 @@ eta: rate (default=1)
     
     eta2=eta/(2.0*kappa*(piC*piT/(piC+piT)+piA*piG/(piA+piG))-piC*piC-piG*piG-piT*piT-piA*piA+1)
 
-    s=""
-    s+="A|C %f\n"%(piC*eta2)
-    s+="A|G %f\n"%((1+kappa/piR)*piG*eta2)
-    s+="A|T %f\n"%(piT*eta2)
-    s+="C|A %f\n"%(piA*eta2)
-    s+="C|G %f\n"%(piG*eta2)
-    s+="C|T %f\n"%((1+kappa/piY)*piT*eta2)
-    s+="G|A %f\n"%((1+kappa/piR)*piA*eta2)
-    s+="G|C %f\n"%(piC*eta2)
-    s+="G|T %f\n"%(piT*eta2)
-    s+="T|A %f\n"%(piA*eta2)
-    s+="T|C %f\n"%((1+kappa/piY)*piC*eta2)
-    s+="T|G %f\n"%(piG*eta2)
+    l=[]
+    l.append(["A|C",piC*eta2])
+    l.append(["A|G",(1+kappa/piR)*piG*eta2])
+    l.append(["A|T",piT*eta2])
+    l.append(["C|A",piA*eta2])
+    l.append(["C|G",piG*eta2])
+    l.append(["C|T",(1+kappa/piY)*piT*eta2])
+    l.append(["G|A",(1+kappa/piR)*piA*eta2])
+    l.append(["G|C",piC*eta2])
+    l.append(["G|T",piT*eta2])
+    l.append(["T|A",piA*eta2])
+    l.append(["T|C",(1+kappa/piY)*piC*eta2])
+    l.append(["T|G",piG*eta2])
     if rCgT!=0:
-        s+="Cg|T %f\n"%(rCgT*(1+kappa/piY)*piT*eta2)
+        l.append(["Cg|T",rCgT*(1+kappa/piY)*piT*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*(1+kappa/piY)*piT*eta2)
+        l.append(["cG|A",rcGA*(1+kappa/piY)*piT*eta2])
 
-    return s
+    return _result(key,l,kw)
 
 
 
@@ -339,6 +385,8 @@ rCgT: relative rate (with C->T) of neighbour dependant
 rcGA: relative rate (with G->A) of neighbour dependant
      CpG -> CpA mutations (default: 0)
 eta: rate (default=1)
+compiled: if true, return the compiled Model instead of its text
+     (default: False)
 """
 
     a=kw.get("a",1)
@@ -353,11 +401,14 @@ eta: rate (default=1)
     rcGA=kw.get("rcGA",0)
     eta=kw.get("eta",1)
 
-    for s in ["a", "b", "c", "d", "e", "theta","theta1","theta2","rCgT", "rcGA", "eta"]:
-        exec("if "+s+" <0: raise ValueError, 'Bad value for "+s+"'")
+    key=("GTR",a,b,c,d,e,theta,theta1,theta2,rCgT,rcGA,eta)
+    if kw.get("compiled",False) and _models.has_key(key):
+        return _models[key]
 
-    for s in ["theta","theta1","theta2"]:
-        exec("if "+s+" >1: raise ValueError, 'Bad value for "+s+"'")
+    _positive(a=a,b=b,c=c,d=d,e=e,theta=theta,theta1=theta1,
+              theta2=theta2,rCgT=rCgT,rcGA=rcGA,eta=eta)
+
+    _proportion(theta=theta,theta1=theta1,theta2=theta2)
 
     piA=theta1*(1-theta)
     piC=(1-theta2)*theta
@@ -368,23 +419,59 @@ eta: rate (default=1)
 
     eta2=eta/(2.0*(a*piC*piT+b*piA*piT+c*piC*piG+d*piA*piC+e*piC*piG+piA*piG))
     
-    s=""
-    s+="A|C %f\n"%(d*piC*eta2)
-    s+="A|G %f\n"%(piG*eta2)
-    s+="A|T %f\n"%(b*piT*eta2)
-    s+="C|A %f\n"%(d*piA*eta2)
-    s+="C|G %f\n"%(e*piG*eta2)
-    s+="C|T %f\n"%(a*piT*eta2)
-    s+="G|A %f\n"%(piA*eta2)
-    s+="G|C %f\n"%(e*piC*eta2)
-    s+="G|T %f\n"%(c*piT*eta2)
-    s+="T|A %f\n"%(b*piA*eta2)
-    s+="T|C %f\n"%(a*piC*eta2)
-    s+="T|G %f\n"%(c*piG*eta2)
+    l=[]
+    l.append(["A|C",d*piC*eta2])
+    l.append(["A|G",piG*eta2])
+    l.append(["A|T",b*piT*eta2])
+    l.append(["C|A",d*piA*eta2])
+    l.append(["C|G",e*piG*eta2])
+    l.append(["C|T",a*piT*eta2])
+    l.append(["G|A",piA*eta2])
+    l.append(["G|C",e*piC*eta2])
+    l.append(["G|T",c*piT*eta2])
+    l.append(["T|A",b*piA*eta2])
+    l.append(["T|C",a*piC*eta2])
+    l.append(["T|G",c*piG*eta2])
     if rCgT!=0:
-        s+="Cg|T %f\n"%(rCgT*a*piT*eta2)
+        l.append(["Cg|T",rCgT*a*piT*eta2])
     if rcGA!=0:
-        s+="cG|A %f\n"%(rcGA*a*piT*eta2)
-
-    return s
-
+        l.append(["cG|A",rcGA*a*piT*eta2])
+
+    return _result(key,l,kw)
+
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def _positive(**kw):
+    "Raise ValueError if a keyword argument is negative."
+    for s,v in kw.items():
+        if v<0:
+            raise ValueError, 'Bad value for '+s
+
+def _proportion(**kw):
+    "Raise ValueError if a keyword argument is above 1."
+    for s,v in kw.items():
+        if v>1:
+            raise ValueError, 'Bad value for '+s
+
+def _result(key, l, kw):
+    """Return the text of the list $2 of [substitution, rate], or if
+    $3 has a true 'compiled' key, the Model of these substitutions,
+    kept with key $1."""
+
+    if not kw.get("compiled",False):
+        return "".join(["%s %f\n" % (r,v) for r,v in l])
+    rules=[]
+    for r,v in l:
+        if not _parsed.has_key(r):
+            pr,t=r.split("|")
+            i=[c.isupper() for c in pr].index(True)
+            _parsed[r]=[pr[:i],pr[i],pr[i+1:],t]
+        rules.append(_parsed[r]+[v])
+    if len(_models)>=_MAX_MODELS:
+        _models.clear()
+    m=model.Model(rules=rules)
+    _models[key]=m
+    return m
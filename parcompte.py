@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""Parallel word counts module.
+
+Counts the words of many sequences, of a long sequence or of FASTA
+files with a pool of processes. The work is cut into shards: groups
+of sequences, ranges of a long sequence (with an overlap of lg-1
+letters, so that the words across the ends of the ranges are counted
+once), or groups of FASTA records, long records being cut into ranges
+of bytes with the same overlap. Each task carries only its own
+letters, or its place in the files. Each process counts its shards in
+a Compte (or a DenseCompte), and the partial counts are merged by
+pairs, in a tree of depth log2 of the number of shards.
+
+The partial counts move between processes in a compact form, not as
+pickled tries: the list of the counted words and the array of their
+counts, or the array of a DenseCompte.
+"""
+
+import array
+import multiprocessing
+import os
+
+import compte
+import densecompte
+
+_job=None # data of the counting in the current process
+
+#######################################################################
+#######################################################################
+########  functions
+
+def count_seqs(seqs, lg, **kw):
+    """Return the counts of the words of length at most $2 of the
+sequences of list $1 (strings or EvolSequences), as Compte.add_seq
+does on each of them.
+
+Keyword argument for the number of processes: [workers=int]
+(default: 1). Keyword argument for the number of shards:
+[shards=int] (default: workers); the sequences are cut into shards of
+about the same number of letters.
+
+Keyword argument for a DenseCompte of the words of length $2:
+[dense=bool] (default: False), and for its alphabet: [alph=string]
+(default: 'ACGT').
+
+Keyword argument: [fact=number] counts each word fact (default: 1).
+"""
+
+    seqs=[_string(s) for s in seqs]
+    n=_nb_shards(kw,len(seqs))
+    # cut the list into n shards of about the same length
+    tot=sum([len(s) for s in seqs])
+    shards=[[] for i in range(n)]
+    t=0
+    for s in seqs:
+        shards[min(n-1,t*n/max(1,tot))].append(s)
+        t+=len(s)
+    return _count(_count_seqs,[x for x in shards if x!=[]],lg,kw)
+
+def count_seq(s, lg, **kw):
+    """Return the counts of the words of length at most $2 of
+sequence $1, as Compte.add_seq does, the sequence being cut into
+ranges.
+
+Keyword arguments [workers=int], [shards=int], [dense=bool],
+[alph=string] and [fact=number] as in count_seqs.
+"""
+
+    s=_string(s)
+    n=_nb_shards(kw,len(s))
+    l=len(s)
+    o=max(0,lg-1)
+    # each range with the overlap after it and the letter before it
+    ranges=[]
+    for i in range(n):
+        a,b=i*l/n,(i+1)*l/n
+        if b>a:
+            ranges.append((s[a:b+o],b-a,a==0,b+o>=l,s[a-1:a]))
+    return _count(_count_range,ranges,lg,kw)
+
+def count_files(files, lg, **kw):
+    """Return the counts of the words of length at most $2 of the
+sequences of the FASTA files of list $1 (or of file $1), as
+Compte.add_file does.
+
+The records of the files are cut into shards of about the same
+number of bytes. A record longer than a shard is cut at the
+beginnings of lines into ranges of bytes, each one being counted with
+the lg-1 letters after it.
+
+Keyword arguments [workers=int], [shards=int], [dense=bool],
+[alph=string] and [fact=number] as in count_seqs. Keyword argument:
+[chunk=int] is the number of letters read at once (default:
+1048576).
+"""
+
+    if isinstance(files,str):
+        files=[files]
+    # byte ranges of the records
+    recs=[]
+    for nf in files:
+        size=os.path.getsize(nf)
+        pos=compte.fasta_records(nf)
+        if pos==[] or pos[0]>0:
+            pos=[0]+pos
+        for i in range(len(pos)):
+            if i+1<len(pos):
+                recs.append((nf,pos[i],pos[i+1]))
+            else:
+                recs.append((nf,pos[i],size))
+    tot=sum([x[2]-x[1] for x in recs])
+    n=_nb_shards(kw,max(len(recs),tot))
+    # ranges of at most about tot/n bytes: (file, beg, end, end of
+    # the record, letter before beg or "" at the beginning)
+    ranges=[]
+    for nf,a,b in recs:
+        if n>1 and b-a>tot/n:
+            ranges+=_cut_record(nf,a,b,max(1,tot/n))
+        else:
+            ranges.append((nf,a,b,b,""))
+    shards=[[] for i in range(n)]
+    t=0
+    for x in ranges:
+        shards[min(n-1,t*n/max(1,tot))].append(x)
+        t+=x[2]-x[1]
+    return _count(_count_records,[x for x in shards if x!=[]],lg,kw)
+
+def pack(c):
+    """Return the compact form of Compte or DenseCompte $1, a tuple of
+    strings and numbers, which unpack() turns back into counts."""
+
+    if isinstance(c,densecompte.DenseCompte):
+        t=c._DenseCompte__tab
+        sh=c._DenseCompte__short
+        return ("dense",c.lg(),"".join(c.alph()),t.tostring(),
+                "\n".join(sh.keys()),array.array('d',sh.values()).tostring())
+    w=[]
+    v=array.array('d')
+    _leaves(c,"",w,v)
+    return ("compte","\n".join(w),v.tostring())
+
+def unpack(p):
+    "Return the Compte or DenseCompte of compact form $1."
+    if p[0]=="dense":
+        c=densecompte.DenseCompte(p[1],alph=p[2])
+        t=array.array('d')
+        t.fromstring(p[3])
+        c._DenseCompte__tab=t
+        v=array.array('d')
+        v.fromstring(p[5])
+        if v:
+            c._DenseCompte__short=dict(zip(p[4].split("\n"),v))
+        return c
+    c=compte.Compte()
+    v=array.array('d')
+    v.fromstring(p[2])
+    if v:
+        for w,x in zip(p[1].split("\n"),v):
+            if x==int(x):
+                x=int(x)
+            c._Compte__add(w,x)
+    return c
+
+def _leaves(c, s, w, v):
+    """Append to lists $3 and $4 the words which begin with $2 and
+    their counts, which are not counted in longer words, in Compte
+    $1."""
+
+    a=c._Arbre__nbe
+    for x,f in c._Arbre__cat.items():
+        _leaves(f,s+x,w,v)
+        a-=f._Arbre__nbe
+    if a!=0:
+        w.append(s)
+        v.append(a)
+
+def _string(s):
+    "Return the string of letters of sequence $1."
+    if isinstance(s,str):
+        return s
+    if hasattr(s,"seq"):
+        return s.seq()
+    return str(s)
+
+def _nb_shards(kw, n):
+    "Return the number of shards, at most $2, from the arguments $1."
+    return max(1,min(n,kw.get("shards",kw.get("workers",1))))
+
+def _cut_record(nf, a, b, size):
+    """Return the list of the ranges of the record of bytes $2 to $3
+    of FASTA file $1, of about $4 bytes, cut at the beginnings of
+    lines, as (file, beg, end, $3, letter before beg)."""
+
+    f=open(nf,'rb')
+    try:
+        f.seek(a)
+        h=a+len(f.readline()) # end of the header
+        l=[]
+        deb=a
+        prec=""
+        x=a+size
+        while x<b:
+            # next beginning of line
+            x=max(h,x)-1
+            f.seek(x)
+            x+=len(f.readline())
+            if x>=b:
+                break
+            l.append((nf,deb,x,b,prec))
+            prec=_letter_before(f,max(h,deb),x)
+            if prec=="":
+                prec=l[-1][4]
+            deb=x
+            x=deb+size
+        l.append((nf,deb,b,b,prec))
+        return l
+    finally:
+        f.close()
+
+def _letter_before(f, a, b):
+    """Return the last letter of bytes $2 to $3 of open file $1, or
+    "" if there is none."""
+    while b>a:
+        i=max(a,b-4096)
+        f.seek(i)
+        s=f.read(b-i).translate(None," \t\r\n")
+        if s!="":
+            return s[-1]
+        b=i
+    return ""
+
+def _letters_after(nf, a, b, k):
+    "Return the first $4 letters of bytes $2 to $3 of file $1."
+    if k<=0:
+        return ""
+    f=open(nf,'rb')
+    try:
+        f.seek(a)
+        s=""
+        while len(s)<k and a<b:
+            x=f.read(min(b-a,max(k,4096)))
+            if x=="":
+                break
+            a+=len(x)
+            s+=x.translate(None," \t\r\n")
+        return s[:k]
+    finally:
+        f.close()
+
+def _count(f, shards, lg, kw):
+    """Return the counts of shards $2 made by function $1, merged in a
+    tree, with the arguments $4 being given to all the processes."""
+
+    workers=kw.get("workers",1)
+    args=(lg,kw.get("dense",False),kw.get("alph","ACGT"),
+          {"fact":kw.get("fact",1),"chunk":kw.get("chunk",1<<20)})
+    if workers<=1 or len(shards)<=1:
+        _init(*args)
+        c=_new()
+        for x in shards:
+            f(c,x)
+        return c
+
+    pool=multiprocessing.Pool(workers,_init,args)
+    try:
+        parts=pool.map(_shard,[(f,x) for x in shards])
+        while len(parts)>1:
+            pairs=[(parts[i],parts[i+1]) for i in range(0,len(parts)-1,2)]
+            last=parts[len(parts)-1:len(parts)-1+len(parts)%2]
+            parts=pool.map(_merge,pairs)+last
+    finally:
+        pool.close()
+        pool.join()
+    return unpack(parts[0])
+
+def _init(lg,dense,alph,kw):
+    "Keep the data of the counting in this process."
+    global _job
+    _job=(lg,dense,alph,kw)
+
+def _new():
+    "Return empty counts for the current counting."
+    lg,dense,alph,kw=_job
+    if dense:
+        return densecompte.DenseCompte(lg,alph=alph)
+    return compte.Compte()
+
+def _shard(task):
+    "Return the compact counts of the shard of task (function, shard)."
+    f,x=task
+    c=_new()
+    f(c,x)
+    return pack(c)
+
+def _merge(pair):
+    "Return the compact sum of the compact counts of pair $1."
+    c=unpack(pair[0])
+    c+=unpack(pair[1])
+    return pack(c)
+
+def _count_seqs(c, seqs):
+    "Add to $1 the counts of the list of sequences $2."
+    lg,dense,alph,kw=_job
+    for s in seqs:
+        c.add_seq(s,lg,**kw)
+
+def _count_range(c, r):
+    """Add to $1 the counts of the words which begin in the first m
+    letters of range r=(letters, m, deb, fin, letter before) of the
+    sequence of the counting."""
+    lg,dense,alph,kw=_job
+    s,m,deb,fin,prec=r
+    if dense and not deb:
+        deb=alph.find(prec)==-1
+    c.add_chunk(s,lg,m,deb,fin,**kw)
+
+def _count_records(c, recs):
+    """Add to $1 the counts of the list of ranges of records (file,
+    beg, end, end of the record, letter before beg) $2."""
+    lg,dense,alph,kw=_job
+    for nf,a,b,e,prec in recs:
+        first=prec==""
+        for s,m,deb,fin in compte.fasta_chunks(nf,lg,kw["chunk"],(a,b)):
+            deb=deb and first
+            if fin and b<e:
+                # the range goes on in the record
+                x=_letters_after(nf,b,e,lg-1)
+                s+=x
+                fin=len(x)<lg-1
+            if dense:
+                deb=deb or alph.find(prec)==-1
+            c.add_chunk(s,lg,m,deb,fin,**kw)
+            prec=s[m-1]
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Substitution rate cache module.
+
+Defines a RateCache, attached to an EvolSequence and a Model, which
+keeps for every site the substitutions allowed by its context and
+their total rate. After a substitution, only the sites which context
+contains the substituted position are computed again.
+
+The total rates of the sites are kept in a Fenwick tree, so that a
+site can be drawn proportionally to its rate in O(log n).
+"""
+
+import random
+
+from fenwick import Fenwick
+
+#######################################################################
+#######################################################################
+########  Class RateCache
+
+class RateCache:
+    """A RateCache holds the substitutions allowed at each site of a
+    sequence by a model.
+
+    The sequence must be changed through set() (or update() must be
+    called after each change), otherwise the cache is out of date.
+    """
+
+    def __init__(self, seq, m, weights=None):
+        """Create the RateCache of sequence $1 for model $2.
+
+        Optional argument 'weights' is the list of the weights of the
+        sites (default: 1 for each site); the rate of a site is
+        multiplied by its weight in total_rate() and draw(). Sites of
+        null weight are not computed.
+        """
+
+        self.__seq=seq
+        self.__m=m
+        ls=len(seq)
+        if weights==None:
+            weights=[1]*ls
+        self.__w=weights
+        # widths of the contexts, not lg_max_prior() and
+        # lg_max_posterior(), which are the lengths of the words of
+        # the Proportion
+        self.__lp=m.lg_left()
+        self.__lq=m.lg_right()
+        self.__rules=[[]]*ls
+        self.__rate=[0]*ls
+        val=[0]*ls
+        for i in xrange(ls):
+            if weights[i]!=0:
+                self.__compute(i)
+                val[i]=self.__rate[i]*weights[i]
+        self.__f=Fenwick(val=val)
+
+    def __compute(self, i):
+        "Compute the substitutions allowed at site $1."
+        a=self.__m.rules_at(self.__seq,i)
+        self.__rules[i]=a
+        v=0
+        for k in a:
+            v+=k[1]
+        self.__rate[i]=v
+
+    def __len__(self):
+        "Return the number of sites."
+        return len(self.__rules)
+
+    def sequence(self):
+        "Return the sequence of the RateCache."
+        return self.__seq
+
+    def model(self):
+        "Return the model of the RateCache."
+        return self.__m
+
+    def total_rate(self):
+        "Return the sum of the weighted rates of all the sites."
+        return self.__f.total()
+
+    def rate_at(self, i):
+        "Return the total substitution rate at site $1."
+        return self.__rate[i]
+
+    def rules_at(self, i):
+        """Return the list of [target, rate, number] of the
+        substitutions allowed at site $1, as Model.rules_at."""
+        return self.__rules[i]
+
+    def update(self, pos):
+        """Compute again the sites which context contains position
+        $1, after it has changed."""
+        w=self.__w
+        f=self.__f
+        for j in xrange(max(0,pos-self.__lq),
+                        min(len(self.__rules),pos+self.__lp+1)):
+            if w[j]!=0:
+                self.__compute(j)
+                f[j]=self.__rate[j]*w[j]
+
+    def set(self, pos, c):
+        "Write letter $2 at position $1 of the sequence, and update."
+        self.__seq[pos]=c
+        self.update(pos)
+
+    def draw(self, rng=random):
+        """Return a random (site, [target, rate, number]), the site
+        drawn proportionally to its weighted rate and the substitution
+        proportionally to its rate, with random generator $1 (default:
+        the random module).
+
+        The substitution is None if the site has no substitution
+        (which happens only with rounding errors).
+        """
+
+        f=self.__f
+        i=f.find(rng.uniform(0,f.total()))
+        a=self.__rules[i]
+        if a==[]:
+            return i,None
+        r=rng.uniform(0,f[i]/self.__w[i])
+        j=0
+        while j<len(a)-1 and r>=a[j][1]:
+            r-=a[j][1]
+            j+=1
+        return i,a[j]
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Replicated simulations module.
+
+Runs many independent simulations of the evolution of the same
+sequence along the same tree, such as those needed to build null
+distributions. The tree and the models are sent once to each worker
+process, and replicate number i is evolved with seed i, so that its
+leaf sequences do not depend on the number of workers.
+"""
+
+import multiprocessing
+
+import evol
+import tree
+
+_job=None # simulation of the current process
+
+#######################################################################
+#######################################################################
+########  functions
+
+def replicates(t,seq,mod,n, **kw):
+    """Evolve $2 along tree $1, according to model $3, in $4
+independent replicates, and return the number of replicates done.
+
+$1 is a Node or a string in Newick format; $2 is an EvolSequence or
+a string of letters.
+
+Keyword argument to evolve with several models, as in
+Node.evolve_seg_seq: [seg=bool] (default: False); then $3 is the
+dictionary of models.
+
+Keyword argument for the number of processes: [workers=int]
+(default: 1).
+
+Keyword argument for the number of the first replicate: [first=int]
+(default: 0). Replicate i is evolved with seed i.
+
+Keyword argument to write the leaf sequences: [out=string] is a file
+name; if it contains a '%d' format, each replicate i is written in
+file out%i, otherwise all the replicates are appended, in order, to
+the same file. Keyword argument for the format: [format=string]
+'fasta' (default) or 'phylip'.
+
+Keyword argument to get the leaf sequences: [callback=function] is
+called in order as callback(i, leaves), where leaves is the list of
+[label, sequence string] of the leaves of replicate i.
+
+Other keyword arguments (algo, segments...) are passed to the
+evolution methods; only the leaf sequences are kept, unless another
+[keep] argument is given.
+"""
+
+    kw=kw.copy()
+    workers=kw.pop("workers",1)
+    first=kw.pop("first",0)
+    out=kw.pop("out",None)
+    form=kw.pop("format","fasta")
+    callback=kw.pop("callback",None)
+    kw.setdefault("keep","leaves")
+    if kw.pop("seg",False):
+        meth="evolve_seg_seq"
+    else:
+        meth="evolve_seq"
+    if form!="fasta" and form!="phylip":
+        raise ValueError, "Unknown format "+str(form)
+
+    if isinstance(t,str):
+        t=tree.Node(newick=t)
+    if isinstance(seq,str):
+        store="C"
+        s=seq
+    else:
+        store=seq.store()
+        s=seq.seq()
+    args=(t._struct(),s,store,meth,mod,kw,out!=None and form,
+          callback!=None)
+
+    if out!=None and out.find("%")==-1:
+        f=open(out,"w")
+    else:
+        f=None
+
+    if workers<=1:
+        _init(*args)
+        res=map(_replicate,range(first,first+n))
+        pool=None
+    else:
+        pool=multiprocessing.Pool(workers,_init,args)
+        res=pool.imap(_replicate,range(first,first+n))
+    try:
+        for i,leaves,text in res:
+            if out!=None:
+                if f==None:
+                    g=open(out%i,"w")
+                    g.write(text)
+                    g.close()
+                else:
+                    f.write(text)
+                    f.flush()
+            if callback!=None:
+                callback(i,leaves)
+    finally:
+        if f!=None:
+            f.close()
+        if pool!=None:
+            pool.close()
+            pool.join()
+    return n
+
+def _init(st,s,store,meth,mod,kw,form,need):
+    """Build once in this process the tree, the root sequence and the
+    models of the simulation."""
+    global _job
+    t=tree.Node()
+    t._read_struct(st)
+    seq=evol.EvolSequence(store=store)
+    seq.read_str(s)
+    _job=(t,seq,meth,mod,kw,form,need)
+
+def _replicate(i):
+    """Evolve replicate $1, and return [i, leaves, text]: the leaves
+    are None unless a callback needs them, and the text is None unless
+    the replicates are written, so that only what is used goes back
+    to the parent process."""
+    t,seq,meth,mod,kw,form,need=_job
+    getattr(t,meth)(seq,mod,seed=i,**kw)
+    leaves=None
+    if need:
+        leaves=[[x.name(),x.seq()] for x in t.get_leaf_sequences()]
+    text=None
+    if form=="fasta":
+        text="".join([x.fasta() for x in t.get_leaf_sequences()])
+    elif form=="phylip":
+        text=t.phylip()
+    return [i,leaves,text]
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Random generator module.
+
+Defines a random generator which can be seeded, saved and split into
+independent streams. Each branch, replicate or worker of a simulation
+can then get its own stream, reproducible from a single seed and
+independent of the order in which the streams are used.
+
+The generator is passed to the evolution methods through their 'rng'
+keyword argument; it also gives the seeds of the generators of the
+C++ module.
+"""
+
+import random
+import pickle
+import hashlib
+import math
+
+#######################################################################
+#######################################################################
+########  Class Rng
+
+class Rng(random.Random):
+    """A Rng is a Mersenne Twister random generator (as the random
+    module), which knows the seed it was built from.
+    """
+
+    def __init__(self, seed=None):
+        """Create a Rng.
+
+        Optional argument 'seed' is an integer. It defaults to a
+        number drawn from the random module.
+        """
+
+        if seed==None:
+            seed=random.getrandbits(64)
+        self.__seed=_integer(seed,"seed")
+        random.Random.__init__(self,self.__seed)
+
+    def seed(self, a=None):
+        """Seed the Rng with integer $1."""
+        if a==None:
+            a=random.getrandbits(64)
+        self.__seed=_integer(a,"seed")
+        random.Random.seed(self,self.__seed)
+
+    def first_seed(self):
+        """Return the seed of the Rng."""
+        return self.__seed
+
+    def getstate(self):
+        """Return the state of the Rng."""
+        return (self.__seed,random.Random.getstate(self))
+
+    def setstate(self, state):
+        """Restore the state $1 given by getstate()."""
+        self.__seed=state[0]
+        random.Random.setstate(self,state[1])
+
+    def __reduce__(self):
+        return (Rng,(0,),self.getstate())
+
+    def dumps(self):
+        """Return the state of the Rng as a string."""
+        return pickle.dumps(self.getstate(),2)
+
+    def substream(self, *key):
+        """Return a new Rng, computed from the seed of this one and
+        the integers or strings of $*.
+
+        The stream does not depend on the numbers already drawn from
+        this Rng, and different keys give independent streams. Equal
+        numbers give the same stream whatever their type (2, 2L or
+        2.0).
+        """
+
+        l=["%d" % self.__seed]
+        for x in key:
+            if isinstance(x,str):
+                l.append("s%d:%s" % (len(x),x))
+            else:
+                l.append("i%d" % _integer(x,"key"))
+        h=hashlib.sha1(",".join(l)).hexdigest()
+        return Rng(long(h[:16],16))
+
+    def split(self, n):
+        """Return the list of $1 independent Rng, substreams 0 to n-1
+        of this one."""
+        return [self.substream(i) for i in range(n)]
+
+    def cseed(self):
+        """Return a seed for a generator of the C++ module."""
+        return self.getrandbits(31)
+
+    def poisson(self, lam):
+        "Return a number drawn from the Poisson law of mean $1."
+        return poisson(lam,self)
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def _integer(x, what):
+    """Return number $1 as a long, if it is an integer; $2 names it in
+    the error."""
+    try:
+        n=long(x)
+    except (TypeError, ValueError):
+        raise ValueError, "Bad %s %r" % (what,x)
+    if n!=x:
+        raise ValueError, "Bad %s %r" % (what,x)
+    return n
+
+def poisson(lam, rng=random):
+    """Return a number drawn from the Poisson law of mean $1, with
+    random generator $2 (default: the random module).
+
+    Small means are drawn by multiplying uniforms, large ones by the
+    transformed rejection of Hormann (1993).
+    """
+
+    if lam<=0:
+        return 0
+    if lam<30:
+        l=math.exp(-lam)
+        k=0
+        p=rng.random()
+        while p>l:
+            k+=1
+            p*=rng.random()
+        return k
+    slam=math.sqrt(lam)
+    loglam=math.log(lam)
+    b=0.931+2.53*slam
+    a=-0.059+0.02483*b
+    invalpha=1.1239+1.1328/(b-3.4)
+    vr=0.9277-3.6224/(b-2)
+    while 1:
+        u=rng.random()-0.5
+        v=rng.random()
+        us=0.5-abs(u)
+        k=int(math.floor((2*a/us+b)*u+lam+0.43))
+        if us>=0.07 and v<=vr:
+            return k
+        if k<0 or (us<0.013 and v>us):
+            continue
+        if math.log(v)+math.log(invalpha)-math.log(a/(us*us)+b)<= \
+           -lam+k*loglam-math.lgamma(k+1):
+            return k
+
+def loads(s):
+    """Return the Rng saved in string $1 by Rng.dumps()."""
+    r=Rng(0)
+    r.setstate(pickle.loads(s))
+    return r
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Site sampler module.
+
+Defines a Sampler, which draws positions of a sequence proportionally
+to their weights. It is built once from segments, from a mask or from
+per-site weights, and keeps the prefix sums of the weights, so that
+each draw is a binary search in O(log n).
+
+It gives the proposed positions of the evolution methods, through
+their 'sampler' keyword argument.
+"""
+
+import array
+import bisect
+import random
+
+#######################################################################
+#######################################################################
+########  Class Sampler
+
+class Sampler:
+    """A Sampler draws positions, proportionally to the number of
+    segments they belong to, or to their weights.
+    """
+
+    def __init__(self, **kw):
+        """Create a Sampler.
+
+        Keyword argument for segments: [segments=list] is a list of
+        [beg,end] (end excluded); a position is drawn proportionally
+        to the number of segments it belongs to. Draws are then the
+        same as EvolSequence.pick_position with these segments.
+
+        Keyword argument for a mask: [mask=sequence] of booleans, one
+        per position; the true positions are drawn uniformly.
+
+        Keyword argument for weights: [weights=sequence] of
+        non-negative numbers, one per position.
+        """
+
+        self.__seg=None
+        self.__cum=None
+        self.__w=None
+        if kw.has_key("segments"):
+            self.__seg=[[s[0],s[1]] for s in kw["segments"] if s[1]>s[0]]
+        elif kw.has_key("mask"):
+            self.__seg=[]
+            d=None
+            mask=kw["mask"]
+            for i in xrange(len(mask)):
+                if mask[i]:
+                    if d==None:
+                        d=i
+                elif d!=None:
+                    self.__seg.append([d,i])
+                    d=None
+            if d!=None:
+                self.__seg.append([d,len(mask)])
+        elif kw.has_key("weights"):
+            self.__w=kw["weights"]
+            self.__cum=array.array('d')
+            t=0.0
+            for x in self.__w:
+                if x<0:
+                    raise ValueError, "Negative weight."
+                t+=x
+                self.__cum.append(t)
+            self.__tot=t
+            self.__n=len(self.__cum)
+            return
+        else:
+            raise ValueError, "Segments, mask or weights are needed."
+
+        # cumulated integer lengths of the segments
+        self.__cum=array.array('l')
+        t=0
+        for s in self.__seg:
+            t+=s[1]-s[0]
+            self.__cum.append(t)
+        self.__tot=t
+        self.__n=len(self.__seg)
+
+    def __len__(self):
+        "Return the number of segments, or of weighted positions."
+        return self.__n
+
+    def total(self):
+        """Return the total weight, which is the sum of the lengths of
+        the segments."""
+        return self.__tot
+
+    def segments(self):
+        "Return the list of segments, or None for per-site weights."
+        return self.__seg
+
+    def site_weights(self, l):
+        "Return the list of the weights of positions 0 to $1-1."
+        if self.__w!=None:
+            w=[float(x) for x in self.__w[:l]]
+            return w+[0.0]*(l-len(w))
+        w=[0]*l
+        for s in self.__seg:
+            for i in xrange(max(0,s[0]),min(l,s[1])):
+                w[i]+=1
+        return w
+
+    def pick(self, rng=random):
+        """Return a random (position, number of its segment), with
+        random generator $1 (default: the random module).
+
+        For per-site weights, the number is the position.
+        """
+
+        if self.__tot<=0:
+            raise ValueError, "Nothing to draw."
+        if self.__w!=None:
+            i=bisect.bisect_right(self.__cum,rng.random()*self.__tot)
+            if i>=self.__n: # rounding errors
+                i=self.__n-1
+            while self.__w[i]<=0:
+                i-=1
+            return i,i
+        i=rng.randint(0,self.__tot-1)
+        d=bisect.bisect_right(self.__cum,i)
+        if d>0:
+            i-=self.__cum[d-1]
+        return i+self.__seg[d][0],d
+
+    def draw(self, rng=random):
+        """Return a random position, with random generator $1
+        (default: the random module)."""
+        return self.pick(rng)[0]
+
+    def draws(self, n, rng=random):
+        """Return an array of $1 random positions, with random
+        generator $2 (default: the random module)."""
+
+        if self.__tot<=0:
+            raise ValueError, "Nothing to draw."
+        f=bisect.bisect_right
+        c=self.__cum
+        if self.__w!=None:
+            r=rng.random
+            t=self.__tot
+            w=self.__w
+            l=[f(c,r()*t) for j in xrange(n)]
+            for j in xrange(n):
+                i=min(l[j],self.__n-1)
+                while w[i]<=0:
+                    i-=1
+                l[j]=i
+            return array.array('l',l)
+        r=rng.randint
+        t=self.__tot-1
+        seg=self.__seg
+        a=array.array('l')
+        for j in xrange(n):
+            i=r(0,t)
+            d=f(c,i)
+            if d>0:
+                i-=c[d-1]
+            a.append(i+seg[d][0])
+        return a
@@ -19,6 +19,7 @@
 import random 
 import string
 import math
+import array
 
 from Modules.Csequence import *
 from Modules.Fsequence import *
@@ -26,6 +27,141 @@ from Modules.Fsequence import *
 # import partition
 # from segment import Segment
 
+def _raw(g):
+    """Return the mere string of the letters of C++ sequence g, from
+its printable form."""
+    st=str(g)
+    i=st.find("\n")
+    if i==-1:
+        return ""
+    return "".join(st[i+1:].split())
+
+class Asequence:
+    """Sequence of letters stored in a contiguous buffer of chars.
+
+It has the same interface as Csequence, so that a Sequence can hold
+it instead of a C++ object: then the letters are read and written
+without any call to the C++ module, and whole strings of letters are
+obtained at once.
+
+As for Fsequence, a slice shares the buffer of its Asequence.
+"""
+
+    def __init__(self, l=0):
+        self.__buf=array.array('c')
+        self.__deb=0
+        self.__fin=0
+        self.__vfin=0
+        if l>0:
+            self.genere(l)
+
+    def genere(self, l):
+        "Build with length l."
+        self.__buf=array.array('c',"\0"*max(l,0))
+        self.__deb=0
+        self.__vfin=self.__fin=len(self.__buf)
+
+    def vtaille(self):
+        "Return the length of the allocated buffer."
+        return self.__vfin-self.__deb
+
+    def termine(self, i):
+        "End the sequence after position i."
+        if i>=0 and self.__deb+i<self.__vfin:
+            self.__fin=self.__deb+i+1
+
+    def melange(self, i, graine=-1):
+        """Do i random transpositions, with a generator seeded by
+graine if it is >=0."""
+        if graine<0:
+            alea=random
+        else:
+            alea=random.Random(graine)
+        l=len(self)
+        b=self.__buf
+        d=self.__deb
+        for k in xrange(i):
+            p1=d+alea.randrange(l)
+            p2=d+alea.randrange(l)
+            b[p1],b[p2]=b[p2],b[p1]
+
+    def copie(self, g):
+        "Become a copy of Asequence or Csequence g."
+        if isinstance(g,Asequence):
+            self.__buf=array.array('c',g.tostring())
+        else:
+            self.__buf=array.array('c',_raw(g))
+        self.__deb=0
+        self.__vfin=self.__fin=len(self.__buf)
+
+    def recup_rel(self, g, i, j):
+        "Become the view of positions i to j (included) of g."
+        self.__buf=g.__buf
+        j=min(j,len(g)-1)
+        if i>j:
+            self.__deb=self.__fin=self.__vfin=0
+            return
+        self.__deb=g.__deb+i
+        self.__vfin=self.__fin=g.__deb+j+1
+
+    def read_str(self, st):
+        "Build from string st."
+        self.__buf=array.array('c',st)
+        self.__deb=0
+        self.__vfin=self.__fin=len(self.__buf)
+
+    def read_nf(self, nf):
+        "Build from filename nf, in any format read by Csequence."
+        g=Csequence()
+        g.read_nf(nf)
+        self.copie(g)
+
+    def __len__(self):
+        return self.__fin-self.__deb
+
+    def __index(self, i):
+        if i<-len(self) or i>=len(self):
+            raise IndexError, "Bad index"
+        if i<0:
+            return self.__fin+i
+        return self.__deb+i
+
+    def __getitem__(self, i):
+        return self.__buf[self.__index(i)]
+
+    def __setitem__(self, i, c):
+        self.__buf[self.__index(i)]=c
+
+    def substr(self, i, j):
+        "Return the string of positions [i:j[."
+        i=max(i,0)
+        j=min(j,len(self))
+        if i>=j:
+            return ""
+        return self.__buf[self.__deb+i:self.__deb+j].tostring()
+
+    def tostring(self):
+        "Return the string of all the letters."
+        return self.__buf[self.__deb:self.__fin].tostring()
+
+    def __str__(self):
+        "Same format as the C++ sequences."
+        l=len(self)
+        if l==0:
+            return ""
+        st=self.tostring()
+        s=[str(l)+"\n"]
+        # as the C++ output, each group of 10 letters is followed by a
+        # space, or by a newline after 100 letters
+        for i in range(0,l,10):
+            s.append(st[i:i+10])
+            if i+10<=l:
+                if (i+10)%100==0:
+                    s.append("\n")
+                else:
+                    s.append(" ")
+        return "".join(s)
+
 class _Seq:
     "virtual Sequence"
 
@@ -64,6 +200,13 @@ otherwise replace in the former one.
             for k in range(i,j):
                 self[k]=s[k-i]
         else:
+            if isinstance(self.__gen,Asequence):
+                g2=Asequence()
+                if not isinstance(s,str):
+                    s=s.seq()
+                g2.read_str(self.substr(0,i)+s+self.substr(j,len(self)))
+                self.__gen=g2
+                return
             g2=Csequence()
             lg2=len(self)-(j-i)+ls
             g2.genere(lg2)            
@@ -79,14 +222,19 @@ otherwise replace in the former one.
                 k+=1
             self.__gen=g2
             
-    def shuffle(self,i=0):
+    def shuffle(self,i=0,rng=None):
         """Quasi-uniformly randomize itself using i (default:
 len*(log(len)+1)/2) transpositions.
+
+Optional argument rng is a Rng which seeds the transpositions.
 """
         if i==0:
             i=(int)(len(self)*(math.log(len(self))+1)/2)
 
-        self.__gen.melange(i)
+        if rng==None:
+            self.__gen.melange(i)
+        else:
+            self.__gen.melange(i,rng.getrandbits(31))
 
 #     def read_Lprop(self, lprop, **kw):
 #         """Build from a Lproportion lprop. Return the Partition of the
@@ -272,10 +420,12 @@ Keyword argument:
 deb -- change only after position deb (>=0) included;
 fin -- change only before position fin (<len()) included;
 long -- create a lg-length Sequence. In that case, deb and
-        fin are not read.
+        fin are not read;
+rng -- random generator (default: the random module).
 """
 
 
+        rng=kw.get('rng',random)
         al=prop.alph()
         if al==[] or al==['^']:
             print "Empty Proportion"
@@ -324,7 +474,7 @@ long -- create a lg-length Sequence. In that case, deb and
                 suiv=asuiv
 
             y=reduce(sum ,[t[1] for t in suiv])
-            x=random.random()*y
+            x=rng.random()*y
             lsuiv=len(suiv)
             
             while x>=0 and lsuiv>0:
@@ -357,23 +507,37 @@ long -- create a lg-length Sequence. In that case, deb and
 
     def alpha(self):
         "Return the list of the used letters."
-        st=[]
-        for i in self:
-            if not i in st:
-                st.append(i)
+        s=self.seq()
+        st=list(dict.fromkeys(s))
+        st.sort(key=s.find)
         return st
 
+    def store(self):
+        """Return the kind of storage of the letters: 'array' for an
+Asequence buffer, 'C' for a C++ object."""
+        if isinstance(self.__gen,Asequence):
+            return "array"
+        return "C"
+
+    def substr(self,i,j):
+        "Return the string of the letters at positions [i:j[."
+        if isinstance(self.__gen,Asequence):
+            return self.__gen.substr(i,j)
+        return "".join([self.__gen[k] for k in range(max(i,0),min(j,len(self)))])
+
     def __getslice__(self,i,j):
         """!!! Do NOT create a new Sequence; so destruction of the original
 Sequence entails destruction of this result.
 (x.__getslice__(i,j) <==> x[i:j])"""
         nv=_Seq()
+        if isinstance(self.__gen,Asequence):
+            nv.__gen=Asequence()
         nv.__c_elem().recup_rel(self.__c_elem(),i,j-1)
         return nv
 
     def copy(self):
         "Return a NEW copy Sequence of the Sequence."
-        g=Sequence()
+        g=Sequence(store=self.store())
         g.__gen.copie(self.__c_elem())
         g._Seq__nom=self._Seq__nom
         return g
@@ -387,26 +551,19 @@ Sequence entails destruction of this result.
     
     def fasta(self):
         "Return the string in fasta format."
-        s=">" + str(self.__nom) + '\n'
-        j=0
-        if len(self)>0:
-            for i in self:
-                s+=i
-                j+=1
-                if j==80:
-                    s+="\n"
-                    j=0
-            s+="\n"
-        return s
+        s=[">" + str(self.__nom) + '\n']
+        st=self.seq()
+        for i in range(0,len(st),80):
+            s.append(st[i:i+80]+"\n")
+        if len(st)>0 and len(st)%80==0:
+            s.append("\n")
+        return "".join(s)
 	
     def seq(self):
         "Return the mere sequence."
-        s=""
-        j=0
-        if len(self)>0:
-            for i in self:
-                s+=i
-        return s
+        if isinstance(self.__gen,Asequence):
+            return self.__gen.tostring()
+        return _raw(self.__gen)
 
     def write_fasta(self,a, **kw):
 	"""Write the Sequence in FASTA format in $1 file.
@@ -445,10 +602,15 @@ class Sequence(_Seq):
 
     def __init__(self, **kw):
         """Keyword argument:
-fic -- build from filename fic.
+fic -- build from filename fic;
+store -- 'C' (default) to keep the letters in a C++ object, 'array'
+         to keep them in a Python buffer (see Asequence).
 """
         _Seq.__init__(self)
-        self._Seq__gen=Csequence()
+        if kw.get('store','C')=='array':
+            self._Seq__gen=Asequence()
+        else:
+            self._Seq__gen=Csequence()
         if kw.has_key('fic'):
             self.read_nf(kw['fic'])
 
@@ -456,6 +618,16 @@ fic -- build from filename fic.
         "Build empty with length l."
         self._Seq__gen.genere(l)
 
+    def read_str(self,st):
+        "Build from string st of letters."
+        if self.store()=="array":
+            self._Seq__gen.read_str(st)
+        else:
+            self.generate(len(st))
+            g=self._Seq__gen
+            for i in xrange(len(st)):
+                g[i]=st[i]
+
     def read_nf(self,nf):
         "Build from filename nf."
         self._Seq__gen.read_nf(nf)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Evolution statistics module.
+
+Defines Stats, the counters of an evolution: proposed positions,
+substitutions, rejected proposals by cause, number of times each
+substitution of the model is used, and time spent. They are filled
+by the evolution methods, through their 'stats' keyword argument, and
+can be added up over the branches of a tree.
+"""
+
+#######################################################################
+#######################################################################
+########  Class Stats
+
+CAUSES=["rate","left","right","same"]
+
+class Stats:
+    """Stats counts the proposals of an evolution.
+
+    A proposal which is not a substitution is rejected for one of the
+    causes:
+
+    * 'rate': the drawn rate is above the rates of all the
+      substitutions of the letter;
+    * 'left': it falls on a substitution which left context does not
+      match;
+    * 'right': it falls on a substitution which right context does
+      not match;
+    * 'same': it falls on a substitution to the same letter.
+    """
+
+    def __init__(self):
+        "Create empty Stats."
+        self.__prop=0
+        self.__subst=0
+        self.__rej=dict.fromkeys(CAUSES,0)
+        self.__rules={}
+        self.__time=0.0
+
+    def __iadd__(self, x):
+        "Add up Stats $1 (x.__iadd__(y) <==> x+=y)."
+        self.__prop+=x.__prop
+        self.__subst+=x.__subst
+        for c in CAUSES:
+            self.__rej[c]+=x.__rej[c]
+        for r,n in x.__rules.items():
+            self.__rules[r]=self.__rules.get(r,0)+n
+        self.__time+=x.__time
+        return self
+
+    def __str__(self):
+        s="proposals\t%d\n" % self.__prop
+        s+="substitutions\t%d\n" % self.__subst
+        for c in CAUSES:
+            s+="rejected_%s\t%d\n" % (c,self.__rej[c])
+        r=self.__rules.keys()
+        r.sort()
+        for i in r:
+            s+="rule_%d\t%d\n" % (i,self.__rules[i])
+        s+="time\t%f\n" % self.__time
+        return s
+
+    def propose(self, n=1):
+        "Count $1 proposals."
+        self.__prop+=n
+
+    def fire(self, rule, n=1):
+        """Count $2 substitutions by rule number $1 (-1 when it is
+        unknown)."""
+        self.__subst+=n
+        self.__rules[rule]=self.__rules.get(rule,0)+n
+
+    def reject(self, cause):
+        "Count a proposal rejected for cause $1."
+        self.__rej[cause]+=1
+
+    def add_time(self, t):
+        "Add $1 seconds."
+        self.__time+=t
+
+    def reset_time(self):
+        "Set the time spent to 0."
+        self.__time=0.0
+
+    def proposals(self):
+        "Return the number of proposals."
+        return self.__prop
+
+    def substitutions(self):
+        "Return the number of substitutions."
+        return self.__subst
+
+    def rejections(self, cause=None):
+        """Return the number of rejected proposals for cause $1, or
+        for all causes."""
+        if cause==None:
+            return sum(self.__rej.values())
+        return self.__rej[cause]
+
+    def rule_fires(self):
+        """Return the dictionary {rule number: number of
+        substitutions}, the numbers being those of Model.rules()."""
+        return self.__rules
+
+    def time(self):
+        "Return the number of seconds spent."
+        return self.__time
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Parameter sweep module.
+
+Runs the evolution of the same sequence along the same tree for every
+point of a grid of parameters of the models of modeles, in several
+replicates each, and writes a line of summary statistics per
+replicate in a tab-separated file, one column per parameter and per
+statistic:
+
+kappa	theta	replicate	A	C	G	T	GC_content	...
+
+The tree and the root sequence are sent once to each worker process,
+and the Models are compiled once per point in each of them. Replicate
+r of a point is evolved with a substream of the seed computed from the
+values of the point and r, so that its statistics depend neither on
+the number of workers, nor on the other points of the grid. Then a
+sweep which has been stopped can be resumed from its file.
+"""
+
+import itertools
+import multiprocessing
+import os
+
+import evol
+import modeles
+import rng
+import tree
+
+_job=None # sweep of the current process
+
+LETTERS="ACGT"
+DINUCS=[x+y for x in LETTERS for y in LETTERS]
+
+#######################################################################
+#######################################################################
+########  functions
+
+def sweep(t,seq,grid,n,out, **kw):
+    """Evolve $2 along tree $1 with the model of each point of grid
+$3, in $4 replicates each, and write a line of statistics per
+replicate in file $5. Return the number of replicates done.
+
+$1 is a Node or a string in Newick format; $2 is an EvolSequence or
+a string of letters. $3 is a dictionary {parameter: list of values},
+and the points are all the combinations of these values. Parameter
+'scale' multiplies the rates of the model (as its 'eta' parameter),
+which is the same as multiplying all the branch lengths.
+
+Keyword argument for the model: [model=string] is the name of a
+function of modeles (default: 'HKY85'). Keyword argument for the
+parameters common to all the points: [fixed=dict] (default: {}).
+
+Keyword argument for the number of processes: [workers=int]
+(default: 1).
+
+Keyword argument for the random streams: [seed=int] (default: 0).
+
+Keyword argument to go on with a sweep already in file $5:
+[resume=bool] (default: False). The replicates found in the file are
+not done again, and the new lines are appended; the grid may have
+been extended. Values of parameters are written as floats, so that 2
+and 2.0 are the same point. Otherwise, the file is written again,
+with its header even if there is no replicate to do.
+
+Keyword argument for the statistics: [summary=function] is called
+with the list of the leaf EvolSequences of a replicate, and returns
+a list of [name, value], always with the same names (default:
+composition). It is first called with the root sequence alone, for
+the header. With several workers, it must be a function of a module.
+
+Other keyword arguments (algo, segments...) are passed to
+Node.evolve_seq; only the leaf sequences are kept.
+"""
+
+    kw=kw.copy()
+    fname=kw.pop("model","HKY85")
+    fixed=kw.pop("fixed",{})
+    workers=kw.pop("workers",1)
+    seed=kw.pop("seed",0)
+    resume=kw.pop("resume",False)
+    summary=kw.pop("summary",composition)
+    kw["keep"]="leaves"
+    if not hasattr(modeles,fname):
+        raise ValueError, "Unknown model "+str(fname)
+
+    if isinstance(t,str):
+        t=tree.Node(newick=t)
+    if isinstance(seq,str):
+        store="C"
+        s=seq
+    else:
+        store=seq.store()
+        s=seq.seq()
+
+    names=grid.keys()
+    names.sort()
+    head=names+["replicate"]
+    root=evol.EvolSequence(store=store)
+    root.read_str(s)
+    head2=[x[0] for x in summary([root])]
+    del root
+    done={}
+    if resume and os.path.exists(out):
+        old=_read_done(out,head)
+        if old==None:
+            resume=False
+        else:
+            done=old
+    tasks=[]
+    for vals in itertools.product(*[grid[x] for x in names]):
+        key=tuple([_canonical(v) for v in vals])
+        for r in range(n):
+            if not done.has_key(key+(_canonical(r),)):
+                tasks.append((key,dict(zip(names,vals)),r))
+
+    if resume:
+        f=open(out,"a")
+    else:
+        f=open(out,"w")
+        f.write("\t".join(head+head2)+"\n")
+        f.flush()
+    args=(t._struct(),s,store,fname,fixed,seed,summary,kw)
+    if workers<=1:
+        _init(*args)
+        res=itertools.imap(_run,tasks)
+        pool=None
+    else:
+        pool=multiprocessing.Pool(workers,_init,args)
+        res=pool.imap(_run,tasks)
+    try:
+        for key,r,stats in res:
+            f.write("\t".join(list(key)+[str(r)]+
+                              [repr(x[1]) for x in stats])+"\n")
+            f.flush()
+    finally:
+        f.close()
+        if pool!=None:
+            pool.close()
+            pool.join()
+    return len(tasks)
+
+def composition(leaves):
+    """Return the list of [name, value] of the frequencies of the
+    letters ACGT, of GC, of the dinucleotides, and of the ratio
+    observed/expected of CpG, averaged over the EvolSequences of list
+    $1."""
+
+    v=[0.0]*(len(LETTERS)+len(DINUCS)+2)
+    for s in leaves:
+        f=s.freq()
+        d=s.difreq()
+        l=[f[x] for x in LETTERS]
+        l.append(f["C"]+f["G"])
+        l+=[d[x] for x in DINUCS]
+        if f["C"]*f["G"]>0:
+            l.append(d["CG"]/(f["C"]*f["G"]))
+        else:
+            l.append(0.0)
+        for i in range(len(v)):
+            v[i]+=l[i]
+    k=max(1,len(leaves))
+    return zip(list(LETTERS)+["GC_content"]+DINUCS+["CpG_oe"],[x/k for x in v])
+
+def read(fic):
+    """Return the names of the columns of the sweep file $1, and the
+    list of its lines, as lists of floats."""
+
+    f=open(fic)
+    names=f.readline().split()
+    lines=[]
+    for s in f:
+        t=s.split()
+        if len(t)==len(names):
+            lines.append([float(x) for x in t])
+    f.close()
+    return names,lines
+
+def aggregate(fic):
+    """Return the names of the columns, and the list of the lines, of
+    the means over the replicates in sweep file $1.
+
+    Each line holds the values of the parameters of a point, then its
+    number of replicates in column 'replicates', then the means of
+    the statistics.
+    """
+
+    names,lines=read(fic)
+    k=names.index("replicate")
+    points={}
+    order=[]
+    for l in lines:
+        key=tuple(l[:k])
+        if not points.has_key(key):
+            points[key]=[0,[0.0]*(len(l)-k-1)]
+            order.append(key)
+        p=points[key]
+        p[0]+=1
+        for i in range(len(p[1])):
+            p[1][i]+=l[k+1+i]
+    res=[]
+    for key in order:
+        nb,v=points[key]
+        res.append(list(key)+[nb]+[x/nb for x in v])
+    return names[:k]+["replicates"]+names[k+1:],res
+
+def _read_done(fic,head):
+    """Return the dictionary of the keys (parameters, replicate) of
+    the lines of sweep file $1, which columns must begin with list
+    $2, or None if it is empty. An unfinished last line is removed
+    from the file."""
+
+    f=open(fic)
+    text=f.read()
+    f.close()
+    if text.find("\n")==-1:
+        return None
+    if text[-1]!="\n":
+        text=text[:text.rfind("\n")+1]
+        f=open(fic,"w")
+        f.write(text)
+        f.close()
+    lines=text.split("\n")
+    names=lines[0].split("\t")
+    if names[:len(head)]!=head:
+        raise ValueError, "Columns of "+fic+" do not match the grid."
+    done={}
+    for s in lines[1:]:
+        t=s.split("\t")
+        if len(t)==len(names):
+            done[tuple([_canonical(x) for x in t[:len(head)]])]=1
+    return done
+
+def _canonical(x):
+    """Return value $1 of a parameter, or string $1 of a column of a
+    sweep file, as the string written in the file, the same for equal
+    numbers (2, 2L, 2.0 or '2')."""
+    try:
+        return repr(float(x))
+    except (TypeError, ValueError):
+        if isinstance(x,str):
+            return x
+        return repr(x)
+
+def _init(st,s,store,fname,fixed,seed,summary,kw):
+    """Build once in this process the tree and the root sequence of
+    the sweep."""
+    global _job
+    t=tree.Node()
+    t._read_struct(st)
+    seq=evol.EvolSequence(store=store)
+    seq.read_str(s)
+    _job=(t,seq,getattr(modeles,fname),fixed,rng.Rng(seed),summary,kw)
+
+def _run(task):
+    """Evolve replicate r of the point of task (key, parameters, r),
+    and return [key, r, statistics]."""
+    key,par,r=task
+    t,seq,fact,fixed,alea,summary,kw=_job
+    p=fixed.copy()
+    p.update(par)
+    scale=p.pop("scale",1)
+    p["eta"]=p.get("eta",1)*scale
+    m=fact(compiled=True,**p)
+    t.evolve_seq(seq,m,rng=alea.substream(*(key+(r,))),**kw)
+    return [key,r,summary(t.get_leaf_sequences())]
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Tests of the word counts of densecompte, of the FASTA chunks of
+compte and of parcompte, against Compte.add_seq on each sequence:
+
+python test_compte.py
+"""
+
+import itertools
+import os
+import random
+import re
+import tempfile
+import unittest
+
+import compte
+import densecompte
+import parcompte
+
+def words(alph, lg):
+    "Return the list of the words of length at most $2 on letters $1."
+    l=[]
+    for k in range(lg+1):
+        l+=["".join(w) for w in itertools.product(alph,repeat=k)]
+    return l
+
+def same(a, b):
+    "Return True if counts $1 and $2 have the same counted words."
+    return sorted(str(a).split("\n"))==sorted(str(b).split("\n"))
+
+def random_seqs(alea, n, lmax):
+    """Return a list of at most $2 random sequences of at most $3
+    letters, with some N."""
+    return ["".join([alea.choice("ACGTACGTN") for i in
+                     range(alea.randint(0,lmax))])
+            for r in range(alea.randint(1,n))]
+
+def write_fasta(nf, seqs, w):
+    "Write sequences $2 in FASTA file $1, in lines of $3 letters."
+    f=open(nf,"w")
+    for i in range(len(seqs)):
+        s=seqs[i]
+        f.write(">seq%d\n" % i)
+        f.write("".join([s[j:j+w]+"\n" for j in range(0,len(s),w)]))
+    f.close()
+
+class TestCompte(unittest.TestCase):
+
+    def setUp(self):
+        self.dir=tempfile.mkdtemp()
+
+    def tearDown(self):
+        for x in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir,x))
+        os.rmdir(self.dir)
+
+    def test_dense(self):
+        # N cuts the sequence into parts counted on their own
+        alea=random.Random(3)
+        for trial in range(200):
+            lg=alea.randint(1,4)
+            s="".join([alea.choice("ACGTACGTN") for i in
+                       range(alea.randint(0,30))])
+            d=densecompte.DenseCompte(lg)
+            d.add_seq(s,lg)
+            c=compte.Compte()
+            for x in re.findall("[ACGT]+",s):
+                c.add_seq(x,lg)
+            for w in words("ACGT^.",lg+1):
+                self.assertEqual(c[w],d[w])
+            for w in words("ACGT^",min(lg,2)):
+                self.assertEqual(sorted(c.next(w)),sorted(d.next(w)))
+
+    def test_add_file(self):
+        # the chunks of a file count as its whole records
+        alea=random.Random(5)
+        nf=os.path.join(self.dir,"f.fa")
+        for trial in range(100):
+            lg=alea.randint(1,5)
+            seqs=random_seqs(alea,4,40)
+            write_fasta(nf,seqs,alea.randint(1,15))
+            ch=alea.randint(1,20)
+            c=compte.Compte()
+            c.add_file(nf,lg,chunk=ch)
+            d=densecompte.DenseCompte(lg)
+            d.add_file(nf,lg,chunk=ch)
+            c2=compte.Compte()
+            d2=densecompte.DenseCompte(lg)
+            for s in seqs:
+                c2.add_seq(s,lg)
+                d2.add_seq(s,lg)
+            for w in words("ACGTN^",lg):
+                self.assertEqual(c[w],c2[w])
+            self.assertTrue(same(d,d2))
+
+    def test_chunks_headers(self):
+        # a '>' inside a line does not begin a record
+        nf=os.path.join(self.dir,"g.fa")
+        f=open(nf,"w")
+        f.write(">s1 a>b\nAC>GT\n>s2\nTT\nG>G\n>s3\n>s4\r\nCA\r\n")
+        f.close()
+        rec=compte.fasta_records(nf)
+        self.assertEqual(len(rec),4)
+        for ch in range(1,8):
+            for lg in range(1,4):
+                seqs=[]
+                for s,m,deb,fin in compte.fasta_chunks(nf,lg,chunk=ch):
+                    if deb:
+                        seqs.append("")
+                    seqs[-1]+=s[:m]
+                self.assertEqual(seqs,["AC>GT","TTG>G","CA"])
+                seqs=[]
+                for p in zip(rec,rec[1:]+[None]):
+                    for s,m,deb,fin in compte.fasta_chunks(nf,lg,chunk=ch,
+                                                           pos=p):
+                        seqs.append(s[:m])
+                self.assertEqual("".join(seqs),"AC>GTTTG>GCA")
+
+    def test_parallel(self):
+        # the merged shards are the serial counts
+        alea=random.Random(7)
+        files=[os.path.join(self.dir,"f%d.fa" % k) for k in range(2)]
+        for trial in range(15):
+            lg=alea.randint(1,5)
+            seqs=random_seqs(alea,6,300)
+            kw={"workers":alea.choice([1,2]),"shards":alea.randint(1,7)}
+            for k in range(2):
+                write_fasta(files[k],seqs[k::2],7)
+            c=compte.Compte()
+            d=densecompte.DenseCompte(lg)
+            for s in seqs:
+                c.add_seq(s,lg)
+                d.add_seq(s,lg)
+            self.assertTrue(same(c,parcompte.count_seqs(seqs,lg,**kw)))
+            self.assertTrue(same(d,parcompte.count_seqs(seqs,lg,dense=True,
+                                                        **kw)))
+            c=compte.Compte()
+            d=densecompte.DenseCompte(lg)
+            for nf in files:
+                c.add_file(nf,lg)
+                d.add_file(nf,lg)
+            self.assertTrue(same(c,parcompte.count_files(files,lg,chunk=5,
+                                                         **kw)))
+            self.assertTrue(same(d,parcompte.count_files(files,lg,chunk=5,
+                                                         dense=True,**kw)))
+            s=seqs[0]
+            c=compte.Compte()
+            c.add_seq(s,lg)
+            d=densecompte.DenseCompte(lg)
+            d.add_seq(s,lg)
+            self.assertTrue(same(c,parcompte.count_seq(s,lg,**kw)))
+            self.assertTrue(same(d,parcompte.count_seq(s,lg,dense=True,
+                                                       **kw)))
+
+    def test_parallel_record(self):
+        # a long record is cut into ranges counted as the whole one
+        alea=random.Random(8)
+        nf=os.path.join(self.dir,"r.fa")
+        for trial in range(20):
+            lg=alea.randint(1,5)
+            seqs=random_seqs(alea,2,2000)
+            write_fasta(nf,seqs,alea.randint(1,60))
+            if trial%2:
+                f=open(nf)
+                text=f.read()
+                f.close()
+                f=open(nf,"w")
+                f.write("NACG\r\n"+text.replace("\n","\r\n"))
+                f.close()
+            kw={"workers":alea.choice([1,2]),"shards":alea.randint(2,9),
+                "chunk":alea.randint(1,50)}
+            c=compte.Compte()
+            c.add_file(nf,lg)
+            d=densecompte.DenseCompte(lg)
+            d.add_file(nf,lg)
+            self.assertTrue(same(c,parcompte.count_files(nf,lg,**kw)))
+            self.assertTrue(same(d,parcompte.count_files(nf,lg,dense=True,
+                                                         **kw)))
+
+if __name__=="__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Tests of the evolution algorithms of evol.
+
+The algorithms simulate the same process, so that the mean numbers of
+changed positions over seeded replicates are compared, between them
+and with the expected value when it is known:
+
+python test_evol.py
+"""
+
+import math
+import unittest
+
+import eventlog
+import evol
+import modeles
+import ratecache
+import rng
+import sampler
+import stats
+from model import Model
+
+def random_string(l, alea):
+    "Return a random string of $1 letters ACGT, with Rng $2."
+    b=alea.getrandbits
+    return "".join(["ACGT"[b(2)] for i in xrange(l)])
+
+def divergence(st, f, n):
+    """Return the mean and the standard error of the number of
+    changed positions of $3 EvolSequences of string $1, each evolved
+    by f(sequence, replicate)."""
+
+    v=[]
+    for r in range(n):
+        s=evol.EvolSequence()
+        s.generate(len(st))
+        s[0:len(st)]=st
+        f(s,r)
+        x=s.seq()
+        v.append(sum([1 for i in xrange(len(st)) if x[i]!=st[i]]))
+    m=float(sum(v))/n
+    var=sum([(y-m)**2 for y in v])/(n-1)
+    return m,math.sqrt(var/n)
+
+class TestEvolve(unittest.TestCase):
+
+    def assertClose(self, a, b):
+        "Check that means and errors $1 and $2 are within 4 errors."
+        self.assertTrue(abs(a[0]-b[0])<4*math.sqrt(a[1]**2+b[1]**2),
+                        "%s and %s differ" % (a,b))
+
+    def test_jc_expected(self):
+        # without contexts, every algorithm gives the JC divergence
+        m=Model(str=modeles.JC())
+        l=2000
+        d=0.3
+        st=random_string(l,rng.Rng(1))
+        e=0.75*(1-math.exp(-4.0/3*d))*l
+        for algo in ["Berard","Gillespie","Thinning","Matrix","Native"]:
+            x=divergence(st,lambda s,r: s.evolve(m,d,algo=algo,
+                                                 rng=rng.Rng(r)),20)
+            self.assertClose(x,(e,0))
+
+    def test_gillespie_berard(self):
+        # with contexts, the exact algorithms agree
+        m=Model(str=modeles.HKY85(rCgT=10,rcGA=10,kappa=2))
+        st=random_string(1500,rng.Rng(2))
+        ref=divergence(st,lambda s,r: s.evolve(m,0.3,algo="Berard",
+                                               rng=rng.Rng(r)),30)
+        for kw in [{"algo":"Gillespie"},{"algo":"Thinning"},
+                   {"algo":"Native"},{"block":64}]:
+            x=divergence(st,lambda s,r: s.evolve(m,0.3,rng=rng.Rng(100+r),
+                                                 **kw),30)
+            self.assertClose(x,ref)
+
+    def test_block(self):
+        # blocks of proposals are drawn only by Berard
+        m=Model(str=modeles.HKY85(kappa=2))
+        s=evol.EvolSequence()
+        s.generate(200)
+        s[0:200]=random_string(200,rng.Rng(3))
+        log=eventlog.EventLog()
+        s.evolve(m,0.3,block=16,rng=rng.Rng(1),log=log)
+        # and not by the default Matrix, which logs no time
+        self.assertTrue(len(log)>0 and min(log.times())>=0)
+        for algo in ["Gillespie","Thinning","Matrix","Native","tau"]:
+            self.assertRaises(ValueError,s.evolve,m,0.3,algo=algo,block=16)
+
+    def test_tau(self):
+        # the leaps draw as many substitutions as the exact algorithms
+        m=Model(str=modeles.HKY85(rCgT=10,rcGA=10,kappa=2))
+        alea=rng.Rng(4)
+        st=random_string(1500,alea)
+        w=[[0,0.5,1,2][alea.getrandbits(2)] for i in range(1500)]
+        for kw in [{},{"sampler":sampler.Sampler(weights=w)}]:
+            res=[]
+            for algo in ["Berard","Gillespie","tau"]:
+                x=stats.Stats()
+                res.append(divergence(st,lambda s,r: s.evolve(
+                    m,0.3,algo=algo,rng=rng.Rng(r),stats=x,**kw),30))
+                res.append(x.substitutions())
+            self.assertClose(res[4],res[0])
+            self.assertClose(res[4],res[2])
+            for i in [1,3]:
+                self.assertClose((res[5],math.sqrt(res[5])),
+                                 (res[i],math.sqrt(res[i])))
+
+    def test_matrix_berard(self):
+        # per-site weights change the time of each site
+        m=Model(str=modeles.HKY85(kappa=2))
+        l=1500
+        alea=rng.Rng(3)
+        st=random_string(l,alea)
+        w=[[0,0.5,1,2][alea.getrandbits(2)] for i in range(l)]
+        res=[]
+        for algo in ["Berard","Matrix"]:
+            res.append(divergence(st,lambda s,r: s.evolve(
+                m,0.5,algo=algo,sampler=sampler.Sampler(weights=w),
+                rng=rng.Rng(r)),30))
+        self.assertClose(res[0],res[1])
+
+    def test_cache(self):
+        # only Berard keeps the RateCache, also without contexts
+        for st in [modeles.HKY85(kappa=2),modeles.HKY85(rCgT=10,kappa=2)]:
+            m=Model(str=st)
+            s=evol.EvolSequence()
+            s.generate(500)
+            c=ratecache.RateCache(s,m)
+            s.evolve(m,0.5,cache=c,rng=rng.Rng(1))
+            c2=ratecache.RateCache(s,m)
+            self.assertEqual([c.rate_at(i) for i in range(500)],
+                             [c2.rate_at(i) for i in range(500)])
+            for algo in ["Gillespie","Thinning","Matrix","Native","tau"]:
+                self.assertRaises(ValueError,s.evolve,m,0.5,algo=algo,cache=c)
+
+    def test_evolve_seg_sampler(self):
+        # a sampler over the ranges does not change the process
+        m1=Model(str=modeles.JC())
+        m2=Model(str=modeles.HKY85(rCgT=10,kappa=2))
+        l=600
+        dmod={(0,400):m1,(200,600):m2}
+        st=random_string(l,rng.Rng(4))
+        ref=divergence(st,lambda s,r: s.evolve_seg(dmod,0.3,
+                                                   rng=rng.Rng(r)),40)
+        x=divergence(st,lambda s,r: s.evolve_seg(
+            dmod,0.3,sampler=sampler.Sampler(mask=[1]*l),
+            rng=rng.Rng(100+r)),40)
+        self.assertClose(x,ref)
+
+    def test_evolve_blocks(self):
+        # with the default slices, the blocks give the same process
+        m=Model(str=modeles.HKY85(rCgT=30,rcGA=30,kappa=2))
+        st=random_string(3000,rng.Rng(5))
+        ref=divergence(st,lambda s,r: s.evolve(m,0.4,rng=rng.Rng(r)),20)
+        x=divergence(st,lambda s,r: s.evolve_blocks(m,0.4,blocks=300,
+                                                    rng=rng.Rng(100+r)),20)
+        self.assertClose(x,ref)
+        s=evol.EvolSequence(store="array")
+        s.read_str(st)
+        self.assertRaises(ValueError,s.evolve_blocks,m,0.4,
+                          cache=ratecache.RateCache(s,m))
+
+if __name__=="__main__":
+    unittest.main()
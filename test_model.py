@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests of the compiled substitutions of model and modeles:
+
+python test_model.py
+"""
+
+import random
+import unittest
+
+import modeles
+import sequence
+from model import Model
+
+def scan(m, st, pos):
+    """Return the list of [target, rate, number] of the substitutions
+    of Model $1 allowed at position $3 of string $2, by reading every
+    rule."""
+
+    l=[]
+    c=st[pos]
+    for n,k in enumerate(m.rules()):
+        left,x,right,t,v=k
+        if x==c and t!=c and pos>=len(left) and \
+           pos+len(right)<len(st) and \
+           st[pos-len(left):pos]==left and \
+           st[pos+1:pos+1+len(right)]==right:
+            l.append([t,v,n])
+    return l
+
+class TestLookup(unittest.TestCase):
+
+    def test_lookup_scan(self):
+        # the window table gives the rules found by a scan
+        alea=random.Random(1)
+        for trial in range(50):
+            t=""
+            for i in range(alea.randint(1,8)):
+                x,y=alea.sample("ACGT",2)
+                t+="%s%s%s|%s %d\n" % ("".join([alea.choice("acgt") for j in
+                                                 range(alea.randint(0,2))]),
+                                        x,
+                                        "".join([alea.choice("acgt") for j in
+                                                 range(alea.randint(0,2))]),
+                                        y,alea.randint(1,5))
+            m=Model(str=t)
+            self.assertTrue(m.rules()!=[])
+            st="".join([alea.choice("ACGT") for i in range(40)])
+            s=sequence.Sequence()
+            s.generate(len(st))
+            s[0:len(st)]=st
+            for i in range(len(st)):
+                self.assertEqual(sorted(m.rules_at(s,i)),
+                                 sorted(scan(m,st,i)))
+
+    def test_compiled_text(self):
+        # the Models built from rates are those read from the text
+        par=[{},{"kappa":2,"rCgT":10,"rcGA":7,"theta":0.4,"theta1":0.3,
+                 "theta2":0.6,"eta":2,"kappa1":2,"kappa2":3,"a":2,"b":3}]
+        for f in ["JC","K80","T92","HKY85","TN93","F84","GTR"]:
+            for p in par:
+                m=getattr(modeles,f)(compiled=True,**p)
+                t=Model(str=getattr(modeles,f)(**p))
+                a=sorted(m.rules())
+                b=sorted(t.rules())
+                self.assertEqual([x[:4] for x in a],[x[:4] for x in b])
+                for x,y in zip(a,b):
+                    self.assertAlmostEqual(x[4],y[4],5)
+                self.assertAlmostEqual(m._Model__max,t._Model__max,5)
+                self.assertTrue(m is getattr(modeles,f)(compiled=True,**p))
+
+if __name__=="__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tests of the replicated simulations of replicate, against serial
+evolutions along the tree:
+
+python test_replicate.py
+"""
+
+import os
+import tempfile
+import unittest
+
+import evol
+import modeles
+import replicate
+import rng
+import tree
+from model import Model
+
+TREE="((a:0.1,b:0.2):0.1,(c:0.3,d:0.1):0.2,e:0.1);"
+
+def serial(seq, m, i):
+    """Return the list of the leaf Sequences of TREE after evolving
+    EvolSequence $1 along it with model $2 and seed $3."""
+    t=tree.Node(newick=TREE)
+    t.evolve_seq(seq,m,seed=i,keep="leaves")
+    return t.get_leaf_sequences()
+
+class TestReplicate(unittest.TestCase):
+
+    def setUp(self):
+        self.model=Model(str=modeles.HKY85(rCgT=10,kappa=2))
+        b=rng.Rng(1).getrandbits
+        self.seq=evol.EvolSequence(store="array")
+        self.seq.read_str("".join(["ACGT"[b(2)] for i in xrange(300)]))
+        self.dir=tempfile.mkdtemp()
+
+    def tearDown(self):
+        for x in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir,x))
+        os.rmdir(self.dir)
+
+    def test_serial(self):
+        # replicate i is the serial evolution with seed i
+        for w in [1,2]:
+            got=[]
+            n=replicate.replicates(TREE,self.seq,self.model,4,workers=w,
+                                   first=3,
+                                   callback=lambda i,l: got.append([i,l]))
+            self.assertEqual(n,4)
+            self.assertEqual([x[0] for x in got],range(3,7))
+            for i,l in got:
+                self.assertEqual(l,[[x.name(),x.seq()] for x in
+                                    serial(self.seq,self.model,i)])
+
+    def test_out(self):
+        # the written replicates are those of the serial evolutions
+        text=["".join([x.fasta() for x in serial(self.seq,self.model,i)])
+              for i in range(3)]
+        for w in [1,2]:
+            nf=os.path.join(self.dir,"all%d.fa" % w)
+            replicate.replicates(TREE,self.seq,self.model,3,workers=w,out=nf)
+            f=open(nf)
+            self.assertEqual(f.read(),"".join(text))
+            f.close()
+            nf=os.path.join(self.dir,"r%d_%%d.fa" % w)
+            replicate.replicates(TREE,self.seq,self.model,3,workers=w,out=nf)
+            for i in range(3):
+                f=open(nf % i)
+                self.assertEqual(f.read(),text[i])
+                f.close()
+
+if __name__=="__main__":
+    unittest.main()
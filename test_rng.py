@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Tests of the seeded random number generators of rng:
+
+python test_rng.py
+"""
+
+import pickle
+import unittest
+
+import rng
+
+def draws(r, n=20):
+    "Return the list of the next $2 random() of Rng $1."
+    return [r.random() for i in xrange(n)]
+
+class TestRng(unittest.TestCase):
+
+    def test_dumps(self):
+        # a dumped Rng goes on with the same numbers
+        r=rng.Rng(7)
+        draws(r)
+        r2=rng.loads(r.dumps())
+        r3=pickle.loads(pickle.dumps(r))
+        self.assertEqual(r2.first_seed(),7)
+        self.assertEqual(r3.first_seed(),7)
+        ref=draws(r)
+        self.assertEqual(draws(r2),ref)
+        self.assertEqual(draws(r3),ref)
+        self.assertEqual(r.substream(1).random(),r2.substream(1).random())
+
+    def test_substream(self):
+        # substreams depend on the seed and keys only
+        r=rng.Rng(5)
+        ref=draws(r.substream(2,"a"))
+        draws(r)
+        self.assertEqual(draws(r.substream(2,"a")),ref)
+        self.assertEqual(draws(rng.Rng(5L).substream(2L,"a")),ref)
+        self.assertEqual(draws(rng.Rng(5.0).substream(2.0,"a")),ref)
+        self.assertEqual(draws(rng.Rng(5L)),draws(rng.Rng(5)))
+        l=[draws(r.substream(*k)) for k in
+           [(2,),("2",),(2,"a","b"),(2,"ab"),(1,),(6,"a"),()]]
+        l.append(draws(rng.Rng(6).substream(2,"a")))
+        l.append(ref)
+        for i in range(len(l)):
+            for j in range(i):
+                self.assertNotEqual(l[i],l[j])
+        self.assertEqual([x.random() for x in r.split(3)],
+                         [r.substream(i).random() for i in range(3)])
+        self.assertRaises(ValueError,r.substream,2.5)
+        self.assertRaises(ValueError,rng.Rng,1.5)
+
+    def test_independent(self):
+        # two substreams are not correlated
+        r=rng.Rng(11)
+        n=20000
+        a=draws(r.substream(0),n)
+        b=draws(r.substream(1),n)
+        ma=sum(a)/n
+        mb=sum(b)/n
+        c=sum([(a[i]-ma)*(b[i]-mb) for i in xrange(n)])/n
+        self.assertTrue(abs(ma-0.5)<0.01 and abs(mb-0.5)<0.01)
+        self.assertTrue(abs(c*12)<0.03)
+
+if __name__=="__main__":
+    unittest.main()
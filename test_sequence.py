@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Tests of the storages of sequence, the array one against the C++
+one:
+
+python test_sequence.py
+"""
+
+import random
+import unittest
+
+import sequence
+
+def both(st):
+    "Return the Sequences of string $1 in the C++ and array storages."
+    l=[]
+    for store in ["C","array"]:
+        s=sequence.Sequence(store=store)
+        s.generate(len(st))
+        s[0:len(st)]=st
+        l.append(s)
+    return l
+
+class TestStorage(unittest.TestCase):
+
+    def test_str(self):
+        # the array storage writes the lines of the C++ one
+        alea=random.Random(1)
+        for l in range(1,260)+[1000,1001,1010]:
+            st="".join([alea.choice("ACGT") for i in range(l)])
+            a,b=both(st)
+            self.assertEqual(str(a._Seq__gen),str(b._Seq__gen))
+
+    def test_slices(self):
+        alea=random.Random(2)
+        st="".join([alea.choice("ACGT") for i in range(50)])
+        a,b=both(st)
+        for i in range(0,50,3):
+            for j in range(i,51,7):
+                self.assertEqual(a[i:j].seq(),b[i:j].seq())
+        for i in range(-50,50):
+            self.assertEqual(a[i],b[i])
+        self.assertRaises(IndexError,lambda: a._Seq__gen[50])
+        self.assertRaises(IndexError,lambda: b._Seq__gen[50])
+
+if __name__=="__main__":
+    unittest.main()
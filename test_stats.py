@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests of the counters of stats, filled by the evolutions of evol:
+
+python test_stats.py
+"""
+
+import unittest
+
+import evol
+import eventlog
+import modeles
+import rng
+import stats
+from model import Model
+
+class TestStats(unittest.TestCase):
+
+    def test_counters(self):
+        # the counters add up
+        a=stats.Stats()
+        a.propose(5)
+        a.fire(2)
+        a.fire(-1,2)
+        a.reject("left")
+        a.reject("same")
+        a.add_time(1.5)
+        b=stats.Stats()
+        b.propose()
+        b.fire(2)
+        b.reject("left")
+        b+=a
+        self.assertEqual(b.proposals(),6)
+        self.assertEqual(b.substitutions(),4)
+        self.assertEqual(b.rejections(),3)
+        self.assertEqual(b.rejections("left"),2)
+        self.assertEqual(b.rejections("rate"),0)
+        self.assertEqual(b.rule_fires(),{2:2,-1:2})
+        self.assertEqual(b.time(),1.5)
+        self.assertEqual(str(b).split("\n")[:3],
+                         ["proposals\t6","substitutions\t4",
+                          "rejected_rate\t0"])
+        b.reset_time()
+        self.assertEqual(b.time(),0.0)
+        self.assertEqual(b.proposals(),6)
+
+    def test_evolve(self):
+        # each proposal is a substitution or a rejection
+        m=Model(str=modeles.HKY85(rCgT=10,kappa=2))
+        b=rng.Rng(2).getrandbits
+        st="".join(["ACGT"[b(2)] for i in xrange(1000)])
+        for kw in [{"algo":"Berard"},{"block":64},{"algo":"Gillespie"},
+                   {"algo":"Thinning"},{"algo":"Native"}]:
+            s=evol.EvolSequence()
+            s.generate(len(st))
+            s[0:len(st)]=st
+            x=stats.Stats()
+            log=eventlog.EventLog()
+            s.evolve(m,0.3,rng=rng.Rng(1),stats=x,log=log,**kw)
+            self.assertTrue(x.substitutions()>0)
+            self.assertEqual(sum(x.rule_fires().values()),x.substitutions())
+            self.assertTrue(x.time()>0)
+            if kw.get("algo")=="Native":
+                # the rejections are not counted by cause
+                self.assertTrue(x.proposals()>x.substitutions())
+                self.assertEqual(x.rejections(),0)
+                self.assertEqual(x.rule_fires().keys(),[-1])
+                # the log holds only the changed positions
+                self.assertTrue(len(log)<=x.substitutions())
+            else:
+                self.assertEqual(x.proposals(),
+                                 x.substitutions()+x.rejections())
+                self.assertEqual(len(log),x.substitutions())
+                self.assertEqual(sorted(x.rule_fires().items()),
+                                 sorted([(r,list(log.rules()).count(r))
+                                         for r in set(log.rules())]))
+            if kw.get("algo")=="Gillespie":
+                self.assertEqual(x.rejections(),0)
+
+if __name__=="__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Tests of the parameter sweeps of sweep:
+
+python test_sweep.py
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import sweep
+
+TREE="((a:0.1,b:0.2):0.1,(c:0.3,d:0.1):0.2);"
+GRID={"kappa":[1,2],"theta":[0.4,0.6],"rCgT":[0,10]}
+
+def lines(nf):
+    "Return the sorted list of the lines of file $1."
+    f=open(nf)
+    l=f.read().split("\n")
+    f.close()
+    l.sort()
+    return l
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.dir=tempfile.mkdtemp()
+        alea=random.Random(1)
+        self.seq="".join([alea.choice("ACGT") for i in range(500)])
+
+    def tearDown(self):
+        for x in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir,x))
+        os.rmdir(self.dir)
+
+    def test_workers(self):
+        # the replicates do not depend on the number of processes
+        a=os.path.join(self.dir,"a.tsv")
+        b=os.path.join(self.dir,"b.tsv")
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,2,a),16)
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,2,b,workers=2),16)
+        self.assertEqual(lines(a),lines(b))
+
+    def test_resume(self):
+        # a stopped sweep, with an unfinished line, is completed
+        a=os.path.join(self.dir,"a.tsv")
+        b=os.path.join(self.dir,"b.tsv")
+        sweep.sweep(TREE,self.seq,GRID,2,a)
+        f=open(a)
+        l=f.read().split("\n")
+        f.close()
+        f=open(b,"w")
+        f.write("\n".join(l[:7])+"\n"+l[7][:9])
+        f.close()
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,2,b,resume=True),10)
+        self.assertEqual(lines(a),lines(b))
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,2,b,resume=True),0)
+        self.assertEqual(lines(a),lines(b))
+
+    def test_empty(self):
+        # the header is written without replicates, and 2.0 is 2
+        a=os.path.join(self.dir,"a.tsv")
+        b=os.path.join(self.dir,"b.tsv")
+        sweep.sweep(TREE,self.seq,GRID,2,a)
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,0,b),0)
+        f=open(a)
+        self.assertEqual(lines(b),["",f.readline()[:-1]])
+        f.close()
+        self.assertEqual(sweep.sweep(TREE,self.seq,GRID,2,b,resume=True),16)
+        self.assertEqual(lines(a),lines(b))
+        grid=GRID.copy()
+        grid["kappa"]=[1.0,2L]
+        self.assertEqual(sweep.sweep(TREE,self.seq,grid,2,b,resume=True),0)
+
+    def test_aggregate(self):
+        # the means are those of the written values
+        a=os.path.join(self.dir,"a.tsv")
+        sweep.sweep(TREE,self.seq,GRID,3,a)
+        names,l=sweep.read(a)
+        names2,m=sweep.aggregate(a)
+        k=names.index("replicate")
+        self.assertEqual(names2[k],"replicates")
+        self.assertEqual(len(m),8)
+        for x in m:
+            v=[y for y in l if y[:k]==x[:k]]
+            self.assertEqual(x[k],3)
+            for i in range(k+1,len(names)):
+                self.assertAlmostEqual(x[i],sum([y[i] for y in v])/3,12)
+
+if __name__=="__main__":
+    unittest.main()
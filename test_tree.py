@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Tests of the evolution of sequences along the trees of tree:
+
+python test_tree.py
+"""
+
+import os
+import tempfile
+import unittest
+
+import eventlog
+import evol
+import modeles
+import rng
+import stats
+import tree
+from model import Model
+
+TREE="((a:0.1,b:0.2)ab:0.1,((c:0.3,d:0.1)cd:0.2,(e:0.1,f:0.2,g:0.1)efg:0.1)x:0.1,h:0.2);"
+
+def root_sequence(l, seed):
+    "Return a random EvolSequence of $1 letters, with seed $2."
+    b=rng.Rng(seed).getrandbits
+    s=evol.EvolSequence(store="array")
+    s.read_str("".join(["ACGT"[b(2)] for i in xrange(l)]))
+    return s
+
+def leaves(t):
+    "Return the list of [label, sequence string] of the leaves of $1."
+    return [[n.label(),n.sequence().seq()] for n in t.get_leaves()]
+
+def nodes(t):
+    "Return the list of the Nodes of the sub-tree of $1, in preorder."
+    l=[t]
+    for i in range(t.nb_children()):
+        l+=nodes(t.go_child(i))
+    return l
+
+class TestTree(unittest.TestCase):
+
+    def setUp(self):
+        self.model=Model(str=modeles.HKY85(rCgT=10,kappa=2))
+        self.seq=root_sequence(400,1)
+
+    def evolve(self, **kw):
+        "Return a Node of TREE along which self.seq evolved with $1."
+        t=tree.Node(newick=TREE)
+        t.evolve_seq(self.seq,self.model,**kw)
+        return t
+
+    def test_workers(self):
+        # with a seed, the leaves do not depend on the number of workers
+        ref=leaves(self.evolve(seed=3))
+        self.assertEqual(len(ref),8)
+        for w in [3,5]:
+            self.assertEqual(leaves(self.evolve(seed=3,workers=w)),ref)
+        self.assertNotEqual(leaves(self.evolve(seed=4,workers=3)),ref)
+
+    def test_keep(self):
+        # the kept sequences are those of 'all', the others are freed
+        ref=self.evolve(seed=3)
+        seqs=dict([[n.label(),n.sequence().seq()] for n in nodes(ref)])
+        for w in [1,3]:
+            for keep in ["all","leaves","none",["ab","c","x","h"]]:
+                t=self.evolve(seed=3,workers=w,keep=keep)
+                for n in nodes(t):
+                    if keep=="all":
+                        kept=True
+                    elif keep=="leaves":
+                        kept=n.nb_children()==0
+                    elif keep=="none":
+                        kept=False
+                    else:
+                        kept=n.label() in keep
+                    if kept:
+                        self.assertEqual(n.sequence().seq(),seqs[n.label()])
+                    else:
+                        self.assertEqual(n.sequence(),None)
+
+    def test_out(self):
+        # the streamed leaves are those of the kept ones
+        ref=self.evolve(seed=3)
+        fasta="".join([x.fasta() for x in ref.get_leaf_sequences()])
+        phylip="8\t400\n"+"".join([x.name()+" "*(10-len(x.name()))+x.seq()+
+                                    "\n" for x in ref.get_leaf_sequences()])
+        d=tempfile.mkdtemp()
+        nf=os.path.join(d,"leaves")
+        try:
+            for w in [1,3]:
+                for form,text in [["fasta",fasta],["phylip",phylip]]:
+                    for kw in [{"keep":"none"},{"delta":True}]:
+                        self.evolve(seed=3,workers=w,out=nf,format=form,**kw)
+                        f=open(nf)
+                        self.assertEqual(f.read(),text)
+                        f.close()
+        finally:
+            if os.path.exists(nf):
+                os.remove(nf)
+            os.rmdir(d)
+
+    def test_delta(self):
+        # the Deltas give the sequences of the copies, and undo them
+        for algo in ["Berard","Gillespie"]:
+            ref=self.evolve(seed=3,algo=algo)
+            seqs=dict([[n.label(),n.sequence().seq()] for n in nodes(ref)])
+            for w in [1,3]:
+                t=self.evolve(seed=3,algo=algo,workers=w,delta=True)
+                for n in nodes(t):
+                    s=n.sequence()
+                    self.assertEqual(s.__class__,evol.EvolSequence)
+                    self.assertEqual(s.seq(),seqs[n.label()])
+                    if n.delta()!=None:
+                        n.delta().undo(s)
+                        self.assertEqual(s.seq(),
+                                         n.go_father().sequence().seq())
+        self.assertEqual(self.seq.seq(),root_sequence(400,1).seq())
+
+    def test_log(self):
+        # the EventLog of a branch changes the father into the Node
+        d=tempfile.mkdtemp()
+        nf=os.path.join(d,"log")
+        try:
+            for algo in ["Berard","Gillespie","Thinning"]:
+                for w in [1,3]:
+                    st=stats.Stats()
+                    t=self.evolve(seed=3,algo=algo,workers=w,log=True,
+                                  stats=st)
+                    n_log=0
+                    for n in nodes(t)[1:]:
+                        log=n.log()
+                        self.assertEqual(len(log),n.stats().substitutions())
+                        n_log+=len(log)
+                        log.tofile(nf)
+                        r=eventlog.read(nf)
+                        self.assertEqual([r[i] for i in range(len(r))],
+                                         [log[i] for i in range(len(log))])
+                        s=n.go_father().sequence().copy()
+                        for i in range(len(log)):
+                            pos,old,new=log[i][:3]
+                            self.assertEqual(s[pos],old)
+                            s[pos]=new
+                        self.assertEqual(s.seq(),n.sequence().seq())
+                    self.assertEqual(n_log,st.substitutions())
+        finally:
+            if os.path.exists(nf):
+                os.remove(nf)
+            os.rmdir(d)
+
+if __name__=="__main__":
+    unittest.main()
@@ -26,8 +26,14 @@ __date__ = "17 October 2007"
 __credits__ = """Guido van Rossum, for an excellent programming language."""
 
 import string
+import multiprocessing
 
 import evol
+import rng
+import delta
+import eventlog
+import interval
+import stats
 
 #######################################################################
 #######################################################################
@@ -59,6 +65,9 @@ class Node:
 	self.__l=0 #length of the branch to the father-Node
 	self.__lab="" #Node label
 	self.__seq=None #Node sequence
+	self.__delta=None #Node sequence, as a Delta against the father
+	self.__log=None #EventLog of the branch
+	self.__stats=None #Stats of the branch
 	self.__boot=None #bootstrap value at the Node
 	self.__father=None
 	self.__children=[]
@@ -69,8 +78,42 @@ class Node:
 
 
     def sequence(self):
-        """Return the Sequence of the Node."""
-        return self.__seq
+        """Return the Sequence of the Node.
+
+        If the Node holds a Delta against its father, a NEW Sequence
+        is built from the nearest ancestor holding a Sequence.
+        """
+
+        if self.__delta==None:
+            return self.__seq
+        l=[]
+        n=self
+        while n.__delta!=None:
+            l.append(n.__delta)
+            n=n.__father
+        if n.__seq==None:
+            return None
+        s=n.__seq.copy()
+        for d in reversed(l):
+            d.apply(s)
+        s.g_name(self.__lab)
+        return s
+
+    def delta(self):
+        """Return the Delta of the sequence of the Node against the
+        sequence of its father, or None if the Node holds a whole
+        Sequence."""
+        return self.__delta
+
+    def log(self):
+        """Return the EventLog of the substitutions on the edge to the
+        father, or None."""
+        return self.__log
+
+    def stats(self):
+        """Return the Stats of the evolution on the edge to the
+        father, or None."""
+        return self.__stats
 
     def lg(self):
         """Return the length of the edge to the father."""
@@ -303,7 +346,7 @@ class Node:
 	    for i in self.__children:
 		a+=i.get_leaf_sequences()
 	else:
-	    a+=[self.__seq]
+	    a+=[self.sequence()]
 	return a
 
     def get_leaves(self):
@@ -432,20 +475,21 @@ root.
 """
 	
 	self.__seq=seq
+	self.__delta=None
 	return
 
     def evolve_seq(self,seq,mod, **kw): #verifier que les arguments marchent!!!
-	"""Assign a sequence $1 to the Node, and evolve it along the
-	sub-tree defined by the Node, according to model $2.
+        """Assign a sequence $1 to the Node, and evolve it along the
+        sub-tree defined by the Node, according to model $2.
 
         WARNING: Must be used with the EvolSequence class in order to
         be able to simulate evolution.
 
-	Keyword argument to determine how the number of substitutions
-	on the sequence is approximated: [approx=string] 'Rounded' is
-	the default. Keyword argument to determine the algorithm used
-	to simulate neighbor-dependent substitutions: [algo=string]
-	'Berard' is the default.
+        Keyword argument to determine how the number of substitutions
+        on the sequence is approximated: [approx=string] 'Rounded' is
+        the default. Keyword argument to determine the algorithm used
+        to simulate neighbor-dependent substitutions: [algo=string]
+        'Berard' is the default.
 
         Optional argument 'positions' is a list of all allowed
         positions. This argument defaults to all positions of the
@@ -453,42 +497,328 @@ root.
         
         WARNING: When an empty list is given, all positions are
         considered allowed.
-"""
 
-        self.__seq=seq.copy()
-        self.__seq.g_name(self.__lab)
-	self.__seq.evolve(mod,self.__l, **kw)
-        
-	for c in self.__children:
-            c.evolve_seq(self.__seq,mod, **kw)
-            
+        Keyword argument to evolve independent sub-trees in parallel:
+        [workers=int] is the number of processes (default: 1).
+        Keyword argument to make the evolution reproducible:
+        [seed=int] or [rng=Rng]. Each branch is then evolved with its
+        own substream of the Rng, computed from the place of the
+        branch in the tree, so that the sequences do not depend on the
+        number of workers. With workers and no seed, a seed is drawn.
+
+        Keyword argument to choose the sequences kept on the Nodes:
+        [keep=string] 'all' (default), 'leaves' or 'none', or a list
+        of the labels of the Nodes to keep. The sequence of a Node
+        which is not kept is freed once all its children have
+        started, and the last child evolves it without copy; then
+        the memory grows with the depth of the tree, not its size.
+
+        Keyword argument to write the leaf sequences as soon as they
+        are final: [out=string] is a file name, or an open file.
+        Keyword argument for the format: [format=string] 'fasta'
+        (default) or 'phylip' (sequential). The leaves are written in
+        the order of get_leaves().
+
+        Keyword argument to store the sequences as differences:
+        [delta=bool] (default: False). The Node evolved first holds
+        its Sequence, and the other Nodes a Delta against their
+        father, which is rebuilt on demand by sequence(); the memory
+        then grows with the number of substitutions. Argument 'keep'
+        is not used.
+
+        Keyword argument to record the substitutions of each branch:
+        [log=bool] (default: False). The EventLog of each Node is
+        given by log().
+
+        Keyword argument to count the proposals, substitutions and
+        rejections: [stats=Stats]. The Stats of each branch, with its
+        time, is given by stats() of its Node, and they are all added
+        to the given Stats.
+        """
+
+        self.__evolve("evolve",seq,mod,kw)
+
     def evolve_seg_seq(self,seq,dmod,**kw):
-	"""Assign a sequence $1 to the Node, and evolve it along the
-	sub-tree defined by the Node, according to models in
-	dictionary $2.
+        """Assign a sequence $1 to the Node, and evolve it along the
+        sub-tree defined by the Node, according to models in
+        dictionary $2.
 
         The dictionary items are (deb,fin):mod where the modele mod is
         applied to the positions in range [deb:fin]. If ranges
-        overlap, a random model is applied on each substitution that
-        occurs in the overlap.
+        overlap, the rates of their models add up in the overlap. The
+        ranges are indexed once for the whole sub-tree.
         
         WARNING: Must be used with the EvolSequence class in order to
         be able to simulate evolution.
 
-	Keyword argument to determine how the number of substitutions
-	on the sequence is approximated: [approx=string] 'Rounded' is
-	the default. Keyword argument to determine the algorithm used
-	to simulate neighbor-dependent substitutions: [algo=string]
-	'Berard' is the default.
+        Keyword argument to determine how the number of substitutions
+        on the sequence is approximated: [approx=string] 'Rounded' is
+        the default. Keyword argument to determine the algorithm used
+        to simulate neighbor-dependent substitutions: [algo=string]
+        'Berard' is the default.
+
+        Keyword arguments [workers=int], [seed=int], [rng=Rng],
+        [keep=string], [out=string], [format=string], [delta=bool],
+        [log=bool] and [stats=Stats] are as in evolve_seq.
+        """
 
+        if not isinstance(dmod,interval.IntervalIndex):
+            dmod=interval.IntervalIndex(dmod)
+        self.__evolve("evolve_seg",seq,dmod,kw)
+
+    def __evolve(self,meth,seq,mod,kw):
+        """Evolve sequence $2 along the sub-tree with method $1 of
+        EvolSequence and model(s) $3; $4 is the dictionary of keyword
+        arguments.
+        """
+
+        kw=kw.copy()
+        workers=kw.pop("workers",1)
+        seed=kw.pop("seed",None)
+        alea=kw.pop("rng",None)
+        keep=kw.pop("keep","all")
+        out=kw.pop("out",None)
+        form=kw.pop("format","fasta")
+        if kw.pop("delta",False):
+            keep=None
+        total=kw.get("stats")
+        if form!="fasta" and form!="phylip":
+            raise ValueError, "Unknown format "+str(form)
+        if alea==None and seed!=None:
+            alea=rng.Rng(seed)
+
+        f=None
+        write=None
+        if out!=None:
+            if isinstance(out,str):
+                f=open(out,"w")
+                g=f
+            else:
+                g=out
+            if form=="phylip":
+                g.write(str(len(self.get_leaves()))+"\t"+str(len(seq))+"\n")
+            write=lambda x: g.write(_leaf_text(x,form))
+        else:
+            form=None
+        try:
+            if workers<=1 and keep==None:
+                self._evolve_seeded(meth,seq,mod,alea,(),kw,0)
+                if self.__children==[] and write!=None:
+                    write(self.__seq)
+                work=self.__seq.copy()
+                for i in range(len(self.__children)):
+                    self.__children[i]._evolve_delta(meth,work,mod,alea,(i,),
+                                                     kw,write)
+            elif workers<=1:
+                self._evolve_seeded(meth,seq,mod,alea,(),kw,1,keep,write)
+            else:
+                if alea==None:
+                    alea=rng.Rng()
+                self.__evolve_pool(meth,seq,mod,alea,kw,workers,keep,
+                                   write,form)
+        finally:
+            if f!=None:
+                f.close()
+        if total!=None:
+            self.__add_stats(total)
+
+    def __add_stats(self,total):
+        "Add the Stats of all the branches of the sub-tree to $1."
+        if self.__stats!=None:
+            total+=self.__stats
+        for c in self.__children:
+            c.__add_stats(total)
+
+    def __evolve_pool(self,meth,seq,mod,alea,kw,workers,keep,write,form):
+        """Evolve sequence $2 along the sub-tree as __evolve does,
+        with $6 processes evolving independent sub-trees.
         """
 
-        self.__seq=seq.copy()
+        # evolve the upper branches until there are enough
+        # independent sub-trees
+        wait=[[self,seq,()]]
+        upper=[]
+        while 0<len(wait)<workers:
+            n,s,p=wait.pop(0)
+            n._evolve_seeded(meth,s,mod,alea,p,kw,0)
+            upper.append([n,p])
+            for i in range(len(n.__children)):
+                wait.append([n.__children[i],n.__seq,p+(i,)])
+
+        # the parts of the tree, in the order of their leaves
+        parts=[[p,n,None] for n,p in upper if n.__children==[]]
+        store=seq.store()
+        tasks=[]
+        for n,s,p in wait:
+            parts.append([p,n,s])
+        parts.sort(key=lambda x: x[0])
+        for p,n,s in parts:
+            if s!=None:
+                tasks.append((n._struct(),s.seq(),store,meth,mod,alea,p,kw,
+                              keep,form))
+        for n,p in upper:
+            if not n._keeps(keep) and n.__children!=[]:
+                n.__seq=None
+        del wait
+
+        if tasks!=[]:
+            pool=multiprocessing.Pool(workers)
+            res=pool.imap(_evolve_subtree,tasks)
+        else:
+            pool=None
+        try:
+            for p,n,s in parts:
+                if s==None:
+                    if write!=None:
+                        write(n.__seq)
+                    if not n._keeps(keep):
+                        n.__seq=None
+                    continue
+                seqs,text=res.next()
+                for q,x,y,z in seqs:
+                    m=n
+                    for j in q:
+                        m=m.__children[j]
+                    m.__log=y
+                    m.__stats=z
+                    if x==None:
+                        m.__seq=None
+                        m.__delta=None
+                    elif isinstance(x,delta.Delta):
+                        m.__seq=None
+                        m.__delta=x
+                    else:
+                        m.__seq=evol.EvolSequence(store=store)
+                        m.__seq.read_str(x)
+                        m.__seq.g_name(m.__lab)
+                        m.__delta=None
+                if write!=None:
+                    write(text)
+        finally:
+            if pool!=None:
+                pool.close()
+                pool.join()
+
+    def _keeps(self,keep):
+        """Return True if the sequence of the Node is kept, according
+        to argument [keep] of evolve_seq."""
+        if keep=="all" or keep==None:
+            return True
+        if keep=="leaves":
+            return self.__children==[]
+        if keep=="none":
+            return False
+        return self.__lab in keep
+
+    def _evolve_seeded(self,meth,seq,mod,alea,path,kw,rec,keep="all",
+                       write=None,own=0):
+        """Evolve sequence $2 along the branch of the Node, with the
+        substream of Rng $4 at path $5 (the tuple of the numbers of
+        the children from the first evolved Node), and along the
+        sub-tree if $7 is true.
+
+        Without Rng, the sequence evolves with the keyword arguments
+        $6 only. Arguments 'keep' and 'write' are those of
+        evolve_seq; $2 is evolved without copy if 'own' is true.
+        """
+
+        if own:
+            self.__seq=seq
+        else:
+            self.__seq=seq.copy()
         self.__seq.g_name(self.__lab)
-	self.__seq.evolve_seg(dmod,self.__l, **kw)
-        
-	for c in self.__children:
-            c.evolve_seg_seq(self.__seq,dmod, **kw)
+        self.__delta=None
+        bkw=self.__branch_kw(kw)
+        if alea==None:
+            getattr(self.__seq,meth)(mod,self.__l,**bkw)
+        else:
+            getattr(self.__seq,meth)(mod,self.__l,rng=alea.substream(*path),
+                                     **bkw)
+        if not rec:
+            return
+        s=self.__seq
+        if self.__children==[] and write!=None:
+            write(s)
+        kept=self._keeps(keep)
+        if not kept:
+            self.__seq=None
+        n=len(self.__children)
+        for i in range(n):
+            self.__children[i]._evolve_seeded(meth,s,mod,alea,path+(i,),kw,1,
+                                              keep,write,
+                                              i==n-1 and not kept)
+
+    def __branch_kw(self,kw):
+        """Return the keyword arguments $1 of evolve_seq for the
+        evolution of the edge to the father, with a new EventLog if
+        argument [log] is true, and new Stats if argument [stats] is
+        given."""
+        kw=kw.copy()
+        if kw.get("log"):
+            self.__log=eventlog.EventLog()
+            kw["log"]=self.__log
+        else:
+            self.__log=None
+            if kw.has_key("log"):
+                del kw["log"]
+        if kw.get("stats")!=None:
+            self.__stats=stats.Stats()
+            kw["stats"]=self.__stats
+        else:
+            self.__stats=None
+        return kw
+
+    def _evolve_delta(self,meth,work,mod,alea,path,kw,write):
+        """Evolve sequence $2, which is the sequence of the father,
+        along the sub-tree as _evolve_seeded does, keeping on each
+        Node the Delta of its branch; $2 is given back unchanged.
+        """
+
+        work.g_name(self.__lab)
+        work.start_journal()
+        bkw=self.__branch_kw(kw)
+        if alea==None:
+            getattr(work,meth)(mod,self.__l,**bkw)
+        else:
+            getattr(work,meth)(mod,self.__l,rng=alea.substream(*path),**bkw)
+        self.__delta=work.end_journal()
+        self.__seq=None
+        if self.__children==[] and write!=None:
+            write(work)
+        for i in range(len(self.__children)):
+            self.__children[i]._evolve_delta(meth,work,mod,alea,path+(i,),
+                                             kw,write)
+        self.__delta.undo(work)
+
+    def _struct(self):
+        """Return the sub-tree as nested tuples (label, length,
+        bootstrap, children), without the sequences."""
+        return (self.__lab,self.__l,self.__boot,
+                tuple([c._struct() for c in self.__children]))
+
+    def _read_struct(self,st):
+        """Build the sub-tree from nested tuples given by _struct()."""
+        self.__lab,self.__l,self.__boot,ch=st
+        self.__children=[]
+        for c in ch:
+            n=Node()
+            n.__father=self
+            n._read_struct(c)
+            self.__children.append(n)
+
+    def _sequences(self,path=()):
+        """Return the list of [path, sequence string or Delta or None,
+        EventLog or None, Stats or None] of all the Nodes of the
+        sub-tree."""
+        if self.__delta!=None:
+            l=[[path,self.__delta,self.__log,self.__stats]]
+        elif self.__seq==None:
+            l=[[path,None,self.__log,self.__stats]]
+        else:
+            l=[[path,self.__seq.seq(),self.__log,self.__stats]]
+        for i in range(len(self.__children)):
+            l+=self.__children[i]._sequences(path+(i,))
+        return l
             
 #####################################
 #################### parsing methods:
@@ -586,3 +916,39 @@ root.
 	else:
 	    raise ValueError, "This should not have happened! Check behind your back."
         
+
+
+#######################################################################
+#######################################################################
+########  miscellaneous functions
+
+def _evolve_subtree(task):
+    """Evolve a sub-tree in a worker process, and return [list of
+    [path, sequence string or Delta or None, EventLog or None, Stats
+    or None] of its Nodes, text of its leaves]."""
+    st,s,store,meth,mod,alea,path,kw,keep,form=task
+    n=Node()
+    n._read_struct(st)
+    seq=evol.EvolSequence(store=store)
+    seq.read_str(s)
+    text=[]
+    if form!=None:
+        write=lambda x: text.append(_leaf_text(x,form))
+    else:
+        write=None
+    if keep==None:
+        n._evolve_delta(meth,seq,mod,alea,path,kw,write)
+    else:
+        n._evolve_seeded(meth,seq,mod,alea,path,kw,1,keep,write,1)
+    return [n._sequences(),"".join(text)]
+
+def _leaf_text(s,form):
+    """Return leaf sequence $1 in format $2, 'fasta' or 'phylip'
+    (one line of sequential format), or $1 if it is already a
+    string."""
+    if isinstance(s,str):
+        return s
+    if form=="fasta":
+        return s.fasta()
+    name=string.join(str(s.name()).split(),'_')[:10]
+    return name+' '*(10-len(name))+s.seq()+'\n'